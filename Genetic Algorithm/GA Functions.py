@@ -1,18 +1,28 @@
 import random
 import argparse
 import os
+import socket
 import sys
 import time
 from datetime import datetime
 import numpy as np
 from kesslergame import GraphicsType, KesslerGame, Scenario, TrainerEnvironment
 import multiprocessing
+import queue
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import matplotlib.pyplot as plt
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from TeamTempNameSubmission.fuzzy_controller import FuzzyController
+from TeamTempNameSubmission.chromosome import CHROMOSOME_LENGTH
+from TeamTempNameSubmission.fuzzy_controller import controller_factory
 from scenarios import scenarios
+from training.checkpoint import load_checkpoint, save_checkpoint
+from training.fitness_cache import FitnessCache, dedupe
+from training.ga_operators import breed_population
+from training.islands import (clear_island, new_run_id, read_best, read_immigrants,
+                              ring_source, write_best, write_emigrants)
+from training.surrogate import KNNSurrogate, prediction_report
 from utils import LoggerUtility, LoggingLevel
 
 # Set up the logger
@@ -42,7 +52,7 @@ game_settings = {
 # ----------------------------
 # 1. Hyperparameters
 # ----------------------------
-CHROMOSOME_SIZE     = 68      # Number of genes per individual
+CHROMOSOME_SIZE     = CHROMOSOME_LENGTH  # Number of genes per individual
 POPULATION_SIZE     = 20      # How many individuals in each generation
 MAX_GENERATIONS     = 3000      # Maximum number of GA iterations
 MUTATION_RATE_BASE  = 0.5     # Starting mutation probability per gene
@@ -51,6 +61,18 @@ CROSSOVER_INCREASE  = 0.9     # Final (max) crossover probability
 TOURNAMENT_K        = 3       # Tournament size for parent selection
 POOL_PROCESSES      = 8       # Number of worker processes for fitness eval
 STOP_HOURS = 2  # maximum hours to run the GA
+FITNESS_CACHE_PATH  = "fitness_cache.sqlite"  # On-disk fitness memo (None to disable)
+RACING_QUANTILE     = 0.5     # Race against this quantile of last generation (None to disable)
+RACING_MARGIN       = 50      # Bound a scenario by best-seen + margin (None: strict bound only)
+CHECKPOINT_EVERY    = 1       # Generations between checkpoints
+ISLANDS             = 4       # Island populations in --mode island
+ISLAND_WORKERS      = 2       # Worker processes per island
+MIGRATION_INTERVAL  = 10      # Generations between migrations
+MIGRANTS            = 2       # Best individuals sent to the next island
+SURROGATE_KAPPA     = 1.0     # Simulate if mean + kappa·std reaches the cutoff (None to disable)
+SURROGATE_K         = 5       # Neighbours per surrogate prediction
+SURROGATE_MIN_SAMPLES = 2 * POPULATION_SIZE  # Exact results before screening starts
+BATCHED_OPERATORS   = True    # Breed the (P, genes) population with array ops (False: per individual)
 
 # ----------------------------
 # 2. Prepare simulators once
@@ -61,6 +83,9 @@ games = {
     name: TrainerEnvironment(settings=game_settings)
     for name in scenario_names
 }
+# Highest possible contribution per scenario: every asteroid and all of its
+# children hit, no deaths
+scenario_bounds = {name: scenarios[name].max_asteroids for name in scenario_names}
 
 # ----------------------------
 # 3. Helper functions
@@ -85,20 +110,258 @@ def fitness_function(chromosome):
     rebuilding parsers or environments on every call, which greatly
     reduced per-evaluation overhead.
     
+    Each scenario gets a fresh controller built from `chromosome`, so
+    every individual is simulated with its own fuzzy systems.
+
     Returns the sum over scenarios of (asteroids_hit − 10·deaths³).
     """
     total = 0.0
     for name in scenario_names:
-        score, _ = games[name].run(
-            chromosome,
-            scenario=scenarios[name],
-            controllers=[FuzzyController()]
-        )
-        team = score.teams[0]
-        total += team.asteroids_hit - 10 * (team.deaths**2)
+        total += scenario_fitness(chromosome, name)
     return total
 
 
+def scenario_fitness(chromosome, name):
+    """
+    Fitness contribution of one scenario: asteroids_hit − 10·deaths².
+    """
+    score, _ = games[name].run(
+        scenario=scenarios[name],
+        controllers=[controller_factory(chromosome)()]
+    )
+    team = score.teams[0]
+    return team.asteroids_hit - 10 * (team.deaths**2)
+
+
+def timed_scenario_task(task):
+    """
+    Worker entry point for one (index, chromosome, scenario) task.
+
+    Returns (index, scenario, fitness contribution, seconds simulated).
+    """
+    index, chromosome, name = task
+    start = time.perf_counter()
+    fitness = scenario_fitness(chromosome, name)
+    return index, name, fitness, time.perf_counter() - start
+
+
+# Smoothed seconds per scenario simulation, learned from earlier tasks
+scenario_durations = {}
+DURATION_SMOOTHING = 0.2
+# Running (count, mean, M2, best) of each scenario's fitness contributions
+scenario_stats = {}
+
+
+def record_task(name, fitness, seconds):
+    """Fold one finished scenario task into the duration and spread estimates."""
+    prev = scenario_durations.get(name)
+    scenario_durations[name] = (seconds if prev is None
+                                else prev + DURATION_SMOOTHING * (seconds - prev))
+    n, mean, m2, best = scenario_stats.get(name, (0, 0.0, 0.0, -np.inf))
+    n += 1
+    delta = fitness - mean
+    mean += delta / n
+    scenario_stats[name] = (n, mean, m2 + delta * (fitness - mean), max(best, fitness))
+
+
+def racing_bound(name):
+    """
+    Upper bound used when racing on one scenario.
+
+    The strict bound (`scenario_bounds`) assumes every asteroid is hit,
+    which no controller comes close to on the larger scenarios, so by
+    default it is tightened to the best contribution seen so far plus
+    RACING_MARGIN. That makes racing a heuristic: an individual would be
+    cut wrongly only if it beat the best-seen score by more than the margin.
+    """
+    strict = scenario_bounds[name]
+    if RACING_MARGIN is None or name not in scenario_stats:
+        return strict
+    return min(strict, scenario_stats[name][3] + RACING_MARGIN)
+
+
+def racing_order():
+    """
+    Scenarios by decreasing variance of their observed contributions.
+
+    The scenario that separates individuals most is raced first, so
+    hopeless ones are exposed as early as possible. Scenarios with fewer
+    than two observations come first.
+    """
+    def variance(name):
+        n, _, m2, _ = scenario_stats.get(name, (0, 0.0, 0.0, -np.inf))
+        return m2 / (n - 1) if n > 1 else np.inf
+    return sorted(scenario_names, key=lambda name: -variance(name))
+
+
+def schedule_tasks(individuals):
+    """
+    Split individuals into (index, chromosome, scenario) tasks, longest first.
+
+    Longest-processing-time-first ordering keeps a long scenario from
+    starting last and holding up the end of the generation. Scenarios
+    that have not been timed yet are scheduled first.
+    """
+    tasks = [(i, ind, name)
+             for i, ind in enumerate(individuals)
+             for name in scenario_names]
+    tasks.sort(key=lambda t: -scenario_durations.get(t[2], np.inf))
+    return tasks
+
+
+def evaluate_individuals(pool, individuals, workers=POOL_PROCESSES):
+    """
+    Fitness of each individual, dispatching every scenario as its own task.
+
+    Results are reduced per individual as they arrive, observed durations
+    update `scenario_durations`, and worker utilisation for the batch
+    (simulated seconds over wall time × `workers`) is printed.
+    """
+    totals = [0.0] * len(individuals)
+    if not individuals:
+        return totals
+    busy = 0.0
+    start = time.perf_counter()
+    for index, name, fitness, seconds in pool.imap_unordered(
+            timed_scenario_task, schedule_tasks(individuals), chunksize=1):
+        totals[index] += fitness
+        busy += seconds
+        record_task(name, fitness, seconds)
+    wall = time.perf_counter() - start
+    print(f"Evaluated {len(individuals)} individuals in {wall:.2f} s, "
+          f"worker utilisation {busy / (wall * workers):.1%}")
+    return totals
+
+
+def timed_fitness(chromosome):
+    """Fitness of one chromosome plus the seconds spent simulating it."""
+    start = time.perf_counter()
+    return fitness_function(chromosome), time.perf_counter() - start
+
+
+def race_individuals(pool, individuals, cutoff):
+    """
+    Fitness of each individual, abandoning those that cannot reach `cutoff`.
+
+    Every individual runs the scenarios in `racing_order()`, one task at a
+    time, and different individuals interleave freely in the pool. After
+    each scenario its partial sum plus the best possible score on the
+    remaining scenarios (`racing_bound`) is an upper bound on its
+    fitness; once that bound drops below `cutoff`, the remaining scenarios
+    are skipped and the bound is reported as its (optimistic) fitness.
+
+    Returns the fitness list and, per individual, whether it is exact.
+    """
+    order = racing_order()
+    remaining_bound = [sum(racing_bound(name) for name in order[s:])
+                       for s in range(len(order) + 1)]
+    totals = [0.0] * len(individuals)
+    stage = [0] * len(individuals)
+    exact = [True] * len(individuals)
+    finished = queue.SimpleQueue()
+
+    def submit(index):
+        pool.apply_async(timed_scenario_task,
+                         ((index, individuals[index], order[stage[index]]),),
+                         callback=finished.put, error_callback=finished.put)
+
+    for index in range(len(individuals)):
+        submit(index)
+    outstanding = len(individuals)
+    skipped_runs, skipped_seconds = 0, 0.0
+    while outstanding:
+        result = finished.get()
+        if isinstance(result, BaseException):
+            raise result
+        outstanding -= 1
+        index, name, fitness, seconds = result
+        totals[index] += fitness
+        record_task(name, fitness, seconds)
+
+        stage[index] += 1
+        left = order[stage[index]:]
+        if not left:
+            continue
+        if totals[index] + remaining_bound[stage[index]] < cutoff:
+            totals[index] += remaining_bound[stage[index]]
+            exact[index] = False
+            skipped_runs += len(left)
+            skipped_seconds += sum(scenario_durations.get(n, 0.0) for n in left)
+        else:
+            submit(index)
+            outstanding += 1
+
+    print(f"Racing (cutoff {cutoff:.1f}, order {order}): stopped "
+          f"{exact.count(False)}/{len(individuals)} individuals early, skipped "
+          f"{skipped_runs} simulations (~{skipped_seconds:.1f} s of worker time)")
+    return totals, exact
+
+
+def evaluate_population(pool, population, cache=None, cutoff=-np.inf,
+                        workers=POOL_PROCESSES, surrogate=None):
+    """
+    Score a population, simulating each distinct uncached chromosome once.
+
+    Identical chromosomes (common with 0.1-step genes and the re-submitted
+    elite) are collapsed before dispatch, and results already in `cache`
+    from this or an earlier run are reused. With a `surrogate` that has
+    seen SURROGATE_MIN_SAMPLES results and a finite `cutoff`, individuals
+    whose optimistic prediction (mean + SURROGATE_KAPPA·std) is below
+    `cutoff` are not simulated and get their predicted fitness instead.
+    With a finite `cutoff` the rest are raced (see `race_individuals`).
+    Exact new results are written back to the cache; they and the cache
+    hits train the surrogate.
+
+    Returns the fitness list in population order and the number of
+    individuals actually dispatched.
+    """
+    if cache is None:
+        keys = [str(i) for i in range(len(population))]
+        known = {}
+    else:
+        keys = [cache.key(ind) for ind in population]
+        known = cache.get_many(keys)
+    first = dedupe(keys)
+    pending = [k for k in first if k not in known]
+    if surrogate is not None:
+        surrogate.add([population[first[k]] for k in known], list(known.values()))
+
+    predicted = {}
+    if (surrogate is not None and len(surrogate) >= SURROGATE_MIN_SAMPLES
+            and np.isfinite(cutoff) and pending):
+        mean, std = surrogate.predict([population[first[k]] for k in pending])
+        promising = []
+        for k, m, sd in zip(pending, mean, std):
+            if m + SURROGATE_KAPPA * sd < cutoff:
+                known[k] = float(m)
+            else:
+                promising.append(k)
+                predicted[k] = float(m)
+        print(f"Surrogate screened out {len(pending) - len(promising)}/{len(pending)} "
+              f"individuals (saved {(len(pending) - len(promising)) * len(scenario_names)} "
+              f"simulations)")
+        pending = promising
+    individuals = [population[first[k]] for k in pending]
+
+    if np.isfinite(cutoff):
+        results, exact = race_individuals(pool, individuals, cutoff)
+    else:
+        results = evaluate_individuals(pool, individuals, workers)
+        exact = [True] * len(individuals)
+    if cache is not None:
+        cache.put_many((k, f) for k, f, e in zip(pending, results, exact) if e)
+    if surrogate is not None:
+        scored = [(k, f) for k, f, e in zip(pending, results, exact) if e]
+        checked = [(predicted[k], f) for k, f in scored if k in predicted]
+        if checked:
+            report = prediction_report(*zip(*checked))
+            print(f"Surrogate accuracy on {report['n']} simulated: "
+                  f"MAE {report['mae']:.1f}, rank correlation {report['rank_corr']:.2f}")
+        surrogate.add([population[first[k]] for k, _ in scored], [f for _, f in scored])
+    known.update(zip(pending, results))
+    return [known[k] for k in keys], len(pending)
+
+
 def tournament_selection(population, fitnesses, k):
     """
     Select one parent via tournament selection.
@@ -155,29 +418,120 @@ def mutate(parent: np.ndarray, rate: float, distance: float) -> np.ndarray:
     mutated = parent + noise
     return np.where(mask, mutated, parent)
 
+def generation_rates(generation, fitness_age, verbose=True):
+    """
+    Mutation and crossover rates for one generation.
+
+    Mutation decays linearly over MAX_GENERATIONS and crossover ramps up
+    over the first 300 generations; after 20 generations without
+    improvement the mutation rate is boosted to escape stagnation
+    (announced unless `verbose` is False).
+    """
+    mutation_rate = MUTATION_RATE_BASE * (1 - generation / MAX_GENERATIONS)
+    crossover_rate = (CROSSOVER_RATE_BASE +
+                      (CROSSOVER_INCREASE - CROSSOVER_RATE_BASE) *
+                      (generation / 300))
+    crossover_rate = min(crossover_rate, CROSSOVER_INCREASE)
+
+    if fitness_age >= 20:
+        boosted = MUTATION_RATE_BASE + (1 - MUTATION_RATE_BASE) * (fitness_age / 100)
+        mutation_rate = min(boosted, 0.7)
+        if verbose:
+            print(f"Boosted mutation rate to {mutation_rate:.4f}")
+    return mutation_rate, crossover_rate
+
+
+def mutation_distance(generation):
+    """Maximum per-gene mutation shift for one generation."""
+    return (1 - generation) / MAX_GENERATIONS
+
+
+def breed_generation(population, fitnesses, mutation_rate, crossover_rate, distance):
+    """
+    Next generation: the current best (elitism) plus tournament-selected,
+    crossed-over and mutated children, up to the same population size.
+
+    With BATCHED_OPERATORS the population is a (P, CHROMOSOME_SIZE) array
+    and the whole generation is bred with array operations (see
+    `training.ga_operators.breed_population`); otherwise individuals are
+    bred one at a time.
+    """
+    if BATCHED_OPERATORS:
+        return breed_population(np.asarray(population), np.asarray(fitnesses),
+                                mutation_rate, crossover_rate, distance, TOURNAMENT_K)
+    best = population[fitnesses.index(max(fitnesses))]
+    new_population = [best.copy()]
+    while len(new_population) < len(population):
+        p1 = tournament_selection(population, fitnesses, TOURNAMENT_K)
+        p2 = tournament_selection(population, fitnesses, TOURNAMENT_K)
+        c1, c2 = crossover(p1, p2, crossover_rate)
+        new_population.append(mutate(c1, mutation_rate, distance))
+        if len(new_population) < len(population):
+            new_population.append(mutate(c2, mutation_rate, distance))
+    return new_population
+
+
 # ----------------------------
 # 4. Main GA loop
 # ----------------------------
-def genetic_algorithm():
+def genetic_algorithm(checkpoint_path=None, resume_path=None):
     """
     Runs the GA with dynamic rates, elitism, stagnation boost,
     parallel fitness evaluation, and a time-based stop criterion.
-    """
-    # 1) Initialize population
-    population = [create_random_individual(CHROMOSOME_SIZE)
-                  for _ in range(POPULATION_SIZE)]
-    best_solution_ever = None
-    best_fitness_ever = -np.inf
-    last_fitness = None
-    fitness_age = 0
-    fitness_tracker = []
 
-    # 2) Keep track of start time
-    ga_start_time = time.perf_counter()
+    With `checkpoint_path`, the complete loop state (population, last
+    fitnesses, best-ever, generation counter, adaptive-rate, racing and surrogate
+    state, elapsed time and both RNG states) is saved atomically every
+    CHECKPOINT_EVERY generations. `resume_path` restores such a file and
+    continues with the next generation, drawing the same random numbers
+    the interrupted run would have drawn.
+    """
+    if resume_path is not None:
+        # 1) Restore population and loop state from a checkpoint
+        state = load_checkpoint(resume_path)
+        population = np.asarray(state["population"])
+        if population.shape[-1] != CHROMOSOME_SIZE:
+            raise ValueError(f"{resume_path} holds {population.shape[-1]}-gene individuals, "
+                             f"the controller expects {CHROMOSOME_SIZE}")
+        fitnesses = state["fitnesses"]
+        best_solution_ever = state["best_solution_ever"]
+        best_fitness_ever = state["best_fitness_ever"]
+        last_fitness = state["last_fitness"]
+        fitness_age = state["fitness_age"]
+        fitness_tracker = state["fitness_tracker"]
+        cutoff = state["cutoff"]
+        # Checkpoints from before the surrogate existed start a fresh one
+        surrogate = state.get("surrogate")
+        if surrogate is None and SURROGATE_KAPPA is not None:
+            surrogate = KNNSurrogate(SURROGATE_K)
+        scenario_durations.update(state["scenario_durations"])
+        scenario_stats.update(state["scenario_stats"])
+        start_generation = state["generation"] + 1
+        elapsed = state["elapsed_seconds"]
+        print(f"Resumed from {resume_path} at generation {start_generation}")
+    else:
+        # 1) Initialize population
+        population = np.array([create_random_individual(CHROMOSOME_SIZE)
+                               for _ in range(POPULATION_SIZE)])
+        fitnesses = []
+        best_solution_ever = None
+        best_fitness_ever = -np.inf
+        last_fitness = None
+        fitness_age = 0
+        fitness_tracker = []
+        cutoff = -np.inf  # No racing until a generation has been scored
+        surrogate = KNNSurrogate(SURROGATE_K) if SURROGATE_KAPPA is not None else None
+        start_generation = 0
+        elapsed = 0.0
+
+    # 2) Keep track of start time (time already spent counts toward STOP_HOURS)
+    ga_start_time = time.perf_counter() - elapsed
 
     # 3) Keep pool alive throughout all generations
     pool = multiprocessing.Pool(POOL_PROCESSES)
-    for generation in range(MAX_GENERATIONS):
+    cache = (FitnessCache(FITNESS_CACHE_PATH, scenario_names, game_settings)
+             if FITNESS_CACHE_PATH else None)
+    for generation in range(start_generation, MAX_GENERATIONS):
         # Check overall time limit
         elapsed_hours = (time.perf_counter() - ga_start_time) / 3600.0
         if elapsed_hours >= STOP_HOURS:
@@ -187,24 +541,16 @@ def genetic_algorithm():
         gen_start = time.perf_counter()
 
         # 4) Update dynamic rates
-        mutation_rate = MUTATION_RATE_BASE * (1 - generation / MAX_GENERATIONS)
-        crossover_rate = (CROSSOVER_RATE_BASE +
-                          (CROSSOVER_INCREASE - CROSSOVER_RATE_BASE) *
-                          (generation / 300))
-        
-        crossover_rate = min(crossover_rate, CROSSOVER_INCREASE)
-
-
-        if fitness_age >= 20:
-            boosted = MUTATION_RATE_BASE + (1 - MUTATION_RATE_BASE) * (fitness_age / 100)
-            mutation_rate = min(boosted, 0.7)
-            print(f"Boosted mutation rate to {mutation_rate:.4f}")
-        
+        mutation_rate, crossover_rate = generation_rates(generation, fitness_age)
         print(f"Mutation rate: {mutation_rate:.4f}, "
               f"Crossover rate: {crossover_rate:.4f}")
-    
-        # 5) Evaluate fitnesses in parallel
-        fitnesses = pool.map(fitness_function, population)
+
+        # 5) Evaluate fitnesses in parallel (duplicates and cached ones skipped)
+        fitnesses, simulated = evaluate_population(pool, population, cache, cutoff,
+                                                   surrogate=surrogate)
+        print(f"Simulated {simulated}/{len(population)} individuals")
+        if RACING_QUANTILE is not None:
+            cutoff = float(np.quantile(fitnesses, RACING_QUANTILE))
 
         # 6) Track best solution
         current_best_fit = max(fitnesses)
@@ -219,26 +565,16 @@ def genetic_algorithm():
 
         fitness_tracker.append(best_fitness_ever)
 
-        # 8) Elitism & stagnation boost
-        new_population = [current_best_ind.copy()]
+        # 8) Stagnation boost
         if current_best_fit == last_fitness:
             fitness_age += 1
         else:
             fitness_age = 0
 
-
-
-        # 9) Generate next population
-        distance = (1 - generation) / MAX_GENERATIONS
-        while len(new_population) < POPULATION_SIZE:
-            p1 = tournament_selection(population, fitnesses, TOURNAMENT_K)
-            p2 = tournament_selection(population, fitnesses, TOURNAMENT_K)
-            c1, c2 = crossover(p1, p2, crossover_rate)
-            new_population.append(mutate(c1, mutation_rate, distance))
-            if len(new_population) < POPULATION_SIZE:
-                new_population.append(mutate(c2, mutation_rate, distance))
-
-        population = new_population[:POPULATION_SIZE]
+        # 9) Generate next population (elite carried over)
+        distance = mutation_distance(generation)
+        population = breed_generation(population, fitnesses,
+                                      mutation_rate, crossover_rate, distance)
         last_fitness = current_best_fit
 
         print(f"Generation {generation} completed in "
@@ -247,20 +583,349 @@ def genetic_algorithm():
         print(f"Current best fitness: {best_fitness_ever:.6f}")
         print(f"Current best solution: {best_solution_ever}")
 
+        # 10) Checkpoint the state the next generation starts from
+        if checkpoint_path is not None and (generation + 1) % CHECKPOINT_EVERY == 0:
+            save_checkpoint(
+                checkpoint_path,
+                generation=generation,
+                population=population,
+                fitnesses=fitnesses,
+                best_solution_ever=best_solution_ever,
+                best_fitness_ever=best_fitness_ever,
+                last_fitness=last_fitness,
+                fitness_age=fitness_age,
+                fitness_tracker=fitness_tracker,
+                cutoff=cutoff,
+                surrogate=surrogate,
+                scenario_durations=scenario_durations,
+                scenario_stats=scenario_stats,
+                elapsed_seconds=time.perf_counter() - ga_start_time,
+            )
+
     pool.close()
     pool.join()
+    if cache is not None:
+        cache.close()
+
+    return best_solution_ever, best_fitness_ever, fitness_tracker
 
 
+# ----------------------------
+# 4b. Steady-state asynchronous GA
+# ----------------------------
+def steady_state_ga():
+    """
+    Runs the GA without a generation barrier.
+
+    Every worker always has an individual to simulate: as soon as one
+    evaluation finishes, the result replaces the worst member of the pool
+    (if it is better) and a new child is bred by tournament selection on
+    the pool as it stands and submitted. Rates and mutation distance come
+    from the same helpers as `genetic_algorithm`, driven by the number of
+    finished evaluations, where POPULATION_SIZE evaluations count as one
+    generation. Cached chromosomes
+    are resolved without being dispatched.
+    """
+    max_evaluations = MAX_GENERATIONS * POPULATION_SIZE
+    cache = (FitnessCache(FITNESS_CACHE_PATH, scenario_names, game_settings)
+             if FITNESS_CACHE_PATH else None)
+
+    pool_members, pool_fitnesses = [], []
+    best_solution_ever = None
+    best_fitness_ever = -np.inf
+    fitness_tracker = []
+    fitness_age = 0
+    last_best = None
+    evaluations = 0
+    busy_seconds = 0.0
+
+    def breed():
+        # Random individuals until the pool can support tournaments.
+        if len(pool_members) < 2:
+            return create_random_individual(CHROMOSOME_SIZE)
+        generation = evaluations // POPULATION_SIZE
+        mutation_rate, crossover_rate = generation_rates(generation, fitness_age, verbose=False)
+        distance = mutation_distance(generation)
+        p1 = tournament_selection(pool_members, pool_fitnesses, TOURNAMENT_K)
+        p2 = tournament_selection(pool_members, pool_fitnesses, TOURNAMENT_K)
+        child, _ = crossover(p1, p2, crossover_rate)
+        return mutate(child, mutation_rate, distance)
+
+    def absorb(chromosome, fitness):
+        # Steady-state replacement: fill the pool, then replace the worst.
+        nonlocal best_solution_ever, best_fitness_ever, evaluations, fitness_age, last_best
+        evaluations += 1
+        if len(pool_members) < POPULATION_SIZE:
+            pool_members.append(chromosome)
+            pool_fitnesses.append(fitness)
+        else:
+            worst = int(np.argmin(pool_fitnesses))
+            if fitness > pool_fitnesses[worst]:
+                pool_members[worst] = chromosome
+                pool_fitnesses[worst] = fitness
+        if fitness > best_fitness_ever:
+            best_fitness_ever = fitness
+            best_solution_ever = chromosome.copy()
+
+        # Per generation-equivalent bookkeeping, as in the generational GA.
+        if evaluations % POPULATION_SIZE == 0:
+            fitness_tracker.append(best_fitness_ever)
+            fitness_age = fitness_age + 1 if best_fitness_ever == last_best else 0
+            last_best = best_fitness_ever
+            print(f"Evaluations {evaluations}, Best Fitness so far: {best_fitness_ever:.6f}, "
+                  f"Pool mean: {np.mean(pool_fitnesses):.2f}")
+
+    ga_start_time = time.perf_counter()
+    in_flight = {}
+    submitted = 0
+    with ProcessPoolExecutor(POOL_PROCESSES) as executor:
+        while True:
+            out_of_time = (time.perf_counter() - ga_start_time) / 3600.0 >= STOP_HOURS
+            # Keep every worker busy; resolve cache hits on the spot.
+            while (not out_of_time and submitted < max_evaluations
+                   and len(in_flight) < POOL_PROCESSES):
+                child = breed()
+                submitted += 1
+                key = cache.key(child) if cache is not None else None
+                cached = cache.get_many([key]).get(key) if cache is not None else None
+                if cached is not None:
+                    absorb(child, cached)
+                else:
+                    in_flight[executor.submit(timed_fitness, child)] = (child, key)
+
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            finished = []
+            for future in done:
+                child, key = in_flight.pop(future)
+                fitness, seconds = future.result()
+                busy_seconds += seconds
+                absorb(child, fitness)
+                finished.append((key, fitness))
+            if cache is not None:
+                cache.put_many(finished)
+
+    wall = time.perf_counter() - ga_start_time
+    print(f"Reached {evaluations} evaluations in {wall:.1f} s; "
+          f"worker utilisation {busy_seconds / (wall * POOL_PROCESSES):.1%}")
+    if cache is not None:
+        cache.close()
+
     return best_solution_ever, best_fitness_ever, fitness_tracker
 
 
+# ----------------------------
+# 4c. Island model
+# ----------------------------
+def host_cache_path(path):
+    """
+    Per-host variant of a fitness cache path (`cache.sqlite` ->
+    `cache.<hostname>.sqlite`), so islands on different machines sharing a
+    working directory never open the same SQLite file. Keep it on a local
+    disk: WAL mode needs all its users on one host.
+    """
+    root, ext = os.path.splitext(path)
+    return f"{root}.{socket.gethostname()}{ext}"
+
+
+def island_ga(island_id, n_islands, migration_dir, run_id, workers=ISLAND_WORKERS):
+    """
+    Runs one island of a ring-connected island-model GA.
+
+    Each island is an ordinary generational GA (same rates, elitism and
+    racing) with its own seed, worker pool and population. Every
+    MIGRATION_INTERVAL generations it publishes its MIGRANTS best
+    individuals to `migration_dir` and replaces its worst individuals with
+    the newest batch from the previous island on the ring, if one has
+    appeared since the last migration. Migration never waits, so islands
+    on different machines can run at different speeds. Islands on the same
+    host share one on-disk fitness cache (see `host_cache_path`); hosts
+    never share one, because SQLite's WAL mode is not safe on network
+    filesystems. Per-generation statistics go to `island_<run>_<id>.csv`
+    and the best-ever individual to `best_<run>_<id>.npz`. Every file is
+    named after `run_id`, so files left in `migration_dir` by other runs
+    are never imported; files this island left under the same run ID are
+    deleted at startup.
+    """
+    seed = (int.from_bytes(os.urandom(4), "little") + island_id) % 2**32
+    random.seed(seed)
+    np.random.seed(seed)
+    print(f"Island {island_id}/{n_islands}: seed {seed}, {workers} workers")
+
+    source = ring_source(island_id, n_islands)
+    clear_island(migration_dir, run_id, island_id)
+    last_immigration = -1
+    population = np.array([create_random_individual(CHROMOSOME_SIZE)
+                           for _ in range(POPULATION_SIZE)])
+    best_solution_ever = None
+    best_fitness_ever = -np.inf
+    last_fitness = None
+    fitness_age = 0
+    fitness_tracker = []
+    cutoff = -np.inf
+    surrogate = KNNSurrogate(SURROGATE_K) if SURROGATE_KAPPA is not None else None
+
+    log_path = os.path.join(migration_dir, f"island_{run_id}_{island_id}.csv")
+    with open(log_path, "w") as log:
+        log.write("generation,best,mean,immigrants,seconds\n")
+
+    ga_start_time = time.perf_counter()
+    pool = multiprocessing.Pool(workers)
+    cache = (FitnessCache(host_cache_path(FITNESS_CACHE_PATH), scenario_names, game_settings)
+             if FITNESS_CACHE_PATH else None)
+    for generation in range(MAX_GENERATIONS):
+        if (time.perf_counter() - ga_start_time) / 3600.0 >= STOP_HOURS:
+            print(f"Island {island_id}: reached time limit at generation {generation}.")
+            break
+        gen_start = time.perf_counter()
+
+        mutation_rate, crossover_rate = generation_rates(generation, fitness_age)
+        fitnesses, _ = evaluate_population(pool, population, cache, cutoff, workers,
+                                           surrogate)
+        if RACING_QUANTILE is not None:
+            cutoff = float(np.quantile(fitnesses, RACING_QUANTILE))
+
+        current_best_fit = max(fitnesses)
+        if current_best_fit > best_fitness_ever:
+            best_fitness_ever = current_best_fit
+            best_solution_ever = population[fitnesses.index(current_best_fit)].copy()
+        fitness_tracker.append(best_fitness_ever)
+
+        # Migrate: send our best, then take the newest batch from upstream
+        immigrants = 0
+        if (generation + 1) % MIGRATION_INTERVAL == 0:
+            ranked = np.argsort(fitnesses)
+            top = ranked[::-1][:MIGRANTS]
+            write_emigrants(migration_dir, run_id, island_id, generation,
+                            [population[i] for i in top],
+                            [fitnesses[i] for i in top])
+            write_best(migration_dir, run_id, island_id, best_solution_ever,
+                       best_fitness_ever, fitness_tracker)
+            batch = read_immigrants(migration_dir, run_id, source, last_immigration)
+            if batch is not None:
+                last_immigration, chromosomes, immigrant_fits = batch
+                for i, chrom, fit in zip(ranked, chromosomes, immigrant_fits):
+                    population[i] = chrom
+                    fitnesses[i] = fit
+                immigrants = len(chromosomes)
+
+        print(f"Island {island_id} generation {generation}: best {current_best_fit:.1f}, "
+              f"best so far {best_fitness_ever:.1f}, immigrants {immigrants}")
+
+        if current_best_fit == last_fitness:
+            fitness_age += 1
+        else:
+            fitness_age = 0
+
+        distance = mutation_distance(generation)
+        population = breed_generation(population, fitnesses,
+                                      mutation_rate, crossover_rate, distance)
+        last_fitness = current_best_fit
+
+        with open(log_path, "a") as log:
+            log.write(f"{generation},{current_best_fit},{np.mean(fitnesses)},"
+                      f"{immigrants},{time.perf_counter() - gen_start:.3f}\n")
+
+    pool.close()
+    pool.join()
+    if cache is not None:
+        cache.close()
+    if best_solution_ever is not None:
+        write_best(migration_dir, run_id, island_id, best_solution_ever,
+                   best_fitness_ever, fitness_tracker)
+
+    return best_solution_ever, best_fitness_ever, fitness_tracker
+
+
+def run_islands(n_islands, migration_dir, run_id=None, workers=ISLAND_WORKERS):
+    """
+    Runs all islands on this machine, one process each, and returns the
+    best island's result. Without a `run_id` a fresh one is generated, so
+    only this run's files are read back.
+    """
+    run_id = run_id or new_run_id()
+    print(f"Island run {run_id} in {migration_dir}")
+    processes = [
+        multiprocessing.Process(target=island_ga,
+                                args=(i, n_islands, migration_dir, run_id, workers))
+        for i in range(n_islands)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    results = []
+    for i in range(n_islands):
+        result = read_best(migration_dir, run_id, i)
+        if result is None:
+            print(f"Island {i}: no result")
+            continue
+        print(f"Island {i}: best fitness {result[1]:.6f}")
+        results.append(result)
+    if not results:
+        failed = [p.exitcode for p in processes]
+        raise RuntimeError(f"No island of run {run_id} wrote a result to {migration_dir} "
+                           f"(island exit codes: {failed})")
+    return max(results, key=lambda r: r[1])
+
+
 # ----------------------------
 # 5. Run GA, plot, save, final demo
 # ----------------------------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kessler Game Scenario Runner")
+    parser.add_argument("--scenario", choices=scenarios.keys(),
+                        default="random_repeatable",
+                        help="Select a scenario")
+    parser.add_argument("--game_type",
+                        choices=["KesslerGame", "TrainerEnvironment"],
+                        default="KesslerGame",
+                        help="Visualization or fast sim")
+    parser.add_argument("--checkpoint",
+                        default="ga_checkpoint.pkl",
+                        help="Checkpoint file for the generational GA ('' to disable)")
+    parser.add_argument("--resume",
+                        default=None,
+                        help="Continue the generational GA from this checkpoint")
+    parser.add_argument("--mode",
+                        choices=["generational", "steady_state", "island"],
+                        default="generational",
+                        help="Generational GA, asynchronous steady-state GA, "
+                             "or ring-connected island model")
+    parser.add_argument("--islands", type=int, default=ISLANDS,
+                        help="Number of islands in --mode island")
+    parser.add_argument("--island_id", type=int, default=None,
+                        help="Run only this island (one per machine); "
+                             "by default all islands run locally")
+    parser.add_argument("--migration_dir", default="islands",
+                        help="Directory shared by the islands for migration "
+                             "(use a network filesystem across machines; the "
+                             "fitness cache stays per host)")
+    parser.add_argument("--run_id", default=None,
+                        help="ID naming this run's migration files; required "
+                             "with --island_id (the same on every machine), "
+                             "generated when all islands run locally")
+    args = parser.parse_args()
+    if args.island_id is not None and args.run_id is None:
+        parser.error("--island_id needs --run_id, shared by every island of the run")
+
     # Run the genetic algorithm
     t0 = time.perf_counter()
-    best_solution, best_fitness, fitness_tracker = genetic_algorithm()
+    if args.mode == "steady_state":
+        best_solution, best_fitness, fitness_tracker = steady_state_ga()
+    elif args.mode == "island":
+        os.makedirs(args.migration_dir, exist_ok=True)
+        if args.island_id is None:
+            best_solution, best_fitness, fitness_tracker = run_islands(
+                args.islands, args.migration_dir, args.run_id)
+        else:
+            best_solution, best_fitness, fitness_tracker = island_ga(
+                args.island_id, args.islands, args.migration_dir, args.run_id)
+    else:
+        best_solution, best_fitness, fitness_tracker = genetic_algorithm(
+            checkpoint_path=args.checkpoint or None, resume_path=args.resume)
     elapsed = time.perf_counter() - t0
 
     print(f"Best Solution: {best_solution}")
@@ -299,15 +964,6 @@ if __name__ == "__main__":
     input("Press Enter to continue...")
 
     # Final demonstration run with visualization
-    parser = argparse.ArgumentParser(description="Kessler Game Scenario Runner")
-    parser.add_argument("--scenario", choices=scenarios.keys(),
-                        default="random_repeatable",
-                        help="Select a scenario")
-    parser.add_argument("--game_type",
-                        choices=["KesslerGame", "TrainerEnvironment"],
-                        default="KesslerGame",
-                        help="Visualization or fast sim")
-    args = parser.parse_args()
     selected = scenarios[args.scenario]
     if args.game_type == "KesslerGame":
         game = KesslerGame(settings=game_settings)
@@ -316,7 +972,6 @@ if __name__ == "__main__":
 
     print(f"Running final scenario: {selected.name}")
     t1 = time.perf_counter()
-    score, perf_data = game.run(best_solution,
-                                scenario=selected,
-                                controllers=[FuzzyController()])
+    score, perf_data = game.run(scenario=selected,
+                                controllers=[controller_factory(best_solution)()])
     print(f"Final run completed in {time.perf_counter() - t1:.2f} seconds.")
\ No newline at end of file
@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from utils.types.kessler import BulletState
+
+
+def predict_doomed(
+    bullets: Sequence["BulletState"],
+    asteroid_positions: Sequence[Tuple[float, float]],
+    asteroid_velocities: Sequence[Tuple[float, float]],
+    asteroid_radii: Sequence[float],
+    map_size: Tuple[float, float],
+) -> np.ndarray:
+    """
+    Find the asteroids that a bullet already in flight is going to hit.
+
+    Every bullet is swept against every asteroid in one vectorized ray/circle
+    solve. Bullets fly straight and are culled at the map edge (they do not
+    wrap), so each ray is cut off where its bullet leaves the map. A bullet
+    is spent on the first asteroid it meets, so only that asteroid counts as
+    doomed.
+
+    Args:
+        bullets (Sequence[BulletState]): Bullets from `game_state["bullets"]`.
+        asteroid_positions (Sequence[Tuple[float, float]]): World positions of the asteroids.
+        asteroid_velocities (Sequence[Tuple[float, float]]): Velocities of the asteroids.
+        asteroid_radii (Sequence[float]): Radii of the asteroids.
+        map_size (Tuple[float, float]): The (width, height) dimensions of the game map.
+
+    Returns:
+        np.ndarray: Sorted, unique indices (into the asteroid sequences) of doomed asteroids.
+    """
+    if not bullets or len(asteroid_positions) == 0:
+        return np.empty(0, dtype=int)
+
+    map_x, map_y = map_size
+    b_pos = np.array([b["position"] for b in bullets], dtype=float)
+    b_vel = np.array([b["velocity"] for b in bullets], dtype=float)
+    a_pos = np.asarray(asteroid_positions, dtype=float)
+    a_vel = np.asarray(asteroid_velocities, dtype=float)
+    radii = np.asarray(asteroid_radii, dtype=float)
+
+    # Time until each bullet leaves the map.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tx = np.where(b_vel[:, 0] > 0.0, (map_x - b_pos[:, 0]) / b_vel[:, 0],
+                      np.where(b_vel[:, 0] < 0.0, -b_pos[:, 0] / b_vel[:, 0], np.inf))
+        ty = np.where(b_vel[:, 1] > 0.0, (map_y - b_pos[:, 1]) / b_vel[:, 1],
+                      np.where(b_vel[:, 1] < 0.0, -b_pos[:, 1] / b_vel[:, 1], np.inf))
+    t_exit = np.minimum(tx, ty)
+
+    # Asteroid relative to bullet: shape (bullets, asteroids).
+    px = a_pos[None, :, 0] - b_pos[:, None, 0]
+    py = a_pos[None, :, 1] - b_pos[:, None, 1]
+    vx = a_vel[None, :, 0] - b_vel[:, None, 0]
+    vy = a_vel[None, :, 1] - b_vel[:, None, 1]
+
+    # |p + v t| = r  ->  a t^2 + 2 b t + c = 0.
+    a = vx * vx + vy * vy
+    b = px * vx + py * vy
+    c = px * px + py * py - (radii * radii)[None, :]
+    disc = b * b - a * c
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_hit = (-b - np.sqrt(np.maximum(disc, 0.0))) / a
+    t_hit = np.where((disc >= 0.0) & (b < 0.0) & (a > 0.0), t_hit, np.inf)
+    t_hit = np.where(c <= 0.0, 0.0, t_hit)
+    t_hit = np.where(t_hit <= t_exit[:, None], t_hit, np.inf)
+
+    first = np.argmin(t_hit, axis=1)
+    hits = np.isfinite(t_hit[np.arange(len(first)), first])
+    return np.unique(first[hits])
@@ -0,0 +1,153 @@
+from typing import Callable, List, NamedTuple, Sequence
+
+import numpy as np
+
+from TeamTempNameSubmission import fuzzy_trees as ft
+
+# Genes per chromosome: two output scalars, then six two-input FIS with one
+# free triangle center per input (3 MFs each) and a 3 x 3 rule table, then
+# the weight of the forecast-impact evasion thrust.
+CHROMOSOME_LENGTH = 69
+
+# Best chromosome found by the GA so far; used when none is given.
+DEFAULT_CHROMOSOME = (
+    0.7109474609320601,
+    0.7609740700916316,
+    0.8,
+    0.3,
+    0.3717061466030136,
+    0.9563489000722659,
+    0.3987398409735582,
+    0.0,
+    0.22104530222719243,
+    0.4717704519369058,
+    0.9,
+    0.18773654259862715,
+    0.6474969600847753,
+    0.5354084622540757,
+    0.8140706896832727,
+    0.7,
+    0.38268600220069104,
+    0.7063770643073141,
+    0.26557552486399494,
+    0.31088819632944154,
+    0.3001507138382199,
+    0.014066650570101369,
+    0.5701122749556755,
+    0.09919668307060692,
+    0.4892249929424314,
+    0.3798114168134762,
+    0.221524079282726,
+    0.7,
+    0.8330280547072464,
+    0.0,
+    0.7727826183648449,
+    0.5777446510249947,
+    0.16730090886905546,
+    0.8796500295328811,
+    0.4687288848085448,
+    0.9140098262501138,
+    0.3,
+    0.8768659262222392,
+    0.347900152107138,
+    0.2052792621001125,
+    0.7959734436791641,
+    0.5,
+    0.08103251576226367,
+    0.8394081742446953,
+    0.49063216620197225,
+    0.6,
+    0.9634941222800739,
+    0.37406792745097384,
+    0.5,
+    0.3487080894570471,
+    0.6621192010115009,
+    0.19167991378593208,
+    0.3922525883866994,
+    0.6384264270877891,
+    0.18240724863601887,
+    0.7132610842727852,
+    0.9,
+    0.3683708522529835,
+    0.43954176090229546,
+    0.015674466470348203,
+    0.3625361595988956,
+    0.25079722504110336,
+    0.7995891234915979,
+    0.2560158477907588,
+    0.0630307029124193,
+    0.5321340866123929,
+    0.9831455370052413,
+    0.7623128940801136,
+    1.0,
+)
+
+
+class FisConfig(NamedTuple):
+    """
+    Decoded controller parameters.
+
+    Attributes:
+        threat_sum_scalar_1 (`float`): Scales the proximity-threat threshold of the mode switch.
+        thrust_sum_scalar_4 (`float`): Scales the summed thrust contributions.
+        closure_mfs_1, distance_mfs_1, rule_const_1: FIS1, closure vs distance -> threat.
+        relative_heading_mfs_2, size_mfs_2, rule_const_2: FIS2, rel-heading vs size -> sub-threat.
+        threat_fis_mfs_1, threat_fis_mfs_2, rule_const_3: FIS3, FIS1 & FIS2 -> final threat.
+        az_mfs_4, thrust_dist_mfs_4, rule_const_4: FIS4, azimuth vs thrust-distance -> thrust.
+        az_mfs_5, distance_mfs_5, rule_const_5: FIS5, azimuth vs distance -> defensive base.
+        relative_heading_mfs_6, defensive_fis_mfs_6, rule_const_6: FIS6, closure vs FIS5 -> avoid.
+        evade_weight (`float`): How far a forecast impact pulls the FIS thrust
+            towards full evasion thrust (0 leaves it alone).
+    """
+
+    threat_sum_scalar_1: float
+    thrust_sum_scalar_4: float
+    closure_mfs_1: List[Callable]
+    distance_mfs_1: List[Callable]
+    rule_const_1: np.ndarray
+    relative_heading_mfs_2: List[Callable]
+    size_mfs_2: List[Callable]
+    rule_const_2: np.ndarray
+    threat_fis_mfs_1: List[Callable]
+    threat_fis_mfs_2: List[Callable]
+    rule_const_3: np.ndarray
+    az_mfs_4: List[Callable]
+    thrust_dist_mfs_4: List[Callable]
+    rule_const_4: np.ndarray
+    az_mfs_5: List[Callable]
+    distance_mfs_5: List[Callable]
+    rule_const_5: np.ndarray
+    relative_heading_mfs_6: List[Callable]
+    defensive_fis_mfs_6: List[Callable]
+    rule_const_6: np.ndarray
+    evade_weight: float
+
+
+def decode_chromosome(chromosome: Sequence[float]) -> FisConfig:
+    """
+    Unpack a GA chromosome into membership functions and rule tables.
+
+    Args:
+        chromosome (`Sequence[float]`): `CHROMOSOME_LENGTH` genes in [0, 1].
+
+    Returns:
+        `FisConfig`: The decoded parameters.
+
+    Raises:
+        ValueError: If the chromosome has the wrong length.
+    """
+    genes = np.asarray(chromosome, dtype=float)
+    if genes.shape != (CHROMOSOME_LENGTH,):
+        raise ValueError(
+            f"Chromosome must have {CHROMOSOME_LENGTH} genes, got shape {genes.shape}"
+        )
+
+    threat_sum_scalar_1, thrust_sum_scalar_4 = genes[0], genes[1]
+    fis = []
+    for k in range(6):
+        block = genes[2 + 11 * k:13 + 11 * k]
+        x1_mfs = ft.build_triangles(block[:1])
+        x2_mfs = ft.build_triangles(block[1:2])
+        rules = np.array(block[2:]).reshape(len(x1_mfs), len(x2_mfs))
+        fis.extend((x1_mfs, x2_mfs, rules))
+    return FisConfig(threat_sum_scalar_1, thrust_sum_scalar_4, *fis, genes[68])
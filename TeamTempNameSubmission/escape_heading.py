@@ -0,0 +1,90 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def occupancy_histogram(
+    rel_positions: Sequence[Tuple[float, float]],
+    weights: Sequence[float],
+    bins: int = 36,
+    smoothing: int = 2,
+) -> np.ndarray:
+    """
+    Bin ship-relative bearings into a circularly smoothed, weighted histogram.
+
+    Args:
+        rel_positions (Sequence[Tuple[float, float]]): Ship-relative (dx, dy) positions.
+        weights (Sequence[float]): Danger weight of each position.
+        bins (int): Number of angular bins over 360 degrees.
+        smoothing (int): Half-width in bins of the triangular smoothing kernel.
+
+    Returns:
+        np.ndarray: Smoothed occupancy per bin; bin k covers world headings
+                    [k, k + 1) * 360 / bins degrees.
+    """
+    pos = np.asarray(rel_positions, dtype=float).reshape(-1, 2)
+    bearings = np.degrees(np.arctan2(pos[:, 1], pos[:, 0])) % 360.0
+    idx = (bearings * (bins / 360.0)).astype(np.intp) % bins
+    hist = np.bincount(idx, weights=np.asarray(weights, dtype=float), minlength=bins)
+
+    # Circular triangular smoothing, O(bins * smoothing).
+    smoothed = hist * (smoothing + 1)
+    for k in range(1, smoothing + 1):
+        w = smoothing + 1 - k
+        smoothed += w * (np.roll(hist, k) + np.roll(hist, -k))
+    return smoothed
+
+
+def escape_heading(
+    rel_positions: Sequence[Tuple[float, float]],
+    distances: Sequence[float],
+    radii: Sequence[float],
+    threats: Optional[Sequence[float]] = None,
+    closures: Optional[Sequence[float]] = None,
+    ship_heading: Optional[float] = None,
+    bins: int = 36,
+    smoothing: int = 2,
+) -> float:
+    """
+    Pick the least-occupied escape direction around the ship.
+
+    Each asteroid adds `(1 + threat) * (0.5 + closure) * radius / distance`
+    to the bin of its bearing, so near, large, approaching and threatening
+    asteroids dominate, unlike a plain largest-gap search over bearings.
+    When several bins tie for the minimum, the one needing the smallest
+    turn from `ship_heading` wins, which keeps the choice stable from frame
+    to frame. Runs in O(n + bins).
+
+    Args:
+        rel_positions (Sequence[Tuple[float, float]]): Ship-relative (dx, dy) positions.
+        distances (Sequence[float]): Distance to each asteroid.
+        radii (Sequence[float]): Radius of each asteroid.
+        threats (Optional[Sequence[float]]): Threat values; defaults to zero.
+        closures (Optional[Sequence[float]]): Closure rates normalized to [0, 1]
+            (0.5 means neither approaching nor receding); defaults to 0.5.
+        ship_heading (Optional[float]): Current heading in degrees, used to break ties.
+        bins (int): Number of angular bins over 360 degrees.
+        smoothing (int): Half-width in bins of the smoothing kernel.
+
+    Returns:
+        float: World-frame escape heading in degrees [0, 360).
+    """
+    n = len(distances)
+    width = 360.0 / bins
+    if n == 0:
+        return float(ship_heading % 360.0) if ship_heading is not None else 0.0
+
+    weights = np.asarray(radii, dtype=float) / (np.asarray(distances, dtype=float) + 1e-6)
+    if threats is not None:
+        weights = weights * (1.0 + np.asarray(threats, dtype=float))
+    if closures is not None:
+        weights = weights * (0.5 + np.asarray(closures, dtype=float))
+
+    occupancy = occupancy_histogram(rel_positions, weights, bins, smoothing)
+    centers = (np.arange(bins) + 0.5) * width
+
+    candidates = np.flatnonzero(occupancy <= occupancy.min() * (1.0 + 1e-9) + 1e-12)
+    if ship_heading is not None and len(candidates) > 1:
+        turn = np.abs((centers[candidates] - ship_heading + 180.0) % 360.0 - 180.0)
+        return float(centers[candidates[np.argmin(turn)]])
+    return float(centers[candidates[0]])
@@ -0,0 +1,138 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class FeatureCache:
+    """
+    Temporal-coherence cache of per-asteroid derived features.
+
+    Asteroids fly in straight lines, so the closure rate, relative heading,
+    normalized distance and threat of most asteroids barely change between
+    frames. Each entry remembers the geometry it was computed from and stays
+    valid while:
+
+    - the asteroid's ship-relative position has moved less than
+      `position_tol` times its distance (about 3 degrees of bearing or 5%
+      of range at the default),
+    - the ship heading has turned less than `heading_tol` degrees, and
+    - the ship speed has changed less than `speed_tol`.
+
+    On top of that every entry is force-refreshed once per `refresh_period`
+    frames, staggered by ID so only a small rotating subset is due each
+    frame and approximation error cannot build up. With `refresh_period=1`
+    nothing is reused and the features are exactly the uncached ones.
+    """
+
+    def __init__(
+        self,
+        position_tol: float = 0.05,
+        heading_tol: float = 5.0,
+        speed_tol: float = 20.0,
+        refresh_period: int = 10,
+    ):
+        self.position_tol = position_tol
+        self.heading_tol = heading_tol
+        self.speed_tol = speed_tol
+        self.refresh_period = max(1, int(refresh_period))
+
+        self._entries: Dict[int, Tuple[float, float, float, float, float, tuple]] = {}
+        self._frame = 0
+
+        # --- Per-frame counters ---
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def begin_frame(self, gone: Iterable[int]) -> None:
+        """
+        Advance the rotating-refresh phase and drop entries for dead asteroids.
+
+        Args:
+            gone (Iterable[int]): IDs that disappeared since the last frame.
+        """
+        self._frame += 1
+        self.hits = 0
+        self.misses = 0
+        entries = self._entries
+        for aid in gone:
+            entries.pop(aid, None)
+
+    def lookup(
+        self,
+        aid: int,
+        rel_position: Tuple[float, float],
+        ship_heading: float,
+        ship_speed: float,
+    ) -> Optional[tuple]:
+        """
+        Return the cached features for an asteroid if they are still valid.
+
+        Args:
+            aid (int): Persistent asteroid ID.
+            rel_position (Tuple[float, float]): Current ship-relative position.
+            ship_heading (float): Current ship heading in degrees.
+            ship_speed (float): Current ship speed.
+
+        Returns:
+            Optional[tuple]: The stored features, or None if the entry is
+                             missing, out of bounds, or due for a refresh.
+        """
+        entry = self._entries.get(aid)
+        if entry is None or (aid + self._frame) % self.refresh_period == 0:
+            self.misses += 1
+            return None
+
+        x, y, dist, heading, speed, features = entry
+        dx = rel_position[0] - x
+        dy = rel_position[1] - y
+        limit = self.position_tol * dist
+        dh = (ship_heading - heading + 180.0) % 360.0 - 180.0
+        if (
+            dx * dx + dy * dy > limit * limit
+            or abs(dh) > self.heading_tol
+            or abs(ship_speed - speed) > self.speed_tol
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return features
+
+    def get(self, aid: int) -> Optional[tuple]:
+        """Return the last stored features for an asteroid, valid or not."""
+        entry = self._entries.get(aid)
+        return None if entry is None else entry[5]
+
+    def store(
+        self,
+        aid: int,
+        rel_position: Tuple[float, float],
+        distance: float,
+        ship_heading: float,
+        ship_speed: float,
+        features: tuple,
+    ) -> None:
+        """
+        Store freshly computed features with the geometry they came from.
+
+        Args:
+            aid (int): Persistent asteroid ID.
+            rel_position (Tuple[float, float]): Ship-relative position used.
+            distance (float): Distance to the asteroid used.
+            ship_heading (float): Ship heading used, in degrees.
+            ship_speed (float): Ship speed used.
+            features (tuple): The derived features to cache.
+        """
+        self._entries[aid] = (
+            rel_position[0],
+            rel_position[1],
+            distance,
+            ship_heading,
+            ship_speed,
+            features,
+        )
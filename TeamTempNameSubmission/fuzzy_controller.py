@@ -1,45 +1,187 @@
 
-from typing import TYPE_CHECKING, List, Tuple, Optional
+import functools
+from typing import TYPE_CHECKING, Callable, Sequence, Tuple, Optional, Union
 from kesslergame import KesslerController
 
-from utils import LoggerUtility
 from utils.kessler_helpers import get_bullet_speed
+from utils.stage_timer import StageTimer
 from TeamTempNameSubmission import vector_math as vm
 from TeamTempNameSubmission import fuzzy_trees as ft
+from TeamTempNameSubmission.chromosome import DEFAULT_CHROMOSOME, FisConfig, decode_chromosome
+from TeamTempNameSubmission.target_selector import TargetSelector
+from TeamTempNameSubmission.collision_forecast import forecast_collisions
+from TeamTempNameSubmission.feature_cache import FeatureCache
+from TeamTempNameSubmission.bullet_tracker import predict_doomed
+from TeamTempNameSubmission.shot_planner import PlannedShot, plan_shots
+from TeamTempNameSubmission.spatial_index import ToroidalGrid
+from TeamTempNameSubmission.escape_heading import escape_heading
+from TeamTempNameSubmission.work_buffers import WorkBuffers
 if TYPE_CHECKING:
     from utils.types import ActionsReturn, GameState, ShipOwnState
-import time
 import math
+import time
 import numpy as np
 
 
+# Look-ahead window for the impact forecast, in seconds.
+COLLISION_HORIZON = 1.0
+
+# Per-frame fallback counters in `FuzzyController.skipped`: asteroids left to
+# an approximation for the per-asteroid stages, 1 if the stage fell back for
+# "grid" and "plan".
+SKIP_COUNTERS = ("forecast", "grid", "threat", "doomed", "plan", "avoid", "thrust")
+
+# ID matching switches from the dense distance block to grid buckets once
+# current x previous asteroids exceeds this many pairs.
+DENSE_MATCH_PAIRS = 256 * 256
+
+# Threat given to an asteroid skipped for time that has never been scored,
+# when nothing else was scored this frame either (mid-scale of the FIS).
+UNKNOWN_THREAT = 0.5
+
+# Radius of the thrust and avoidance queries; past the deadline the impact
+# forecast only looks at asteroids inside the larger one.
+THRUST_RADIUS = 300.0
+AVOID_RADIUS = 400.0
+
+# Stages charged by the per-stage timer, in pipeline order.
+TIMED_STAGES = (
+    "setup",
+    "snapshot",
+    "tracking",
+    "threat",
+    "mode_switch",
+    "targeting",
+    "avoidance",
+    "respawn",
+)
+
+
+def _no_lap(stage: str) -> None:
+    # Stand-in for StageTimer.lap when stage timing is off.
+    pass
+
+
+def controller_factory(
+    chromosome: Optional[Sequence[float]] = None, **kwargs
+) -> Callable[[], "FuzzyController"]:
+    """
+    Picklable zero-argument constructor for a chromosome-configured controller.
+
+    The genes travel to `multiprocessing` workers as a plain tuple and each
+    call builds a fresh controller, since controllers keep per-game state.
+
+    Args:
+        chromosome (Optional[Sequence[float]]): GA genes; None for the default.
+        **kwargs: Other `FuzzyController` arguments.
+
+    Returns:
+        Callable[[], FuzzyController]: Builds a new controller per call.
+    """
+    genes = None if chromosome is None else tuple(float(g) for g in chromosome)
+    return functools.partial(FuzzyController, genes, **kwargs)
+
 
 class FuzzyController(KesslerController):
     """
     A fuzzy-logic Asteroids controller with persistent-per-asteroid IDs.
     Tracks which asteroids you’ve already shot by custom ID so removals
     never desynchronize your list.
+
+    Args:
+        chromosome (Optional[Union[Sequence[float], FisConfig]]): GA genes
+            (`CHROMOSOME_LENGTH` values in [0, 1]) or an already decoded
+            `FisConfig`. Decoded once here; None uses `DEFAULT_CHROMOSOME`.
+        time_budget (Optional[float]): Per-frame deadline in seconds (e.g. 0.002).
+            When set, asteroids are evaluated nearest-first and, once the
+            deadline passes, the remainder fall back to cheap approximations:
+            the impact forecast covers only asteroids within `AVOID_RADIUS`,
+            radius queries become prefix slices of the distance-sorted list,
+            bullet-hit prediction only re-checks the shot table, the planner
+            aims greedily, and an unscored asteroid keeps its last threat
+            (or this frame's highest one). None (default) always runs the
+            full evaluation.
+        cache_features (bool): Reuse per-asteroid features across frames while
+            the relative geometry stays within tolerance. Reused features are
+            approximate and change the ship's decisions, so scores differ
+            from the exact path. False (default) recomputes every asteroid
+            every frame.
+        shot_horizon (int): Number of upcoming shots ordered together by the
+            beam-search planner. 1 (default) aims greedily at the single
+            highest-threat asteroid; larger values are opt-in and add
+            per-frame latency for the beam search.
+        beam_width (int): Partial schedules kept per planner depth.
+        shot_candidates (int): How many top-threat unshot asteroids the
+            planner considers.
+        profile_stages (bool): Record per-stage timings into
+            `self.stage_timer` (a `StageTimer`; None when off).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        chromosome: Optional[Union[Sequence[float], FisConfig]] = None,
+        time_budget: Optional[float] = None,
+        cache_features: bool = False,
+        shot_horizon: int = 1,
+        beam_width: int = 4,
+        shot_candidates: int = 8,
+        profile_stages: bool = False,
+    ):
         super().__init__()
         self._name = "BajaBlasteroids"
 
+        # --- Fuzzy systems built from the chromosome ---
+        if chromosome is None:
+            chromosome = DEFAULT_CHROMOSOME
+        self.fis: FisConfig = (
+            chromosome if isinstance(chromosome, FisConfig)
+            else decode_chromosome(chromosome)
+        )
+
+        # --- Anytime evaluation: deadline & per-frame skip counters ---
+        self.time_budget = time_budget
+        self.skipped = dict.fromkeys(SKIP_COUNTERS, 0)
+        self.frames_over_budget = 0
+        self._deadline: Optional[float] = None
+
+        # --- Optional per-stage timing histograms ---
+        self.stage_timer: Optional[StageTimer] = (
+            StageTimer(TIMED_STAGES) if profile_stages else None
+        )
+
         # --- Mode & cooldown ---
         self.mode = "Avoidance"
         self.switch_tracker = 0
 
-        # --- Shot-tracking by ID ---
-        self.asteroids_shot_at: list[int] = []
+        # --- Shot-tracking by ID (threat-ordered target queue) ---
+        self.target_selector = TargetSelector()
+        self._last_shot_id: Optional[int] = None
+        self._doomed: set[int] = set()
 
-        # --- Persistent ID machinery ---
-        self._tracked_asteroids: dict[int, tuple[float, float]] = {}
+        # --- Multi-shot schedule (re-planned every frame) ---
+        self.shot_horizon = shot_horizon
+        self.beam_width = beam_width
+        self.shot_candidates = shot_candidates
+        self.shot_plan: list[PlannedShot] = []
+
+        # --- Persistent ID machinery (last frame lives in the work buffers) ---
+        self._buffers = WorkBuffers()
+        self._prev_count = 0
         self._next_asteroid_id = 0
 
         # --- Respawn timer (3s countdown) ---
         self.respawn_time = 0.0
 
-        self.second_tracker = 0
+        # --- Per-asteroid derived features reused across frames ---
+        self.feature_cache: Optional[FeatureCache] = (
+            FeatureCache() if cache_features else None
+        )
+
+        # --- Uniform-grid index for radius queries (built on first frame) ---
+        self.spatial_index: Optional[ToroidalGrid] = None
+
+        # --- Forecast impacts: (asteroid ID, time to impact), soonest first ---
+        self.imminent_collisions: list[tuple[int, float]] = []
 
         # --- Bullet speed constant ---
         self.bullet_speed = get_bullet_speed()
@@ -51,6 +193,273 @@ class FuzzyController(KesslerController):
     def explanation(self) -> str:
         return getattr(self, "msg", "")
 
+    def _assign_ids(self, n: int, dt: float) -> Sequence[int]:
+        """
+        Give this frame's asteroids persistent IDs in `self._buffers.ids[:n]`.
+
+        Each asteroid, in game order, takes the nearest still-unused
+        previous-frame asteroid to where it was one step ago, if that is
+        within 1.5x its per-frame travel; otherwise it gets a fresh ID.
+        Up to `DENSE_MATCH_PAIRS` pairs, distances are computed in blocks of
+        `WorkBuffers.BLOCK` rows into preallocated arrays (O(n * m) for n
+        current and m previous asteroids, vectorized), and only asteroids
+        whose nearest match was already taken by an earlier one fall back to
+        a per-row search. Larger fields go through `_match_bucketed`, which
+        gives the same IDs from grid-local candidate pairs only.
+
+        Returns:
+            Sequence[int]: IDs of previous-frame asteroids that found no
+                           match, i.e. the ones that are gone.
+        """
+        buf = self._buffers
+        m = self._prev_count
+        ids = buf.ids
+        pred = buf.pred[:n]
+        thresh = buf.thresh[:n]
+
+        # predict where each asteroid was last frame
+        np.multiply(buf.vel[:n], dt, out=pred)
+        np.hypot(pred[:, 0], pred[:, 1], out=thresh)
+        thresh *= 1.5
+        thresh += 1e-3
+        np.subtract(buf.pos[:n], pred, out=pred)
+
+        if m == 0:
+            ids[:n] = np.arange(self._next_asteroid_id, self._next_asteroid_id + n)
+            self._next_asteroid_id += n
+            return ()
+
+        prev_x = buf.prev_pos[:m, 0]
+        prev_y = buf.prev_pos[:m, 1]
+        prev_ids = buf.prev_ids
+        taken = buf.taken[:m]
+        taken[:] = False
+        next_id = self._next_asteroid_id
+
+        if n * m > DENSE_MATCH_PAIRS:
+            self._next_asteroid_id = self._match_bucketed(n, m, next_id)
+            return prev_ids[:m][~taken].tolist()
+
+        for lo in range(0, n, buf.BLOCK):
+            hi = min(lo + buf.BLOCK, n)
+            dx = buf.match[: hi - lo, :m]
+            dy = buf.match_dy[: hi - lo, :m]
+            np.subtract(prev_x, pred[lo:hi, 0:1], out=dx)
+            np.subtract(prev_y, pred[lo:hi, 1:2], out=dy)
+            np.hypot(dx, dy, out=dx)
+            best = np.argmin(dx, axis=1).tolist()
+            best_d = dx[np.arange(hi - lo), best].tolist()
+            limits = thresh[lo:hi].tolist()
+
+            for r, (j, d, limit) in enumerate(zip(best, best_d, limits)):
+                if d <= limit and taken[j]:
+                    # nearest was claimed earlier: search the unused ones
+                    row = np.where(taken, np.inf, dx[r])
+                    j = int(np.argmin(row))
+                    d = row[j]
+                if d <= limit:
+                    taken[j] = True
+                    ids[lo + r] = prev_ids[j]
+                else:
+                    ids[lo + r] = next_id
+                    next_id += 1
+
+        self._next_asteroid_id = next_id
+        return prev_ids[:m][~taken].tolist()
+
+    def _match_bucketed(self, n: int, m: int, next_id: int) -> int:
+        """
+        `_assign_ids` matching for large fields, on grid-local pairs only.
+
+        Previous positions are bucketed into square cells at least as wide as
+        the largest match radius, so every possible match of an asteroid lies
+        in the 3 x 3 cells around where it was predicted to be. Only those
+        pairs get a distance, so the cost is about O(n + m) instead of
+        O(n * m). Pairs are then taken in game order, nearest (then lowest
+        index) first, which reproduces the dense path's IDs exactly.
+
+        Returns:
+            int: The next unused asteroid ID.
+        """
+        buf = self._buffers
+        prev = buf.prev_pos[:m]
+        pred = buf.pred[:n]
+        thresh = buf.thresh[:n]
+        taken = buf.taken[:m]
+        ids = buf.ids
+
+        # --- Bucket the previous positions (CSR layout, as in ToroidalGrid) ---
+        origin = prev.min(axis=0)
+        extent = prev.max(axis=0) - origin
+        cell = max(float(thresh.max()), float(extent.max()) / np.sqrt(m), 1e-3)
+        prev_cell = ((prev - origin) // cell).astype(np.intp)
+        nx = int(prev_cell[:, 0].max()) + 1
+        ny = int(prev_cell[:, 1].max()) + 1
+        cells = prev_cell[:, 1] * nx + prev_cell[:, 0]
+        members = np.argsort(cells, kind="stable")
+        start = np.zeros(nx * ny + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cells, minlength=nx * ny), out=start[1:])
+
+        # --- Candidate pairs from the 3 x 3 cells around each prediction ---
+        query_cell = np.floor((pred - origin) / cell).astype(np.intp)
+        rows, cands = [], []
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                cx = query_cell[:, 0] + ox
+                cy = query_cell[:, 1] + oy
+                ok = np.flatnonzero((cx >= 0) & (cx < nx) & (cy >= 0) & (cy < ny))
+                c = cy[ok] * nx + cx[ok]
+                starts = start[c]
+                counts = start[c + 1] - starts
+                total = int(counts.sum())
+                if total:
+                    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+                    rows.append(np.repeat(ok, counts))
+                    cands.append(members[offsets + np.arange(total)])
+
+        matched = np.zeros(n, dtype=bool)
+        if rows:
+            row = np.concatenate(rows)
+            cand = np.concatenate(cands)
+            d = np.hypot(prev[cand, 0] - pred[row, 0], prev[cand, 1] - pred[row, 1])
+            keep = d <= thresh[row]
+            row, cand, d = row[keep], cand[keep], d[keep]
+            by_row = np.lexsort((cand, d, row))
+
+            # greedy in game order: each asteroid takes its nearest unused match
+            last = -1
+            for r, j in zip(row[by_row].tolist(), cand[by_row].tolist()):
+                if r == last or taken[j]:
+                    continue
+                taken[j] = True
+                ids[r] = buf.prev_ids[j]
+                matched[r] = True
+                last = r
+
+        fresh = np.flatnonzero(~matched)
+        ids[fresh] = np.arange(next_id, next_id + len(fresh))
+        return next_id + len(fresh)
+
+    def _sort_by_distance(
+        self,
+        n: int,
+        ship_position: Tuple[float, float],
+        map_size: Tuple[float, float],
+    ) -> None:
+        """
+        Fill the buffers' sorted views with this frame's asteroids, nearest first.
+
+        Positions are taken relative to the ship across the map wrap. The
+        sort permutation is the only array allocated and is dropped on
+        return, so nothing O(n) outlives this step.
+        """
+        buf = self._buffers
+        rel = buf.rel[:n]
+        wrap = buf.wrap[:n]
+        np.subtract(buf.pos[:n], ship_position, out=rel)
+        np.divide(rel, map_size, out=wrap)
+        np.round(wrap, out=wrap)
+        np.multiply(wrap, map_size, out=wrap)
+        np.subtract(rel, wrap, out=rel)
+        dist = buf.dist[:n]
+        np.hypot(rel[:, 0], rel[:, 1], out=dist)
+        order = np.argsort(dist, kind="stable")
+
+        np.take(buf.ids[:n], order, out=buf.ids_sorted[:n])
+        np.take(rel, order, axis=0, out=buf.rel_sorted[:n])
+        np.take(buf.vel[:n], order, axis=0, out=buf.vel_sorted[:n])
+        np.take(buf.pos[:n], order, axis=0, out=buf.world[:n])
+        np.take(dist, order, out=buf.dist_sorted[:n])
+        np.take(buf.radius[:n], order, out=buf.radius_sorted[:n])
+
+    def _plan_target(
+        self,
+        ship_state: "ShipOwnState",
+        can_shoot: bool,
+    ) -> Optional[int]:
+        """
+        Plan the next `shot_horizon` shots over the top unshot candidates.
+
+        Returns:
+            Optional[int]: ID of the first planned target, or the plain
+                           highest-threat unshot ID when planning is off.
+        """
+        selector = self.target_selector
+        if self.shot_horizon <= 1:
+            self.shot_plan = []
+            return selector.best_unshot()
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            # out of time: greedy pick instead of the beam search
+            self.skipped["plan"] = 1
+            self.shot_plan = []
+            return selector.best_unshot()
+
+        candidates = selector.top_unshot(self.shot_candidates)
+        if not candidates:
+            self.shot_plan = []
+            return None
+
+        buf = self._buffers
+        idxs = [selector.rank(aid) for aid in candidates]
+        fire_interval = 1.0 / max(ship_state["fire_rate"], 1e-6)
+        self.shot_plan = plan_shots(
+            ship_state["heading"],
+            max(abs(r) for r in ship_state["turn_rate_range"]),
+            fire_interval,
+            self.bullet_speed,
+            candidates,
+            buf.rel_sorted[idxs].tolist(),
+            buf.vel_sorted[idxs].tolist(),
+            [selector.threat(aid) for aid in candidates],
+            ready_in=0.0 if can_shoot else fire_interval,
+            horizon=self.shot_horizon,
+            beam_width=self.beam_width,
+        )
+        if not self.shot_plan:
+            return selector.best_unshot()
+        return self.shot_plan[0].asteroid_id
+
+    def _engage_best_target(
+        self,
+        ship_state: "ShipOwnState",
+        dt: float,
+        can_shoot: bool,
+    ) -> Tuple[Optional[float], bool]:
+        """
+        Aim at the first planned unshot target and fire when aligned.
+
+        Shared by the offensive branch and the defensive fallback.
+
+        Returns:
+            Tuple[Optional[float], bool]: The turn rate (None if there is no
+                                          unshot target) and whether to fire.
+        """
+        target_id = self._plan_target(ship_state, can_shoot)
+        if target_id is None:
+            return None, False
+
+        buf = self._buffers
+        selector = self.target_selector
+        idx = selector.rank(target_id)
+        ta, on_target = vm.turn_angle(
+            ship_state["position"],
+            ship_state["heading"],
+            ship_state["turn_rate_range"],
+            self.bullet_speed,
+            buf.world[idx],
+            buf.vel_sorted[idx].tolist(),
+            dt,
+        )
+        if on_target and can_shoot:
+            if target_id == selector.best_unshot():
+                selector.pop_best_unshot()
+            else:
+                # a planned shot further down the queue
+                selector.mark_shot(target_id)
+            self._last_shot_id = target_id
+            return ta, True
+        return ta, False
+
     def actions(
         self,
         ship_state: "ShipOwnState",
@@ -59,8 +468,17 @@ class FuzzyController(KesslerController):
         """
         Returns (thrust, turn_angle, shoot, mine).
         """
-
-
+        _now = time.perf_counter
+        deadline = self._deadline = (
+            None if self.time_budget is None else _now() + self.time_budget
+        )
+        skipped = self.skipped
+        for key in skipped:
+            skipped[key] = 0
+        timer = self.stage_timer
+        lap = _no_lap if timer is None else timer.lap
+        if timer is not None:
+            timer.start()
 
         if game_state["time"] == 0:
             # --- Mode & cooldown ---
@@ -68,21 +486,21 @@ class FuzzyController(KesslerController):
             self.switch_tracker = 0
 
             # --- Shot-tracking by ID ---
-            self.asteroids_shot_at: list[int] = []
+            self.target_selector.clear()
+            self._last_shot_id = None
+            if self.feature_cache is not None:
+                self.feature_cache.clear()
 
             # --- Persistent ID machinery ---
-            self._tracked_asteroids: dict[int, tuple[float, float]] = {}
+            self._prev_count = 0
             self._next_asteroid_id = 0
 
             # --- Respawn timer (3s countdown) ---
             self.respawn_time = 0.0
 
-            self.second_tracker = 0
-
             # --- Bullet speed constant ---
             self.bullet_speed = get_bullet_speed()
 
-
         EPS = 1e-6
         thrust = EPS
         turn_angle = EPS
@@ -91,199 +509,207 @@ class FuzzyController(KesslerController):
         asteroids = game_state["asteroids"]
         dt = game_state["delta_time"]
 
-        self.second_tracker += dt
-
         # --- If no asteroids at all, reset target list & bail ---
         if not asteroids:
-            self.asteroids_shot_at.clear()
-            self._tracked_asteroids.clear()
+            self.target_selector.clear()
+            if self.feature_cache is not None:
+                self.feature_cache.clear()
+            self._prev_count = 0
+            self.imminent_collisions = []
+            if timer is not None:
+                lap("setup")
+                timer.end_frame()
             return thrust, turn_angle, False, False
 
         # --- Helpers & caches ---
-        _hypot = math.hypot
         _calc_closure = vm.calculate_closure_rate
         _heading_rel = vm.heading_relative_angle
         _tsk = ft.tsk_inference_const
 
-        # --- Default chromosome ---
-
-        chromosome = np.array([0.7109474609320601, 0.7609740700916316, 0.8, 0.3, 0.3717061466030136, 0.9563489000722659, 0.3987398409735582, 0.0, 0.22104530222719243, 0.4717704519369058, 0.9, 0.18773654259862715, 0.6474969600847753, 0.5354084622540757, 0.8140706896832727, 0.7, 0.38268600220069104, 0.7063770643073141, 0.26557552486399494, 0.31088819632944154, 0.3001507138382199, 0.014066650570101369, 0.5701122749556755, 0.09919668307060692, 0.4892249929424314, 0.3798114168134762, 0.221524079282726, 0.7, 0.8330280547072464, 0.0, 0.7727826183648449, 0.5777446510249947, 0.16730090886905546, 0.8796500295328811, 0.4687288848085448, 0.9140098262501138, 0.3, 0.8768659262222392, 0.347900152107138, 0.2052792621001125, 0.7959734436791641, 0.5, 0.08103251576226367, 0.8394081742446953, 0.49063216620197225, 0.6, 0.9634941222800739, 0.37406792745097384, 0.5, 0.3487080894570471, 0.6621192010115009, 0.19167991378593208, 0.3922525883866994, 0.6384264270877891, 0.18240724863601887, 0.7132610842727852, 0.9, 0.3683708522529835, 0.43954176090229546, 0.015674466470348203, 0.3625361595988956, 0.25079722504110336, 0.7995891234915979, 0.2560158477907588, 0.0630307029124193, 0.5321340866123929, 0.9831455370052413, 0.7623128940801136])
-
-        # --- Unpack GA parameters into FIS setups ---
-        threat_sum_scalar_1, chromosome = chromosome[0], chromosome[1:]
-        thrust_sum_scalar_4, chromosome = chromosome[0], chromosome[1:]
-
-        # FIS1: closure vs distance → threat
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        closure_mfs_1 = ft.build_triangles(centers)
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        distance_mfs_1 = ft.build_triangles(centers)
-        rule_const_1 = np.array(chromosome[:9]).reshape(
-            len(closure_mfs_1), len(distance_mfs_1)
-        )
-        chromosome = chromosome[9:]
-
-        # FIS2: rel-heading vs size → sub-threat
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        relative_heading_mfs_2 = ft.build_triangles(centers)
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        size_mfs_2 = ft.build_triangles(centers)
-        rule_const_2 = np.array(chromosome[:9]).reshape(
-            len(relative_heading_mfs_2), len(size_mfs_2)
-        )
-        chromosome = chromosome[9:]
-
-        # FIS3: combine FIS1 & FIS2 → final threat
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        threat_fis_mfs_1 = ft.build_triangles(centers)
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        threat_fis_mfs_2 = ft.build_triangles(centers)
-        rule_const_3 = np.array(chromosome[:9]).reshape(
-            len(threat_fis_mfs_1), len(threat_fis_mfs_2)
-        )
-        chromosome = chromosome[9:]
-
-        # FIS4: azimuth vs thrust-distance → thrust contrib
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        az_mfs_4 = ft.build_triangles(centers)
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        thrust_dist_mfs_4 = ft.build_triangles(centers)
-        rule_const_4 = np.array(chromosome[:9]).reshape(
-            len(az_mfs_4), len(thrust_dist_mfs_4)
-        )
-        chromosome = chromosome[9:]
-
-        # FIS5: azimuth vs distance → defensive base
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        az_mfs_5 = ft.build_triangles(centers)
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        distance_mfs_5 = ft.build_triangles(centers)
-        rule_const_5 = np.array(chromosome[:9]).reshape(
-            len(az_mfs_5), len(distance_mfs_5)
-        )
-        chromosome = chromosome[9:]
-
-        # FIS6: closure vs FIS5 → avoid/shoot decision
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        relative_heading_mfs_6 = ft.build_triangles(centers)
-        centers, chromosome = chromosome[:1], chromosome[1:]
-        defensive_fis_mfs_6 = ft.build_triangles(centers)
-        rule_const_6 = np.array(chromosome[:9]).reshape(
-            len(relative_heading_mfs_6), len(defensive_fis_mfs_6)
-        )
-        chromosome = chromosome[9:]
+        # --- GA parameters (decoded once in __init__) ---
+        (
+            threat_sum_scalar_1, thrust_sum_scalar_4,
+            closure_mfs_1, distance_mfs_1, rule_const_1,
+            relative_heading_mfs_2, size_mfs_2, rule_const_2,
+            threat_fis_mfs_1, threat_fis_mfs_2, rule_const_3,
+            az_mfs_4, thrust_dist_mfs_4, rule_const_4,
+            az_mfs_5, distance_mfs_5, rule_const_5,
+            relative_heading_mfs_6, defensive_fis_mfs_6, rule_const_6,
+            evade_weight,
+        ) = self.fis
 
         # --- Respawn handling ---
         
         can_shoot = ship_state["can_fire"]
+        lap("setup")
+
+        # --- Snapshot into the reusable work buffers ---
+        n = len(asteroids)
+        buf = self._buffers
+        buf.ensure(n)
+        pos = buf.pos[:n]
+        vel = buf.vel[:n]
+        pos[:] = [a["position"] for a in asteroids]
+        vel[:] = [a["velocity"] for a in asteroids]
+        buf.radius[:n] = [a["radius"] for a in asteroids]
+        lap("snapshot")
 
         # --- Build persistent IDs by matching last-frame positions ---
-        world_positions = [a["position"] for a in asteroids]
-        velocities = [a["velocity"] for a in asteroids]
-
-        new_tracked: dict[int, tuple[float, float]] = {}
-        used_old_ids = set()
-
-        for wpos, vel in zip(world_positions, velocities):
-            # predict where it was last frame
-            pred_x = wpos[0] - vel[0] * dt
-            pred_y = wpos[1] - vel[1] * dt
-            best_id = None
-            best_dist = float("inf")
-
-            # find a previous asteroid whose last pos matches
-            for aid, last_pos in self._tracked_asteroids.items():
-                if aid in used_old_ids:
-                    continue
-                d = _hypot(last_pos[0] - pred_x, last_pos[1] - pred_y)
-                if d < best_dist:
-                    best_dist = d
-                    best_id = aid
-
-            # threshold = how far it could have moved + small epsilon
-            vel_norm = _hypot(vel[0], vel[1])
-            thresh = vel_norm * dt * 1.5 + 1e-3
-
-            if best_id is not None and best_dist <= thresh:
-                aid = best_id
-            else:
-                aid = self._next_asteroid_id
-                self._next_asteroid_id += 1
+        gone = self._assign_ids(n, dt)
+        lap("tracking")
+
+        # --- Ship-frame positions (map wrap) and distance sort ---
+        self._sort_by_distance(n, ship_state["position"], game_state["map_size"])
+        ids_sorted = buf.ids_sorted[:n]
+        rel_sorted = buf.rel_sorted[:n]
+        vel_sorted = buf.vel_sorted[:n]
+        world_sorted = buf.world[:n]
+        dist_sorted = buf.dist_sorted[:n]
+        radius_sorted = buf.radius_sorted[:n]
+
+        # this frame becomes the matching reference for the next one
+        buf.swap()
+        self._prev_count = n
+
+        # --- Forecast impacts (wrap-aware; only the nearest when late) ---
+        reach = n
+        if deadline is not None and _now() > deadline:
+            reach = int(np.searchsorted(dist_sorted, AVOID_RADIUS, side="right"))
+            skipped["forecast"] = n - reach
+        forecast = forecast_collisions(
+            ship_state["position"],
+            ship_state["velocity"],
+            ship_state["radius"],
+            world_sorted[:reach],
+            vel_sorted[:reach],
+            radius_sorted[:reach],
+            game_state["map_size"],
+            COLLISION_HORIZON,
+        )
+        self.imminent_collisions = [(int(ids_sorted[i]), t) for i, t in forecast]
+
+        # --- Radius queries around the ship (indices into the sorted lists,
+        #     so ascending index is nearest-first) ---
+        if deadline is not None and _now() > deadline:
+            # out of time: the sorted distances give the same sets directly
+            near_300 = range(int(np.searchsorted(dist_sorted, THRUST_RADIUS, side="right")))
+            near_400 = range(int(np.searchsorted(dist_sorted, AVOID_RADIUS, side="right")))
+            skipped["grid"] = 1
+        else:
+            grid = self.spatial_index
+            if grid is None or grid.map_size != tuple(map(float, game_state["map_size"])):
+                grid = self.spatial_index = ToroidalGrid(game_state["map_size"])
+            grid.rebuild(world_sorted)
+            near_300 = grid.query(ship_state["position"], THRUST_RADIUS)
+            near_400 = grid.query(ship_state["position"], AVOID_RADIUS)
+        lap("snapshot")
+
+        # --- Compute threat values (into the sorted slots of the buffers) ---
+        threat_array = buf.threat[:n]
+        closures = buf.closure[:n]
+        selector = self.target_selector
+        for aid in gone:
+            selector.discard(aid)
+
+        # (closure, rel-heading, norm-distance, threat) per asteroid;
+        # None only when skipped for time with nothing cached
+        feat_sorted = buf.feats
+        cache = self.feature_cache
+        if cache is not None:
+            cache.begin_frame(gone)
+        heading = ship_state["heading"]
+        speed = ship_state["speed"]
+        # stand-in for skipped asteroids never scored: worst threat seen so far
+        worst = None
+
+        for i in range(n):
+            aid = ids_sorted.item(i)
+            rpos = rel_sorted[i].tolist()
+            d = dist_sorted.item(i)
+            feats = None if cache is None else cache.lookup(aid, rpos, heading, speed)
+            if feats is None:
+                if deadline is not None and _now() > deadline:
+                    # out of time: fall back to stale features / last threat
+                    feats = None if cache is None else cache.get(aid)
+                    skipped["threat"] += 1
+                else:
+                    d_norm = min(50.0 / (d + EPS), 0.99999)
+                    closure = _calc_closure(
+                        ship_state["position"],
+                        heading,
+                        speed,
+                        rpos,
+                        vel_sorted[i].tolist(),
+                    )
+                    closure = min(max((closure + 200.0) / 400.0, 0.0), 1.0)
+                    size_n = radius_sorted.item(i) / 4.0
+                    rh = _heading_rel([0, 0], heading, rpos) / 360.0
+                    if rh in (0.0, 1.0):
+                        rh = 0.99999
 
-            new_tracked[aid] = wpos
-            used_old_ids.add(aid)
+                    out1 = _tsk(closure, d_norm,
+                                closure_mfs_1, distance_mfs_1, rule_const_1)
+                    out2 = _tsk(rh, size_n,
+                                relative_heading_mfs_2, size_mfs_2, rule_const_2)
+                    thr = _tsk(out1, out2,
+                               threat_fis_mfs_1, threat_fis_mfs_2, rule_const_3)
 
-        # swap in the new mapping
-        self._tracked_asteroids = new_tracked
+                    feats = (closure, rh, d_norm, thr)
+                    if cache is not None:
+                        cache.store(aid, rpos, d, heading, speed, feats)
 
-        # --- Combine into list and sort by distance in ship frame ---
-        rel_positions = vm.game_to_ship_frame(
-            ship_state["position"], world_positions, game_state["map_size"]
-        )
-        ast_data = [
-            (aid, rpos, vel, wpos, _hypot(rpos[0], rpos[1]))
-            for (aid, rpos, vel, wpos) in zip(
-                new_tracked.keys(),
-                rel_positions,
-                velocities,
-                world_positions,
+            if feats is None:
+                thr = selector.threat(
+                    aid, UNKNOWN_THREAT if worst is None else worst
+                )
+            else:
+                thr = feats[3]
+                if worst is None or thr > worst:
+                    worst = thr
+            feat_sorted[i] = feats
+            threat_array[i] = thr
+            closures[i] = 0.5 if feats is None else feats[0]
+            selector.update(aid, thr, i)
+
+        proximity_threat = sum(threat_array[i] for i in near_400)
+        valid_count = n
+        lap("threat")
+
+        # --- Shot list: asteroids a bullet in flight will hit, plus last
+        #     frame's target (its bullet only shows up next frame) ---
+        doomed = self._doomed
+        doomed.clear()
+        if deadline is not None and _now() > deadline:
+            # out of time: only re-check what is already in the shot table
+            shot = selector.shot_ids()
+            idxs = [selector.rank(aid) for aid in shot]
+            doomed.update(
+                shot[k]
+                for k in predict_doomed(
+                    game_state["bullets"],
+                    world_sorted[idxs],
+                    vel_sorted[idxs],
+                    radius_sorted[idxs],
+                    game_state["map_size"],
+                )
             )
-        ]
-        ast_data.sort(key=lambda x: x[4])  # sort by dist
-
-        # unpack
-        (ids_sorted,
-         rel_sorted,
-         vel_sorted,
-         world_sorted,
-         dist_sorted) = map(list, zip(*ast_data))
-
-        # --- Compute threat values ---
-        threat_array: list[float] = []
-        proximity_threat = 0.0
-
-        for i, rpos in enumerate(rel_sorted):
-            d = dist_sorted[i]
-            d_norm = min(50.0 / (d + EPS), 0.99999)
-            closure = _calc_closure(
-                ship_state["position"],
-                ship_state["heading"],
-                ship_state["speed"],
-                rpos,
-                vel_sorted[i],
+            skipped["doomed"] = n - len(shot)
+        else:
+            doomed.update(
+                int(ids_sorted[j])
+                for j in predict_doomed(
+                    game_state["bullets"],
+                    world_sorted,
+                    vel_sorted,
+                    radius_sorted,
+                    game_state["map_size"],
+                )
             )
-            closure = min(max((closure + 200.0) / 400.0, 0.0), 1.0)
-            size_n = asteroids[i]["radius"] / 4.0
-            rh = _heading_rel([0, 0], ship_state["heading"], rpos) / 360.0
-            if rh in (0.0, 1.0):
-                rh = 0.99999
-
-            out1 = _tsk(closure, d_norm,
-                        closure_mfs_1, distance_mfs_1, rule_const_1)
-            out2 = _tsk(rh, size_n,
-                        relative_heading_mfs_2, size_mfs_2, rule_const_2)
-            thr = _tsk(out1, out2,
-                       threat_fis_mfs_1, threat_fis_mfs_2, rule_const_3)
-
-            threat_array.append(thr)
-            if d < 400.0:
-                proximity_threat += thr
-
-        valid_count = len(threat_array)
-
-        # --- Prune shot list: remove dead IDs, cap oldest off ---
-        self.asteroids_shot_at = [
-            aid for aid in self.asteroids_shot_at if aid in ids_sorted
-        ]
-
-
-
-        if len(rel_sorted) == 1 and self.second_tracker%1 < dt:
-            self.asteroids_shot_at.clear()
-
-        max_keep = min(20, 4 + valid_count // 2)
-        while len(self.asteroids_shot_at) > max_keep:
-            self.asteroids_shot_at.pop(0)
+        if self._last_shot_id is not None:
+            doomed.add(self._last_shot_id)
+            self._last_shot_id = None
+        selector.sync_shots(doomed)
+        lap("targeting")
 
         # --- Mode switch with cooldown ---
         if self.switch_tracker <= 0:
@@ -295,143 +721,124 @@ class FuzzyController(KesslerController):
             self.switch_tracker = 30
         else:
             self.switch_tracker -= 1
+        lap("mode_switch")
 
         # --- OFFENSIVE mode: aim & shoot + thrust-away ---
         if self.mode == "Offensive" and valid_count > 0:
             # choose highest-threat not-yet-shot ID
-            shot_set = set(self.asteroids_shot_at)
-            for aid, thr in sorted(
-                zip(ids_sorted, threat_array),
-                key=lambda x: x[1], reverse=True
-            ):
-                if aid not in shot_set:
-                    target_id = aid
-                    break
-            else:
-                target_id = None
-
-            if target_id is not None:
-                idx = ids_sorted.index(target_id)
-                ta, on_target = vm.turn_angle(
-                    ship_state["position"],
-                    ship_state["heading"],
-                    ship_state["turn_rate_range"],
-                    self.bullet_speed,
-                    world_sorted[idx],
-                    vel_sorted[idx],
-                    dt,
-                )
+            ta, shoot = self._engage_best_target(ship_state, dt, can_shoot)
+            if ta is not None:
                 turn_angle = ta
-                if on_target and can_shoot:
-                    shoot = True
-                    self.asteroids_shot_at.append(target_id)
+            lap("targeting")
 
             # thrust away from any close ones
-            for i, rpos in enumerate(rel_sorted):
-                if dist_sorted[i] > 300.0:
-                    break
-                rh = _heading_rel([0, 0], ship_state["heading"], rpos) / 360.0
-                if rh in (0.0, 1.0):
-                    rh = 0.99999
-                dn = min(50.0 / (dist_sorted[i] + EPS), 0.99999)
+            for i in near_300:
+                feats = feat_sorted[i]
+                if feats is None or (
+                    deadline is not None and _now() > deadline
+                ):
+                    skipped["thrust"] += 1
+                    continue
+                _, rh, dn, _ = feats
                 thrust += (
                     _tsk(rh, dn, az_mfs_4, thrust_dist_mfs_4, rule_const_4)
                     - 0.5
                 )
             thrust *= 200.0 * thrust_sum_scalar_4
+            lap("avoidance")
 
         # --- DEFENSIVE mode: avoid or fallback to shooting ---
         elif self.mode == "Defensive" and valid_count > 0:
-            avoid_scores = []
-            for i, rpos in enumerate(rel_sorted):
-                if dist_sorted[i] > 400.0:
-                    break
-                dn = min(50.0 / (dist_sorted[i] + EPS), 0.99999)
-                closure = _calc_closure(
-                    ship_state["position"],
-                    ship_state["heading"],
-                    ship_state["speed"],
-                    rpos,
-                    vel_sorted[i],
-                )
-                closure = min(max((closure + 200.0) / 400.0, 0.0), 1.0)
-                rh = _heading_rel([0, 0], ship_state["heading"], rpos) / 360.0
-                if rh in (0.0, 1.0):
-                    rh = 0.99999
+            avoid_max = 0.0
+            for i in near_400:
+                feats = feat_sorted[i]
+                if feats is None or (
+                    deadline is not None and _now() > deadline
+                ):
+                    # nearest ones already scored; drop the rest
+                    skipped["avoid"] += 1
+                    continue
+                closure, rh, dn, _ = feats
 
                 d1 = _tsk(closure, dn, az_mfs_5, distance_mfs_5, rule_const_5)
                 d2 = _tsk(rh, d1, relative_heading_mfs_6, defensive_fis_mfs_6, rule_const_6)
-                avoid_scores.append(d2)
-
-            if avoid_scores and max(avoid_scores) > 0.5:
-                gap = vm.largest_gap_center([
-                    _heading_rel([0, 0], ship_state["heading"], r) / 360.0
-                    for r in rel_sorted
-                ])
+                avoid_max = max(avoid_max, d2)
+            lap("avoidance")
+
+            # avoid when the FIS says so or an impact is actually forecast
+            if self.imminent_collisions or avoid_max > 0.5:
+                heading = ship_state["heading"]
+                escape = escape_heading(
+                    rel_sorted,
+                    dist_sorted,
+                    radius_sorted,
+                    threats=threat_array,
+                    closures=closures,
+                    ship_heading=heading,
+                )
+                # unwrap so the target is within 180 degrees of the heading
+                escape = heading + (escape - heading + 180.0) % 360.0 - 180.0
                 ta, _ = vm.go_to_angle(
-                    ship_state["heading"],
+                    heading,
                     ship_state["turn_rate_range"],
-                    gap,
+                    escape,
                     dt,
                 )
                 turn_angle = ta
+                lap("avoidance")
 
             else:
                 # fallback to Offensive shooting logic
-                shot_set = set(self.asteroids_shot_at)
-                for aid, thr in sorted(
-                    zip(ids_sorted, threat_array),
-                    key=lambda x: x[1], reverse=True
-                ):
-                    if aid not in shot_set:
-                        target_id = aid
-                        break
-                else:
-                    target_id = None
-
-                if target_id is not None:
-                    idx = ids_sorted.index(target_id)
-                    ta, on_target = vm.turn_angle(
-                        ship_state["position"],
-                        ship_state["heading"],
-                        ship_state["turn_rate_range"],
-                        self.bullet_speed,
-                        world_sorted[idx],
-                        vel_sorted[idx],
-                        dt,
-                    )
+                ta, shoot = self._engage_best_target(ship_state, dt, can_shoot)
+                if ta is not None:
                     turn_angle = ta
-                    if on_target and can_shoot:
-                        shoot = True
-                        self.asteroids_shot_at.append(target_id)
+                lap("targeting")
 
                 # same thrust-away as Offensive
-                for i, rpos in enumerate(rel_sorted):
-                    if dist_sorted[i] > 300.0:
-                        break
-                    rh = _heading_rel([0, 0], ship_state["heading"], rpos) / 360.0
-                    if rh in (0.0, 1.0):
-                        rh = 0.99999
-                    dn = min(50.0 / (dist_sorted[i] + EPS), 0.99999)
+                for i in near_300:
+                    feats = feat_sorted[i]
+                    if feats is None or (
+                        deadline is not None and _now() > deadline
+                    ):
+                        skipped["thrust"] += 1
+                        continue
+                    _, rh, dn, _ = feats
                     thrust += (
                         _tsk(rh, dn, az_mfs_4, thrust_dist_mfs_4, rule_const_4)
                         - 0.5
                     )
                 thrust *= 200.0 * thrust_sum_scalar_4
-
-
-
+                lap("avoidance")
+
+        # --- Forecast impact (any mode): blend towards thrusting away from
+        #     the earliest one, more strongly the sooner it hits ---
+        if forecast and evade_weight > 0.0:
+            i, t_hit = forecast[0]
+            dx, dy = rel_sorted[i].tolist()
+            heading = math.radians(ship_state["heading"])
+            ahead = dx * math.cos(heading) + dy * math.sin(heading)
+            evade = ship_state["thrust_range"][0 if ahead > 0.0 else 1]
+            urgency = 1.0 - t_hit / COLLISION_HORIZON
+            thrust += evade_weight * urgency * (evade - thrust)
+            lap("avoidance")
+
+        if deadline is not None and _now() > deadline:
+            self.frames_over_budget += 1
+
+        result = (thrust, turn_angle, shoot, False)
         if ship_state["is_respawning"]:
             if self.respawn_time <= 0.0:
                 self.respawn_time = 3.0
             self.respawn_time = max(0.0, self.respawn_time - dt)
             if self.respawn_time > 2.0:
-                return 100.0, 0.0, False, False
-            if self.respawn_time > 1.0:
-                return 0.0, turn_angle, False, False
+                result = (100.0, 0.0, False, False)
+            elif self.respawn_time > 1.0:
+                result = (0.0, turn_angle, False, False)
         else:
             self.respawn_time = 0.0
 
+        if timer is not None:
+            lap("respawn")
+            timer.end_frame()
 
-
-        return thrust, turn_angle, shoot, False
\ No newline at end of file
+        return result
\ No newline at end of file
@@ -0,0 +1,100 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class ToroidalGrid:
+    """
+    Uniform-grid spatial index over a wrap-around map.
+
+    Points are bucketed into square-ish cells and stored in CSR form (one
+    index array sorted by cell plus per-cell start offsets), so a rebuild is
+    a couple of array passes over the per-frame position array. A radius
+    query visits only the cells overlapping the query disc, with wrap-around
+    at the map edges, and costs O(cells touched + points returned).
+
+    The index holds plain positions, so the same class serves asteroids,
+    bullets or mines.
+
+    Args:
+        map_size (Tuple[float, float]): The (width, height) dimensions of the game map.
+        cell_size (float): Target cell edge length; cells are stretched so a
+            whole number of them tiles the map.
+    """
+
+    def __init__(self, map_size: Tuple[float, float], cell_size: float = 100.0):
+        self.map_size = (float(map_size[0]), float(map_size[1]))
+        width, height = self.map_size
+        self.nx = max(1, int(width // cell_size))
+        self.ny = max(1, int(height // cell_size))
+        self.cell_w = width / self.nx
+        self.cell_h = height / self.ny
+
+        self._points = np.empty((0, 2))
+        self._order = np.empty(0, dtype=np.intp)
+        self._start = np.zeros(self.nx * self.ny + 1, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def rebuild(self, positions: Sequence[Tuple[float, float]]) -> None:
+        """
+        Re-bucket the index from this frame's positions.
+
+        Args:
+            positions (Sequence[Tuple[float, float]]): World positions; query
+                results are indices into this sequence.
+        """
+        pts = np.asarray(positions, dtype=float).reshape(-1, 2)
+        width, height = self.map_size
+        cx = np.minimum((np.mod(pts[:, 0], width) / self.cell_w).astype(np.intp), self.nx - 1)
+        cy = np.minimum((np.mod(pts[:, 1], height) / self.cell_h).astype(np.intp), self.ny - 1)
+        cells = cy * self.nx + cx
+
+        self._points = pts
+        self._order = np.argsort(cells, kind="stable")
+        np.cumsum(np.bincount(cells, minlength=self.nx * self.ny), out=self._start[1:])
+
+    def query(self, point: Tuple[float, float], radius: float) -> np.ndarray:
+        """
+        All indexed points within `radius` of `point`, measured on the torus.
+
+        Args:
+            point (Tuple[float, float]): The (x, y) query center.
+            radius (float): The query radius.
+
+        Returns:
+            np.ndarray: Sorted indices into the positions passed to `rebuild`.
+        """
+        if len(self._points) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        width, height = self.map_size
+        cols = self._span(point[0], radius, self.cell_w, self.nx, width)
+        rows = self._span(point[1], radius, self.cell_h, self.ny, height)
+        cells = (rows[:, None] * self.nx + cols[None, :]).ravel()
+
+        # Gather the CSR slices of every touched cell without a Python loop.
+        starts = self._start[cells]
+        counts = self._start[cells + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.intp)
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        idx = self._order[offsets + np.arange(total)]
+
+        # Exact wrapped distance test on the candidates.
+        d = self._points[idx] - np.asarray(point, dtype=float)
+        d[:, 0] -= width * np.round(d[:, 0] / width)
+        d[:, 1] -= height * np.round(d[:, 1] / height)
+        inside = d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1] <= radius * radius
+        return np.sort(idx[inside])
+
+    @staticmethod
+    def _span(center: float, radius: float, cell: float, n: int, size: float) -> np.ndarray:
+        # Cell indices along one axis covering [center - r, center + r], wrapped.
+        lo = int(np.floor((center - radius) / cell))
+        hi = int(np.floor((center + radius) / cell))
+        if hi - lo + 1 >= n or 2.0 * radius >= size:
+            return np.arange(n)
+        return np.arange(lo, hi + 1) % n
@@ -0,0 +1,242 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class TargetSelector:
+    """
+    Indexed max-priority queue of asteroid IDs keyed by threat.
+
+    Asteroids that have not been shot at live in a binary heap with a
+    position index, so a threat update, removal or best-target query costs
+    O(log n) instead of re-sorting every (id, threat) pair each frame.
+    The controller re-scores every asteroid each frame, so every key is
+    updated in place; asteroids only move as far as their rank changed,
+    and only the ones that vanished are removed.
+    Asteroids marked as shot at are moved out of the heap into a shot
+    table and keep their last threat so `sync_shots` can put them back
+    once no bullet is headed their way.
+
+    Ties in threat are broken by a caller-supplied rank (lower wins); the
+    controller passes the distance order so equal threats resolve to the
+    nearest asteroid.
+    """
+
+    def __init__(self):
+        self._heap: List[int] = []
+        self._pos: Dict[int, int] = {}
+        self._key: Dict[int, Tuple[float, float]] = {}
+        self._shot: Dict[int, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._key)
+
+    def __contains__(self, aid: int) -> bool:
+        return aid in self._key
+
+    def clear(self) -> None:
+        """Forget every tracked asteroid."""
+        self._heap.clear()
+        self._pos.clear()
+        self._key.clear()
+        self._shot.clear()
+
+    def threat(self, aid: int, default: float = 0.0) -> float:
+        """
+        Last threat stored for an asteroid.
+
+        Args:
+            aid (int): Persistent asteroid ID.
+            default (float): Value returned for unknown IDs.
+
+        Returns:
+            float: The stored threat, or `default`.
+        """
+        key = self._key.get(aid)
+        return default if key is None else key[0]
+
+    def rank(self, aid: int) -> Optional[float]:
+        """
+        Tie-break rank last stored for an asteroid.
+
+        The controller passes the distance-sorted index, so this maps an ID
+        back to its slot in the frame's sorted arrays.
+
+        Args:
+            aid (int): Persistent asteroid ID.
+
+        Returns:
+            Optional[float]: The stored rank, or None for unknown IDs.
+        """
+        key = self._key.get(aid)
+        return None if key is None else -key[1]
+
+    def update(self, aid: int, threat: float, rank: float = 0.0) -> None:
+        """
+        Insert an asteroid or change its threat.
+
+        Args:
+            aid (int): Persistent asteroid ID.
+            threat (float): New threat value (higher is more urgent).
+            rank (float): Tie-breaker for equal threats (lower is preferred).
+        """
+        old = self._key.get(aid)
+        key = (threat, -rank)
+        self._key[aid] = key
+        if aid in self._shot:
+            return
+        if old is None:
+            self._push(aid)
+        elif key > old:
+            self._sift_up(self._pos[aid])
+        elif key < old:
+            self._sift_down(self._pos[aid])
+
+    def discard(self, aid: int) -> None:
+        """Stop tracking an asteroid (no-op if unknown)."""
+        if self._key.pop(aid, None) is None:
+            return
+        if aid in self._shot:
+            del self._shot[aid]
+        else:
+            self._remove_at(self._pos[aid])
+
+    def mark_shot(self, aid: int) -> None:
+        """Move an asteroid out of the candidate heap into the shot table."""
+        if aid not in self._key or aid in self._shot:
+            return
+        self._remove_at(self._pos[aid])
+        self._shot[aid] = None
+
+    def sync_shots(self, ids: Iterable[int]) -> None:
+        """
+        Make the shot table exactly the tracked IDs in `ids`.
+
+        Asteroids no longer in `ids` go back to the heap; new ones are marked.
+
+        Args:
+            ids (Iterable[int]): IDs that should count as shot at.
+        """
+        wanted = ids if isinstance(ids, (set, frozenset, dict)) else set(ids)
+        for aid in [a for a in self._shot if a not in wanted]:
+            del self._shot[aid]
+            self._push(aid)
+        for aid in wanted:
+            self.mark_shot(aid)
+
+    def shot_ids(self) -> List[int]:
+        """
+        IDs currently in the shot table.
+
+        Returns:
+            List[int]: The shot-at asteroid IDs, oldest first.
+        """
+        return list(self._shot)
+
+    def best_unshot(self) -> Optional[int]:
+        """
+        Peek at the highest-threat asteroid not yet shot at.
+
+        Returns:
+            Optional[int]: Its ID, or None if every asteroid has been shot at.
+        """
+        return self._heap[0] if self._heap else None
+
+    def pop_best_unshot(self) -> Optional[int]:
+        """
+        Return the highest-threat asteroid not yet shot at and mark it as shot.
+
+        Returns:
+            Optional[int]: Its ID, or None if every asteroid has been shot at.
+        """
+        aid = self.best_unshot()
+        if aid is not None:
+            self.mark_shot(aid)
+        return aid
+
+    def top_unshot(self, m: int) -> List[int]:
+        """
+        The `m` highest-threat asteroids not yet shot at, best first.
+
+        Walks the heap from the root with a frontier queue, so the cost is
+        O(m log m) regardless of how many asteroids are tracked.
+
+        Args:
+            m (int): Maximum number of IDs to return.
+
+        Returns:
+            List[int]: Up to `m` IDs in priority order.
+        """
+        heap = self._heap
+        out: List[int] = []
+        if not heap or m <= 0:
+            return out
+        n = len(heap)
+        frontier = [(self._rank(0), 0)]
+        while frontier and len(out) < m:
+            _, i = heapq.heappop(frontier)
+            out.append(heap[i])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n:
+                    heapq.heappush(frontier, (self._rank(child), child))
+        return out
+
+    # --- heap internals -------------------------------------------------
+
+    def _higher(self, a: int, b: int) -> bool:
+        # Full ties go to the older (lower) ID so selection is deterministic.
+        ka = self._key[a]
+        kb = self._key[b]
+        return ka > kb or (ka == kb and a < b)
+
+    def _rank(self, i: int) -> Tuple[float, float, int]:
+        # Min-heap sort key matching _higher for the entry at heap slot i.
+        aid = self._heap[i]
+        threat, neg_rank = self._key[aid]
+        return (-threat, -neg_rank, aid)
+
+    def _push(self, aid: int) -> None:
+        self._heap.append(aid)
+        self._pos[aid] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def _remove_at(self, i: int) -> None:
+        heap = self._heap
+        aid = heap[i]
+        last = heap.pop()
+        del self._pos[aid]
+        if i < len(heap):
+            heap[i] = last
+            self._pos[last] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last])
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos = self._heap, self._pos
+        aid = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not self._higher(aid, heap[parent]):
+                break
+            heap[i] = heap[parent]
+            pos[heap[i]] = i
+            i = parent
+        heap[i] = aid
+        pos[aid] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos = self._heap, self._pos
+        n = len(heap)
+        aid = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and self._higher(heap[child + 1], heap[child]):
+                child += 1
+            if not self._higher(heap[child], aid):
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = aid
+        pos[aid] = i
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class WorkBuffers:
+    """
+    Preallocated per-asteroid scratch owned by one controller.
+
+    Every per-asteroid array shares one capacity. When a frame has more
+    asteroids than that, all arrays are reallocated at double the size (or
+    the new count if larger) and the live prefix is copied over, so a frame
+    reuses the same memory. The distance-sorted views the scalar code reads
+    live here too, plus one Python list of feature-tuple slots, so nothing
+    O(n) is held between a frame's stages; only the vectorized kernels
+    (sort, forecast, bullet sweep, grid) still make O(n) NumPy temporaries
+    inside their own stage. `benchmarks/allocation_profile.py` checks both.
+
+    `pos`/`ids` hold this frame's asteroids and `prev_pos`/`prev_ids` last
+    frame's; `swap()` flips them once the frame's IDs are assigned so the
+    history is kept without copying.
+
+    Args:
+        capacity (int): Initial number of asteroids the arrays can hold.
+    """
+
+    # Rows of the ID-matching distance block (bounds its memory to BLOCK * capacity).
+    BLOCK = 256
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.grows = 0
+        self._alloc(max(1, int(capacity)))
+        self.grows = 0
+
+    def ensure(self, n: int) -> None:
+        """
+        Make sure every buffer can hold `n` asteroids, growing geometrically.
+
+        Args:
+            n (int): Number of asteroids needed this frame.
+        """
+        if n > self.capacity:
+            self._alloc(max(n, 2 * self.capacity))
+
+    def swap(self) -> None:
+        """Make this frame's positions and IDs the previous frame's."""
+        self.pos, self.prev_pos = self.prev_pos, self.pos
+        self.ids, self.prev_ids = self.prev_ids, self.ids
+
+    def _alloc(self, capacity: int) -> None:
+        old = self.capacity
+        block = min(self.BLOCK, capacity)
+
+        def grow(name: str, shape: tuple, dtype) -> None:
+            arr = np.zeros(shape, dtype=dtype)
+            prev = getattr(self, name, None)
+            if prev is not None:
+                arr[:old] = prev[:old]
+            setattr(self, name, arr)
+
+        # --- Per-asteroid state ---
+        grow("pos", (capacity, 2), float)
+        grow("vel", (capacity, 2), float)
+        grow("radius", (capacity,), float)
+        grow("ids", (capacity,), np.int64)
+        grow("prev_pos", (capacity, 2), float)
+        grow("prev_ids", (capacity,), np.int64)
+
+        # --- Per-frame scratch ---
+        grow("pred", (capacity, 2), float)
+        grow("rel", (capacity, 2), float)
+        grow("world", (capacity, 2), float)
+        grow("wrap", (capacity, 2), float)
+        grow("dist", (capacity,), float)
+        grow("thresh", (capacity,), float)
+        grow("taken", (capacity,), bool)
+
+        # --- Distance-sorted views and per-asteroid results ---
+        grow("ids_sorted", (capacity,), np.int64)
+        grow("rel_sorted", (capacity, 2), float)
+        grow("vel_sorted", (capacity, 2), float)
+        grow("dist_sorted", (capacity,), float)
+        grow("radius_sorted", (capacity,), float)
+        grow("threat", (capacity,), float)
+        grow("closure", (capacity,), float)
+        # (closure, rel-heading, norm-distance, threat) or None, per sorted slot
+        feats = getattr(self, "feats", [])
+        self.feats = feats + [None] * (capacity - len(feats))
+
+        # --- ID matching block (rows x previous asteroids) ---
+        self.match = np.empty((block, capacity))
+        self.match_dy = np.empty((block, capacity))
+
+        self.capacity = capacity
+        self.grows += 1
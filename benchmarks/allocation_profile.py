@@ -0,0 +1,406 @@
+import argparse
+import copy
+import fnmatch
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from kesslergame import KesslerController, TrainerEnvironment
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from TeamTempNameSubmission.fuzzy_controller import FuzzyController
+from scenarios import scenarios
+from utils import LoggerUtility, LoggingLevel, make_stress_state
+
+# Set up the logger
+logger = LoggerUtility(LoggingLevel.INFO).get_logger()
+
+# Headless settings; the scenario's own time limit applies
+game_settings = {
+    "frequency": 30,  # Dictates both frequency and time_step settings (float)
+    "perf_tracker": False,  # (bool)
+    "prints_on": False,  # (bool)
+    "realtime_multiplier": 0,  # (float)
+    "random_ast_splits": False,  # (bool)
+}
+
+
+class AllocationProfiler(KesslerController):
+    """
+    Wrap a controller and trace the memory its `actions()` calls allocate.
+
+    Per frame it records the bytes still held after the call (retained) and
+    the peak above the pre-call level (transient churn). Every `interval`
+    frames it takes a tracemalloc snapshot, so allocation sites can be
+    compared between the start and the end of the game.
+
+    Args:
+        controller (KesslerController): The controller that actually plays.
+        interval (int): Frames between snapshots.
+        site_filter (str): fnmatch pattern of source files whose allocation
+            sites are reported.
+        traceback_depth (int): Frames stored per traced allocation.
+        capture_frame (Optional[int]): Frame whose inputs are kept in
+            `captured` for `steady_state_check`.
+    """
+
+    def __init__(
+        self,
+        controller: KesslerController,
+        interval: int = 300,
+        site_filter: str = "*TeamTempNameSubmission*",
+        traceback_depth: int = 1,
+        capture_frame: Optional[int] = None,
+    ):
+        super().__init__()
+        self.controller = controller
+        self.interval = interval
+        self.site_filter = site_filter
+        self.traceback_depth = traceback_depth
+        self.capture_frame = capture_frame
+        self.captured: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+
+        self.retained: List[int] = []
+        self.churn: List[int] = []
+        self.samples: List[Tuple[int, int]] = []
+        self.snapshots: List[tracemalloc.Snapshot] = []
+
+    def actions(self, ship_state: Dict[str, Any], game_state: Dict[str, Any]) -> Tuple[float, float, bool, bool]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+        if len(self.retained) + 1 == self.capture_frame:
+            self.captured = (copy.deepcopy(ship_state), copy.deepcopy(dict(game_state)))
+
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = self.controller.actions(ship_state, game_state)
+        after, peak = tracemalloc.get_traced_memory()
+
+        self.retained.append(after - before)
+        self.churn.append(peak - before)
+        frame = len(self.retained)
+        if frame % self.interval == 1 or self.interval == 1:
+            self.samples.append((frame, after))
+            self.snapshots.append(
+                tracemalloc.take_snapshot().filter_traces(
+                    [tracemalloc.Filter(True, self.site_filter)]
+                )
+            )
+        return result
+
+    @property
+    def ship_id(self) -> int:
+        return self.controller.ship_id
+
+    @ship_id.setter
+    def ship_id(self, value: int) -> None:
+        self.controller.ship_id = value
+
+    @property
+    def name(self) -> str:
+        return self.controller.name
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Summarize the traced game.
+
+        Args:
+            top (int): Number of allocation sites to list.
+
+        Returns:
+            Dict[str, Any]: Per-frame churn and retention statistics, traced
+                            memory at each snapshot, and the allocation sites
+                            that grew most between the first and last snapshot.
+        """
+        churn = np.asarray(self.churn, dtype=float)
+        retained = np.asarray(self.retained, dtype=float)
+        sites = []
+        if len(self.snapshots) >= 2:
+            diff = self.snapshots[-1].compare_to(self.snapshots[0], "lineno")
+            for stat in diff[:top]:
+                frame = stat.traceback[0]
+                sites.append(
+                    {
+                        "site": f"{os.path.relpath(frame.filename)}:{frame.lineno}",
+                        "size_diff": stat.size_diff,
+                        "count_diff": stat.count_diff,
+                        "size": stat.size,
+                        "count": stat.count,
+                    }
+                )
+        return {
+            "frames": len(churn),
+            "churn_mean_bytes": float(churn.mean()) if len(churn) else 0.0,
+            "churn_max_bytes": int(churn.max()) if len(churn) else 0,
+            "retained_total_bytes": int(retained.sum()),
+            "retained_per_frame_bytes": float(retained.mean()) if len(retained) else 0.0,
+            "traced_at_snapshot": [{"frame": f, "bytes": b} for f, b in self.samples],
+            "top_growth_sites": sites,
+        }
+
+
+class StageMemoryProbe:
+    """
+    Stand-in for a controller's `StageTimer` that traces memory per stage.
+
+    Installed as `controller.stage_timer`, it is called at every stage
+    boundary of `actions()`. There it records the transient peak reached
+    inside the stage and the bytes still allocated above the frame's
+    starting level: what a frame holds from one stage to the next, as
+    opposed to temporaries a stage frees before it ends.
+    """
+
+    def __init__(self):
+        self.stage_peak: Dict[str, int] = {}
+        self.frame_peak = 0
+        self.held_max = 0
+        self._base = 0
+
+    def start(self) -> None:
+        self._base = tracemalloc.get_traced_memory()[0]
+        self.frame_peak = 0
+        tracemalloc.reset_peak()
+
+    def lap(self, stage: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        peak -= self._base
+        self.stage_peak[stage] = max(self.stage_peak.get(stage, 0), peak)
+        self.frame_peak = max(self.frame_peak, peak)
+        self.held_max = max(self.held_max, current - self._base)
+        tracemalloc.reset_peak()
+
+    def end_frame(self) -> None:
+        pass
+
+
+def steady_state_frames(
+    ship_state: Dict[str, Any], game_state: Dict[str, Any], frames: int
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Controller inputs for `frames` frames after a captured one, with the
+    asteroids flying on in straight lines (wrapping at the map edge) and
+    nothing else changing: no bullets, no splits, and a ship that cannot
+    fire, so every frame asks the controller for the same work.
+    """
+    width, height = game_state["map_size"]
+    dt = game_state["delta_time"]
+    asteroids = [dict(a) for a in game_state["asteroids"]]
+    ship = dict(ship_state, can_fire=False)
+    for frame in range(1, frames + 1):
+        for a in asteroids:
+            (x, y), (vx, vy) = a["position"], a["velocity"]
+            a["position"] = ((x + vx * dt) % width, (y + vy * dt) % height)
+        yield ship, dict(
+            game_state,
+            asteroids=[dict(a) for a in asteroids],
+            bullets=[],
+            time=game_state["time"] + frame * dt,
+            sim_frame=game_state["sim_frame"] + frame,
+        )
+
+
+def steady_state_check(
+    controller: FuzzyController,
+    ship_state: Dict[str, Any],
+    game_state: Dict[str, Any],
+    frames: int = 300,
+    warmup: int = 50,
+) -> Dict[str, Any]:
+    """
+    Measure what a controller allocates once the asteroid field stops changing.
+
+    After `warmup` frames every buffer and table has reached its size, so a
+    frame should retain nothing, and between its stages it should hold no
+    more than a constant amount: the per-asteroid results live in the work
+    buffers. Inside a stage the vectorized kernels (distance sort, impact
+    forecast, bullet sweep, grid rebuild, ID matching) still allocate O(n)
+    NumPy temporaries, so the transient peak grows with the asteroid count.
+
+    Args:
+        controller (FuzzyController): The controller; its `stage_timer` is
+            swapped for a `StageMemoryProbe` during the check.
+        ship_state (Dict[str, Any]): Captured ship state.
+        game_state (Dict[str, Any]): Captured game state (needs asteroids).
+        frames (int): Measured frames.
+        warmup (int): Unmeasured frames run first.
+
+    Returns:
+        Dict[str, Any]: Asteroid count, garbage-collected objects still alive
+                        after the measured frames that were not before them,
+                        the most bytes held across a stage boundary, and
+                        per-frame and per-stage transient peak bytes.
+    """
+    states = list(steady_state_frames(ship_state, game_state, warmup + frames))
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    for ship, game in states[:warmup]:
+        controller.actions(ship, game)
+
+    timer = controller.stage_timer
+    probe = controller.stage_timer = StageMemoryProbe()
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    churn = np.empty(frames)
+    for k, (ship, game) in enumerate(states[warmup:]):
+        controller.actions(ship, game)
+        churn[k] = probe.frame_peak
+    gc.collect()
+    controller.stage_timer = timer
+
+    n = len(game_state["asteroids"])
+    return {
+        "asteroids": n,
+        "frames": frames,
+        "retained_objects": len(gc.get_objects()) - objects_before,
+        "held_max_bytes": probe.held_max,
+        "churn_mean_bytes": float(churn.mean()),
+        "churn_max_bytes": int(churn.max()),
+        "churn_per_asteroid_bytes": float(churn.mean() / n),
+        "stage_churn_max_bytes": probe.stage_peak,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Trace FuzzyController allocations over a full scenario"
+    )
+
+    parser.add_argument(
+        "--scenario",
+        choices=scenarios.keys(),
+        type=str,
+        default="battle_arena",
+        help="Select a scenario by name: " + ", ".join(scenarios.keys()),
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=300,
+        help="Frames between tracemalloc snapshots.",
+    )
+
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites to list.")
+
+    parser.add_argument(
+        "--site_filter",
+        type=str,
+        default="*TeamTempNameSubmission*",
+        help="fnmatch pattern of source files whose allocation sites are reported.",
+    )
+
+    parser.add_argument(
+        "--steady_state",
+        type=int,
+        default=300,
+        help="Frames of the steady-state check run after the game (0 to skip).",
+    )
+
+    parser.add_argument(
+        "--capture_frame",
+        type=int,
+        default=200,
+        help="Game frame whose asteroid field the steady-state check replays.",
+    )
+
+    parser.add_argument(
+        "--max_retained_objects",
+        type=int,
+        default=0,
+        help="Fail if steady-state frames leave more new live objects than this.",
+    )
+
+    parser.add_argument(
+        "--max_held_bytes",
+        type=int,
+        default=16384,
+        help="Fail if a steady-state frame holds more than this many bytes across a stage "
+             "boundary (a constant bound, whatever the asteroid count).",
+    )
+
+    parser.add_argument(
+        "--stress_asteroids",
+        type=int,
+        default=500,
+        help="Also run the steady-state check on a synthetic field of this many asteroids (0 to skip).",
+    )
+
+    parser.add_argument(
+        "--max_churn_per_asteroid",
+        type=float,
+        default=2048.0,
+        help="Fail if mean steady-state transient bytes per asteroid exceed this.",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Write the report as JSON to this path.",
+    )
+
+    args = parser.parse_args()
+
+    selected_scenario = scenarios[args.scenario]
+    logger.info(f"Tracing scenario: {selected_scenario.name}")
+    profiler = AllocationProfiler(
+        FuzzyController(),
+        interval=args.interval,
+        site_filter=args.site_filter,
+        capture_frame=args.capture_frame if args.steady_state > 0 else None,
+    )
+    TrainerEnvironment(settings=game_settings).run(scenario=selected_scenario, controllers=[profiler])
+
+    steady = []
+    if args.steady_state > 0:
+        if profiler.captured is None or not profiler.captured[1]["asteroids"]:
+            logger.warning(f"No asteroids at frame {args.capture_frame}; skipping the steady-state check")
+        else:
+            steady.append(steady_state_check(profiler.controller, *profiler.captured, frames=args.steady_state))
+        if args.stress_asteroids > 0:
+            logger.info(f"Steady-state check on {args.stress_asteroids} synthetic asteroids")
+            steady.append(steady_state_check(
+                FuzzyController(), *make_stress_state(args.stress_asteroids, seed=0), frames=args.steady_state
+            ))
+    tracemalloc.stop()
+
+    report = profiler.report(args.top)
+    print("Frames: ", report["frames"])
+    print(f"Per-frame churn: mean {report['churn_mean_bytes'] / 1024:.1f} KiB, max {report['churn_max_bytes'] / 1024:.1f} KiB")
+    print(f"Retained: {report['retained_total_bytes'] / 1024:.1f} KiB total, {report['retained_per_frame_bytes']:.1f} B per frame")
+    for sample in report["traced_at_snapshot"]:
+        print(f"  frame {sample['frame']:>6}: {sample['bytes'] / 1024:.1f} KiB traced (process-wide)")
+    print("Largest growth between first and last snapshot:")
+    for site in report["top_growth_sites"]:
+        print(f"  {site['site']:<60} {site['size_diff']:>+10} B {site['count_diff']:>+8} blocks")
+
+    failures = []
+    for run in steady:
+        print(f"Steady state ({run['asteroids']} asteroids, {run['frames']} frames): "
+              f"{run['retained_objects']} objects retained, {run['held_max_bytes'] / 1024:.1f} KiB "
+              f"held across stages, churn mean "
+              f"{run['churn_mean_bytes'] / 1024:.1f} KiB ({run['churn_per_asteroid_bytes']:.0f} B per asteroid), "
+              f"max {run['churn_max_bytes'] / 1024:.1f} KiB")
+        print("  peak per stage: " + ", ".join(
+            f"{stage} {size / 1024:.1f} KiB" for stage, size in run["stage_churn_max_bytes"].items()
+        ))
+        if run["held_max_bytes"] > args.max_held_bytes:
+            failures.append(f"{run['held_max_bytes']} B held across stages with {run['asteroids']} "
+                            f"asteroids (limit {args.max_held_bytes})")
+        if run["retained_objects"] > args.max_retained_objects:
+            failures.append(f"{run['retained_objects']} objects retained (limit {args.max_retained_objects})")
+        if run["churn_per_asteroid_bytes"] > args.max_churn_per_asteroid:
+            failures.append(f"{run['churn_per_asteroid_bytes']:.0f} B churn per asteroid "
+                            f"(limit {args.max_churn_per_asteroid:.0f})")
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({"scenario": selected_scenario.name, **report, "steady_state": steady}, f, indent=2)
+
+    if failures:
+        sys.exit("Steady-state allocation check failed: " + "; ".join(failures))
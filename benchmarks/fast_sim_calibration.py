@@ -0,0 +1,147 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+from kesslergame import TrainerEnvironment
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from TeamTempNameSubmission.chromosome import CHROMOSOME_LENGTH, DEFAULT_CHROMOSOME
+from TeamTempNameSubmission.fuzzy_controller import controller_factory
+from scenarios import scenarios
+from training.fast_sim import FastSim
+from training.surrogate import rank_correlation
+from utils import LoggerUtility, LoggingLevel
+
+# Set up the logger
+logger = LoggerUtility(LoggingLevel.INFO).get_logger()
+
+# Headless settings shared by both simulators
+game_settings = {
+    "frequency": 30,  # Dictates both frequency and time_step settings (float)
+    "perf_tracker": False,  # (bool)
+    "prints_on": False,  # (bool)
+    "time_limit": float("inf"),  # (float)
+}
+
+
+def score_both(task):
+    """
+    GA fitness (asteroids_hit - 10·deaths²) of one chromosome on one scenario
+    under TrainerEnvironment and FastSim, with the seconds each took.
+    """
+    chromosome, name, control_interval = task
+    results = []
+    for sim in (TrainerEnvironment(settings=game_settings),
+                FastSim(game_settings, control_interval=control_interval)):
+        start = time.perf_counter()
+        score, _ = sim.run(scenario=scenarios[name],
+                           controllers=[controller_factory(chromosome)()])
+        team = score.teams[0]
+        results.append((team.asteroids_hit - 10 * team.deaths**2,
+                        time.perf_counter() - start))
+    return name, results
+
+
+def calibration_summary(reference, fast, reference_seconds, fast_seconds):
+    """Agreement and speed of FastSim against TrainerEnvironment for one set of runs."""
+    reference, fast = np.asarray(reference, float), np.asarray(fast, float)
+    pearson = (float(np.corrcoef(reference, fast)[0, 1])
+               if reference.std() > 0 and fast.std() > 0 else float("nan"))
+    return {
+        "runs": len(reference),
+        "pearson": pearson,
+        "spearman": rank_correlation(fast, reference),
+        "mae": float(np.abs(fast - reference).mean()),
+        "exact": float(np.mean(fast == reference)),
+        "reference_s": float(np.mean(reference_seconds)),
+        "fast_s": float(np.mean(fast_seconds)),
+        "speedup": float(np.sum(reference_seconds) / np.sum(fast_seconds)),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare FastSim fitness against TrainerEnvironment on random chromosomes"
+    )
+
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=scenarios.keys(),
+        default=["training1", "training2", "training3"],
+        help="Scenarios to calibrate on (seeded or fully specified ones compare best).",
+    )
+
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=20,
+        help="Chromosomes to score: the default one plus random ones.",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the random chromosomes.",
+    )
+
+    parser.add_argument(
+        "--control_interval",
+        type=int,
+        default=1,
+        help="FastSim frames between controller calls.",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Worker processes.",
+    )
+
+    parser.add_argument(
+        "--json",
+        type=str,
+        default=None,
+        help="Write the summaries to this JSON file.",
+    )
+
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    chromosomes = [DEFAULT_CHROMOSOME] + [
+        rng.integers(0, 10, CHROMOSOME_LENGTH) / 10.0 for _ in range(args.samples - 1)
+    ]
+    tasks = [(c, name, args.control_interval) for c in chromosomes for name in args.scenarios]
+    logger.info(f"Scoring {len(chromosomes)} chromosomes on {len(args.scenarios)} scenarios "
+                f"(control interval {args.control_interval})")
+
+    with multiprocessing.Pool(args.workers) as pool:
+        results = pool.map(score_both, tasks, chunksize=1)
+
+    # Rows in chromosome order: reference fitness, seconds, fast fitness, seconds
+    per_scenario = {name: [] for name in args.scenarios}
+    for name, ((ref, ref_s), (fast, fast_s)) in results:
+        per_scenario[name].append((ref, ref_s, fast, fast_s))
+    per_scenario = {name: np.array(rows) for name, rows in per_scenario.items()}
+    # Fitness summed over scenarios, as the GA sees it
+    per_scenario["total"] = sum(per_scenario.values())
+    summaries = {name: calibration_summary(rows[:, 0], rows[:, 2], rows[:, 1], rows[:, 3])
+                 for name, rows in per_scenario.items()}
+
+    print(f"{'scenario':<12} {'runs':>5} {'pearson':>8} {'spearman':>9} {'mae':>8} "
+          f"{'exact':>6} {'ref s':>7} {'fast s':>7} {'speedup':>8}")
+    for name, s in summaries.items():
+        print(f"{name:<12} {s['runs']:>5} {s['pearson']:>8.3f} {s['spearman']:>9.3f} "
+              f"{s['mae']:>8.1f} {s['exact']:>6.0%} {s['reference_s']:>7.2f} "
+              f"{s['fast_s']:>7.2f} {s['speedup']:>7.2f}x")
+
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(summaries, f, indent=2)
@@ -0,0 +1,210 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from TeamTempNameSubmission import fuzzy_trees as ft
+from TeamTempNameSubmission import vector_math as vm
+from TeamTempNameSubmission.bullet_tracker import predict_doomed
+from TeamTempNameSubmission.collision_forecast import forecast_collisions
+from TeamTempNameSubmission.escape_heading import escape_heading
+from TeamTempNameSubmission.shot_planner import intercept_angles, plan_shots
+from TeamTempNameSubmission.spatial_index import ToroidalGrid
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "micro_baseline.json")
+
+
+def machine_info() -> Dict[str, str]:
+    """Interpreter, NumPy and hardware a set of timings was taken on."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+    }
+
+
+def build_cases(seed: int = 0) -> Dict[str, Tuple[Callable, tuple]]:
+    """
+    Representative inputs for every primitive, keyed by benchmark name.
+
+    Scalar kernels get one typical call; list and array kernels are timed at
+    a training-sized (16) and a dense (256) asteroid count.
+
+    Args:
+        seed (int): Seed for the generated inputs.
+
+    Returns:
+        Dict[str, Tuple[Callable, tuple]]: The function and its arguments for each case.
+    """
+    rng = np.random.default_rng(seed)
+    ship = (500.0, 400.0)
+    map_size = (1000.0, 800.0)
+    ast_pos = (712.5, 233.0)
+    ast_vel = (-41.0, 87.5)
+    turn_range = (-180.0, 180.0)
+    dt = 1.0 / 30.0
+
+    centers = [0.3, 0.6]
+    mfs = ft.build_triangles(centers)
+    rules = rng.uniform(0.0, 1.0, size=(4, 4)).tolist()
+
+    cases: Dict[str, Tuple[Callable, tuple]] = {
+        "vector_math._calc_intercept_angle": (vm._calc_intercept_angle, (ship, 800.0, ast_pos, ast_vel)),
+        "vector_math.heading_relative_angle": (vm.heading_relative_angle, (ship, 90.0, ast_pos)),
+        "vector_math.turn_angle": (vm.turn_angle, (ship, 90.0, turn_range, 800.0, ast_pos, ast_vel, dt)),
+        "vector_math.heading_and_speed_to_velocity": (vm.heading_and_speed_to_velocity, (37.0, 120.0)),
+        "vector_math.calculate_closure_rate": (vm.calculate_closure_rate, (ship, 37.0, 120.0, ast_pos, ast_vel)),
+        "vector_math.calculate_if_collide": (vm.calculate_if_collide, (ship, 37.0, 120.0, 20.0, ast_pos, ast_vel, 32.0)),
+        "vector_math.distance_to": (vm.distance_to, ((212.5, -167.0),)),
+        "vector_math.go_to_angle": (vm.go_to_angle, (90.0, turn_range, 143.0, dt)),
+        "vector_math.speed_to_thrust": (vm.speed_to_thrust, (80.0, 150.0)),
+        "fuzzy_trees.triangular_mf": (ft.triangular_mf, (0.42, 0.3, 0.6, 1.0)),
+        "fuzzy_trees.build_triangles": (ft.build_triangles, (centers,)),
+        "fuzzy_trees.tsk_inference_const": (ft.tsk_inference_const, (0.42, 0.77, mfs, mfs, rules)),
+    }
+
+    # A few bullets in flight from the ship, as predict_doomed sees them
+    bullets = [
+        {"position": ship, "velocity": (800.0 * np.cos(a), 800.0 * np.sin(a))}
+        for a in rng.uniform(0.0, 2.0 * np.pi, size=8)
+    ]
+
+    for n in (16, 256):
+        positions = [tuple(p) for p in rng.uniform((0.0, 0.0), map_size, size=(n, 2))]
+        relative = [(x - ship[0], y - ship[1]) for x, y in positions]
+        bearings = rng.uniform(0.0, 1.0, size=n).tolist()
+        rel_arr = np.asarray(relative)
+        vel_arr = rng.uniform(-120.0, 120.0, size=(n, 2))
+        velocities = vel_arr.tolist()
+        radii = rng.choice([8.0, 16.0, 24.0, 32.0], size=n).tolist()
+        distances = np.hypot(rel_arr[:, 0], rel_arr[:, 1]).tolist()
+        grid = ToroidalGrid(map_size)
+        grid.rebuild(positions)
+        # The controller plans over its top 8 unshot asteroids
+        m = min(n, 8)
+        cases[f"vector_math.game_to_ship_frame[{n}]"] = (vm.game_to_ship_frame, (ship, positions, map_size))
+        cases[f"vector_math.sort_by_distance[{n}]"] = (vm.sort_by_distance, (relative,))
+        cases[f"vector_math.largest_gap_center[{n}]"] = (vm.largest_gap_center, (bearings,))
+        cases[f"fuzzy_trees.triangular_mf[{n}]"] = (ft.triangular_mf, (rng.uniform(0.0, 1.0, size=n), 0.3, 0.6, 1.0))
+        cases[f"shot_planner.intercept_angles[{n}]"] = (intercept_angles, (800.0, rel_arr, vel_arr))
+        cases[f"shot_planner.plan_shots[{n}]"] = (
+            plan_shots, (90.0, 180.0, 0.1, 800.0, list(range(m)), relative[:m], velocities[:m], bearings[:m]))
+        cases[f"collision_forecast.forecast_collisions[{n}]"] = (
+            forecast_collisions, (ship, (60.0, -25.0), 20.0, positions, velocities, radii, map_size, 1.0))
+        cases[f"bullet_tracker.predict_doomed[{n}]"] = (
+            predict_doomed, (bullets, positions, velocities, radii, map_size))
+        cases[f"escape_heading.escape_heading[{n}]"] = (
+            escape_heading, (relative, distances, radii, bearings, bearings, 90.0))
+        cases[f"spatial_index.ToroidalGrid.query[{n}]"] = (grid.query, (ship, 300.0))
+
+    return cases
+
+
+def time_case(func: Callable, args: tuple, repeat: int, min_time: float) -> float:
+    """
+    Best-of-`repeat` nanoseconds per call.
+
+    Args:
+        func (Callable): The kernel.
+        args (tuple): Its arguments.
+        repeat (int): Number of timed batches.
+        min_time (float): Seconds each batch should take at least.
+
+    Returns:
+        float: The fastest batch's time per call in nanoseconds.
+    """
+    timer = timeit.Timer(lambda: func(*args))
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the controller's kernels against a stored baseline"
+    )
+
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON to compare against (and to write with --save).",
+    )
+
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Store this run as the new baseline.",
+    )
+
+    parser.add_argument(
+        "--filter",
+        type=str,
+        default=None,
+        help="Only run benchmarks whose name contains this string.",
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown beyond which a kernel is reported as a regression.",
+    )
+
+    parser.add_argument("--repeat", type=int, default=5, help="Timed batches per kernel.")
+
+    parser.add_argument(
+        "--min_time",
+        type=float,
+        default=0.05,
+        help="Minimum seconds per timed batch.",
+    )
+
+    args = parser.parse_args()
+
+    baseline: Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        baseline = stored["results_ns"]
+        recorded = stored.get("machine", {})
+        differs = {k: (recorded.get(k), v) for k, v in machine_info().items() if recorded.get(k) != v}
+        if differs:
+            print("Baseline was recorded on a different setup; timings are not comparable:")
+            for key, (old, new) in differs.items():
+                print(f"  {key}: {old} (baseline) vs {new} (this run)")
+
+    results: Dict[str, float] = {}
+    regressions = []
+    print(f"{'benchmark':<44} {'ns/call':>12} {'baseline':>12} {'change':>8}")
+    for name, (func, call_args) in build_cases().items():
+        if args.filter is not None and args.filter not in name:
+            continue
+        ns = time_case(func, call_args, args.repeat, args.min_time)
+        results[name] = ns
+        if name in baseline:
+            change = ns / baseline[name] - 1.0
+            flag = "  <-- slower" if change > args.threshold else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:<44} {ns:>12.1f} {baseline[name]:>12.1f} {change:>+8.1%}{flag}")
+        else:
+            print(f"{name:<44} {ns:>12.1f} {'-':>12} {'-':>8}")
+
+    if baseline:
+        print(f"{len(regressions)} kernel(s) more than {args.threshold:.0%} slower than the baseline.")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": machine_info(), "results_ns": {**baseline, **results}}, f, indent=2)
+        print("Baseline written to: ", args.baseline)
@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+from kesslergame import TrainerEnvironment
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from TeamTempNameSubmission.fuzzy_controller import FuzzyController
+from scenarios import scenarios
+from utils import LoggerUtility, LoggingLevel
+from utils.frame_log import FrameLog, RecordingController, replay
+
+# Set up the logger
+logger = LoggerUtility(LoggingLevel.INFO).get_logger()
+
+# Headless settings used when recording
+game_settings = {
+    "frequency": 30,  # Dictates both frequency and time_step settings (float)
+    "perf_tracker": False,  # (bool)
+    "prints_on": False,  # (bool)
+    "realtime_multiplier": 0,  # (float)
+    "time_limit": float("inf"),  # (float)
+    "random_ast_splits": False,  # (bool)
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Record a scenario's controller inputs and replay them without the game engine"
+    )
+
+    parser.add_argument(
+        "--record",
+        choices=scenarios.keys(),
+        type=str,
+        default=None,
+        help="Play this scenario once and record every actions() call to --log.",
+    )
+
+    parser.add_argument(
+        "--log",
+        type=str,
+        required=True,
+        help="Frame log to write (with --record) and replay.",
+    )
+
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Number of replays, each with a fresh controller.",
+    )
+
+    args = parser.parse_args()
+
+    if args.record is not None:
+        selected_scenario = scenarios[args.record]
+        logger.info(f"Recording scenario: {selected_scenario.name}")
+        recording = RecordingController(FuzzyController())
+        TrainerEnvironment(settings=game_settings).run(
+            scenario=selected_scenario, controllers=[recording]
+        )
+        recording.recorder.save(args.log, scenario=selected_scenario.name)
+        logger.info(f"Wrote {len(recording.recorder)} frames to {args.log}")
+
+    log = FrameLog(args.log)
+    logger.info(f"Replaying {len(log)} frames from {args.log}")
+
+    for run in range(args.repeats):
+        result = replay(FuzzyController(), log)
+        latency_us = result["latency_ns"] / 1e3
+        print(
+            f"Run {run}: mean {latency_us.mean():.1f} us, "
+            f"p50 {np.percentile(latency_us, 50):.1f} us, "
+            f"p99 {np.percentile(latency_us, 99):.1f} us, "
+            f"max {latency_us.max():.1f} us, "
+            f"action mismatches {result['mismatches']}"
+        )
@@ -0,0 +1,174 @@
+import argparse
+import json
+import os
+import sys
+from typing import Optional
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from TeamTempNameSubmission.fuzzy_controller import TIMED_STAGES, FuzzyController
+from utils import LoggerUtility, LoggingLevel, StageTimer
+from utils.synthetic_states import advance_state, make_stress_state
+
+# Set up the logger
+logger = LoggerUtility(LoggingLevel.INFO).get_logger()
+
+# Log-log slope above which a stage is reported as superlinear in asteroid count
+SUPERLINEAR_SLOPE = 1.25
+
+
+def measure(
+    n_asteroids: int,
+    frames: int,
+    warmup: int,
+    density: float,
+    seed: int,
+    time_budget: Optional[float] = None,
+) -> dict:
+    """
+    Mean per-stage latency of a fresh controller over a synthetic game.
+
+    Args:
+        n_asteroids (int): Asteroids in the synthetic state.
+        frames (int): Measured frames.
+        warmup (int): Frames run before measuring (the first one initializes the controller).
+        density (float): Asteroids per 1e6 square units.
+        seed (int): Seed for the synthetic state.
+        time_budget (Optional[float]): Per-frame deadline passed to the controller.
+
+    Returns:
+        dict: Mean microseconds per stage, plus "frame" for the whole call.
+    """
+    ship_state, game_state = make_stress_state(n_asteroids, density=density, seed=seed)
+    controller = FuzzyController(time_budget=time_budget, profile_stages=True)
+    for _ in range(warmup):
+        controller.actions(ship_state, game_state)
+        game_state = advance_state(game_state)
+
+    controller.stage_timer = StageTimer(TIMED_STAGES)
+    for _ in range(frames):
+        controller.actions(ship_state, game_state)
+        game_state = advance_state(game_state)
+    stages = controller.stage_timer.summary()["stages"]
+    return {name: stats["total_ms"] * 1e3 / frames for name, stats in stages.items()}
+
+
+def fit_slopes(counts: list, results: list, min_count: int) -> dict:
+    """
+    Fit latency ~ c * n^k per stage on a log-log scale.
+
+    Args:
+        counts (list): Asteroid counts that were measured.
+        results (list): `measure` output for each count.
+        min_count (int): Smallest count used in the fit, so fixed per-frame
+            overhead at tiny counts does not flatten the curve.
+
+    Returns:
+        dict: Fitted exponent k per stage (None if too few usable points).
+    """
+    slopes = {}
+    for stage in results[0]:
+        xs, ys = [], []
+        for n, res in zip(counts, results):
+            if n >= min_count and res[stage] > 0.0:
+                xs.append(np.log(n))
+                ys.append(np.log(res[stage]))
+        slopes[stage] = float(np.polyfit(xs, ys, 1)[0]) if len(xs) >= 2 else None
+    return slopes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="FuzzyController latency versus asteroid count on synthetic states"
+    )
+
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[10, 20, 50, 100, 200, 500, 1000, 2000, 5000],
+        help="Asteroid counts to measure.",
+    )
+
+    parser.add_argument(
+        "--frame_work",
+        type=int,
+        default=5000,
+        help="Measured frames per count are frame_work / count, clamped to [3, 30].",
+    )
+
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=20.0,
+        help="Asteroids per 1e6 square units (the map grows with the count).",
+    )
+
+    parser.add_argument(
+        "--fit_min",
+        type=int,
+        default=100,
+        help="Smallest count included in the scaling fit.",
+    )
+
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic state seed.")
+
+    parser.add_argument(
+        "--time_budget",
+        type=float,
+        default=None,
+        help="Per-frame deadline in seconds for the controller (default: none).",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Write the measurements and fitted exponents as JSON to this path.",
+    )
+
+    args = parser.parse_args()
+
+    results = []
+    for n in args.counts:
+        frames = int(np.clip(args.frame_work // n, 3, 30))
+        logger.info(f"Measuring {n} asteroids over {frames} frames")
+        results.append(measure(
+            n, frames, warmup=2, density=args.density, seed=args.seed,
+            time_budget=args.time_budget,
+        ))
+
+    stages = list(results[0])
+    slopes = fit_slopes(args.counts, results, args.fit_min)
+
+    header = f"{'asteroids':>9} " + " ".join(f"{s:>11}" for s in stages)
+    print(header)
+    for n, res in zip(args.counts, results):
+        print(f"{n:>9} " + " ".join(f"{res[s]:>11.1f}" for s in stages))
+    print("(mean microseconds per frame)")
+    print(f"{'exponent':>9} " + " ".join(
+        f"{slopes[s]:>11.2f}" if slopes[s] is not None else f"{'-':>11}" for s in stages
+    ))
+
+    superlinear = [s for s in stages if slopes[s] is not None and slopes[s] > SUPERLINEAR_SLOPE]
+    if superlinear:
+        print("Superlinear stages: " + ", ".join(f"{s} (n^{slopes[s]:.2f})" for s in superlinear))
+    else:
+        print("No superlinear stages.")
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "counts": args.counts,
+                    "density": args.density,
+                    "time_budget": args.time_budget,
+                    "mean_us": dict(zip(map(str, args.counts), results)),
+                    "exponents": slopes,
+                    "superlinear": superlinear,
+                },
+                f,
+                indent=2,
+            )
@@ -9,7 +9,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from TeamTempNameSubmission.fuzzy_controller import FuzzyController
 from scenarios import scenarios
-from utils import LoggerUtility, LoggingLevel
+from utils import LoggerUtility, LoggingLevel, report_latency
 
 # Set up the logger
 logger = LoggerUtility(LoggingLevel.DEBUG).get_logger()
@@ -54,6 +54,27 @@ if __name__ == "__main__":
         help="The type of game to run. KesslerGame for visualization, TrainerEnvironment for max-speed, no-graphics simulation.",
     )
 
+    parser.add_argument(
+        "--budget_ms",
+        type=float,
+        default=1000.0 / game_settings["frequency"],
+        help="Per-frame controller budget in milliseconds for the latency report.",
+    )
+
+    parser.add_argument(
+        "--perf_json",
+        type=str,
+        default=None,
+        help="Write the controller latency percentiles as JSON to this path.",
+    )
+
+    parser.add_argument(
+        "--stage_times",
+        type=str,
+        default=None,
+        help="Record per-stage controller timings and write them as JSON to this path.",
+    )
+
     args = parser.parse_args()
 
     selected_scenario: Scenario = scenarios[args.scenario]
@@ -67,8 +88,9 @@ if __name__ == "__main__":
     logger.info(f"Running scenario: {selected_scenario.name}")
     initial_time = time.perf_counter()
 
+    controller = FuzzyController(profile_stages=args.stage_times is not None)
     score, perf_data = game.run(
-        scenario=selected_scenario, controllers=[FuzzyController()]
+        scenario=selected_scenario, controllers=[controller]
     )
 
     print("Total scenario eval time: ", str(time.perf_counter() - initial_time))
@@ -77,3 +99,13 @@ if __name__ == "__main__":
     print("Deaths: ", str([team.deaths for team in score.teams]))
     print("Accuracy: ", str([team.accuracy for team in score.teams]))
     print("Mean eval time: ", str([team.mean_eval_time for team in score.teams]))
+
+    report_latency(
+        {selected_scenario.name: perf_data},
+        budget=args.budget_ms / 1000.0,
+        json_path=args.perf_json,
+    )
+
+    if controller.stage_timer is not None:
+        controller.stage_timer.to_json(args.stage_times, scenario=selected_scenario.name)
+        print("Stage timings written to: ", args.stage_times)
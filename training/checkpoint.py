@@ -0,0 +1,63 @@
+import os
+import pickle
+import random
+import tempfile
+from typing import Any, Dict
+
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, **state: Any) -> None:
+    """
+    Atomically write GA state plus the Python and NumPy RNG states to `path`.
+
+    The pickle is written to a temporary file in the same directory, flushed
+    to disk and then renamed over `path`, so a crash mid-write leaves the
+    previous checkpoint intact.
+
+    Args:
+        path (str): Checkpoint file.
+        **state: Picklable GA state (population, counters, ...).
+    """
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "python_random": random.getstate(),
+        "numpy_random": np.random.get_state(),
+        "state": state,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """
+    Read a checkpoint and restore the RNG states it captured.
+
+    Args:
+        path (str): Checkpoint file written by `save_checkpoint`.
+
+    Returns:
+        Dict[str, Any]: The GA state that was saved.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version.
+    """
+    with open(path, "rb") as f:
+        payload = pickle.load(f)
+    if payload.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}: {payload.get('version')}")
+    random.setstate(payload["python_random"])
+    np.random.set_state(payload["numpy_random"])
+    return payload["state"]
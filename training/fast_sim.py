@@ -0,0 +1,410 @@
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from immutabledict import immutabledict
+from kesslergame import KesslerController, Scenario
+from kesslergame.kessler_game import StopReason
+from kesslergame.score import Score
+
+# Physical constants of kesslergame 2.x ships, bullets and asteroids
+SHIP_RADIUS = 20.0
+SHIP_MASS = 300.0
+SHIP_MAX_SPEED = 240.0
+SHIP_DRAG = 80.0
+THRUST_RANGE = (-480.0, 480.0)
+TURN_RATE_RANGE = (-180.0, 180.0)
+FIRE_TIME = 1 / 10
+RESPAWN_TIME = 3.0
+BULLET_SPEED = 800.0
+BULLET_LENGTH = 12.0
+BULLET_MASS = 1.0
+SPLIT_ANGLE = 15.0  # Half of the game's 30 degree split bound (non-random splits)
+
+
+def segment_hits(
+    heads: np.ndarray, tails: np.ndarray, centers: np.ndarray, radii: np.ndarray
+) -> np.ndarray:
+    """
+    Which bullet segments touch which circles, for all pairs at once.
+
+    Mirrors `kesslergame.collisions.circle_line_collision`: a bounding-box
+    reject followed by the Heron's-formula distance from the circle center
+    to the segment's line.
+
+    Args:
+        heads (np.ndarray): (B, 2) bullet head positions.
+        tails (np.ndarray): (B, 2) bullet tail positions.
+        centers (np.ndarray): (N, 2) circle centers.
+        radii (np.ndarray): (N,) circle radii.
+
+    Returns:
+        np.ndarray: (B, N) boolean hit matrix.
+    """
+    lo = np.minimum(heads, tails)[:, None, :] - radii[None, :, None]
+    hi = np.maximum(heads, tails)[:, None, :] + radii[None, :, None]
+    c = centers[None, :, :]
+    in_box = ((c >= lo) & (c <= hi)).all(axis=2)
+    if not in_box.any():
+        return in_box
+
+    a = np.hypot(*(heads[:, None, :] - c).transpose(2, 0, 1))
+    b = np.hypot(*(tails[:, None, :] - c).transpose(2, 0, 1))
+    length = np.hypot(*(heads - tails).T)[:, None]
+    s = 0.5 * (a + b + length)
+    height = 2.0 / length * np.sqrt(np.maximum(0.0, s * (s - a) * (s - b) * (s - length)))
+    return in_box & (height < radii[None, :])
+
+
+def split_asteroid(
+    position: Sequence[float],
+    velocity: Sequence[float],
+    size: int,
+    impactor_velocity: Sequence[float],
+    impactor_mass: float,
+) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]], List[int]]:
+    """
+    Children of an asteroid destroyed by a bullet or ship.
+
+    The impact is perfectly inelastic; the three children continue along
+    the merged velocity and ±SPLIT_ANGLE off it, as the game does with
+    `random_ast_splits` off.
+
+    Returns:
+        Tuple[List[Tuple[float, float]], List[Tuple[float, float]], List[int]]:
+            Child positions, velocities and sizes (empty for size 1).
+    """
+    if size == 1:
+        return [], [], []
+    radius = size * 8.0
+    mass = 0.25 * math.pi * radius * radius
+    vfx = (1 / (impactor_mass + mass)) * (impactor_mass * impactor_velocity[0] + mass * velocity[0])
+    vfy = (1 / (impactor_mass + mass)) * (impactor_mass * impactor_velocity[1] + mass * velocity[1])
+    v = math.sqrt(vfx * vfx + vfy * vfy)
+    theta = math.degrees(math.atan2(vfy, vfx))
+    velocities = [
+        (v * math.cos(math.radians(angle)), v * math.sin(math.radians(angle)))
+        for angle in (theta + SPLIT_ANGLE, theta, theta - SPLIT_ANGLE)
+    ]
+    position = (float(position[0]), float(position[1]))
+    return [position] * 3, velocities, [size - 1] * 3
+
+
+class FastSim:
+    """
+    Array-backed stand-in for `TrainerEnvironment` for low-fidelity screening.
+
+    Asteroids, bullets and ships are kept in NumPy arrays: motion, wrap-around,
+    bullet culling and all collision tests are vectorized, and only actual
+    hits are resolved one by one (in the game's order, so a later bullet can
+    hit a child spawned earlier in the same frame). Ship dynamics, firing,
+    respawn invulnerability, splitting and stop conditions follow
+    kesslergame 2.x, and controllers receive the same `ship_state` /
+    `game_state` dictionaries, so any `KesslerController` can be driven.
+
+    Mines are not simulated. `control_interval` > 1 calls controllers only
+    every that many frames and holds their last actions in between, trading
+    fidelity for speed.
+
+    Args:
+        settings (Optional[Dict[str, Any]]): Game settings; `frequency`,
+            `perf_tracker` and `time_limit` are used.
+        control_interval (int): Frames between controller calls.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None, control_interval: int = 1):
+        settings = settings or {}
+        self.time_step = 1 / settings.get("frequency", 30.0)
+        self.perf_tracker = settings.get("perf_tracker", False)
+        self.time_limit = settings.get("time_limit", float("inf"))
+        self.control_interval = control_interval
+
+    def run(
+        self, scenario: Scenario, controllers: List[KesslerController]
+    ) -> Tuple[Score, List[Dict[str, Any]]]:
+        """
+        Play `scenario` to the end.
+
+        Args:
+            scenario (Scenario): Any scenario from `scenarios.py`.
+            controllers (List[KesslerController]): One controller per ship.
+
+        Returns:
+            Tuple[Score, List[Dict[str, Any]]]: A kesslergame `Score` with
+                per-team hits, shots, deaths and lives filled in, and per-frame
+                `controller_times` if `perf_tracker` is set.
+
+        Raises:
+            ValueError: If a ship starts with mines.
+        """
+        dt = self.time_step
+        width, height = scenario.map_size
+        time_limit = scenario.time_limit if scenario.time_limit else self.time_limit
+
+        # --- Asteroids (built by the scenario itself, honouring its seed) ---
+        initial = scenario.asteroids()
+        ast_pos = np.array([a.position for a in initial], dtype=float).reshape(-1, 2)
+        ast_vel = np.array([a.velocity for a in initial], dtype=float).reshape(-1, 2)
+        ast_size = np.array([a.size for a in initial], dtype=int)
+
+        # --- Ships ---
+        ships = scenario.ships()
+        if any(ship.mines_remaining != 0 for ship in ships):
+            raise ValueError(f"FastSim does not simulate mines (scenario {scenario.name})")
+        n_ships = len(ships)
+        ship_ids = [ship.id for ship in ships]
+        ship_teams = [ship.team for ship in ships]
+        pos = np.array([ship.position for ship in ships], dtype=float)
+        vel = np.zeros((n_ships, 2))
+        speed = np.zeros(n_ships)
+        heading = np.array([ship.heading for ship in ships], dtype=float)
+        lives = np.array([ship.lives for ship in ships], dtype=int)
+        deaths = np.zeros(n_ships, dtype=int)
+        respawn = np.zeros(n_ships)
+        fire_limiter = np.zeros(n_ships)
+        bullets_remaining = np.array([ship.bullets_remaining for ship in ships], dtype=int)
+        shots = np.zeros(n_ships, dtype=int)
+        bullets_hit = np.zeros(n_ships, dtype=int)
+        asteroids_hit = np.zeros(n_ships, dtype=int)
+        thrust = np.zeros(n_ships)
+        turn_rate = np.zeros(n_ships)
+        fire = np.zeros(n_ships, dtype=bool)
+
+        # --- Bullets ---
+        b_pos = np.empty((0, 2))
+        b_tail = np.empty((0, 2))
+        b_vel = np.empty((0, 2))
+        b_heading = np.empty(0)
+        b_owner = np.empty(0, dtype=int)
+
+        for controller, ship_id in zip(controllers, ship_ids):
+            controller.ship_id = ship_id
+
+        def ship_state(i: int) -> Dict[str, Any]:
+            return {
+                "is_respawning": bool(respawn[i] != 0.0),
+                "position": (float(pos[i, 0]), float(pos[i, 1])),
+                "velocity": (float(vel[i, 0]), float(vel[i, 1])),
+                "speed": float(speed[i]),
+                "heading": float(heading[i]),
+                "mass": SHIP_MASS,
+                "radius": SHIP_RADIUS,
+                "id": ship_ids[i],
+                "team": str(ship_teams[i]),
+                "lives_remaining": int(lives[i]),
+            }
+
+        perf_list: List[Dict[str, Any]] = []
+        stop_reason = StopReason.not_stopped
+        sim_time = 0.0
+        step = 0
+        while stop_reason == StopReason.not_stopped:
+            live = lives > 0
+
+            # --- Controllers ---
+            controller_times = [0.0] * n_ships
+            if step % self.control_interval == 0:
+                radii = ast_size * 8.0
+                game_state = immutabledict({
+                    "asteroids": [
+                        {"position": p, "velocity": v, "size": s, "mass": 0.25 * math.pi * r * r, "radius": r}
+                        for p, v, s, r in zip(
+                            map(tuple, ast_pos.tolist()), map(tuple, ast_vel.tolist()),
+                            ast_size.tolist(), radii.tolist(),
+                        )
+                    ],
+                    "ships": [ship_state(i) for i in range(n_ships) if live[i]],
+                    "bullets": [
+                        {"position": p, "velocity": v, "heading": h, "mass": BULLET_MASS}
+                        for p, v, h in zip(
+                            map(tuple, b_pos.tolist()), map(tuple, b_vel.tolist()), b_heading.tolist()
+                        )
+                    ],
+                    "mines": [],
+                    "map_size": scenario.map_size,
+                    "time": sim_time,
+                    "delta_time": dt,
+                    "sim_frame": step,
+                    "time_limit": time_limit,
+                })
+                for i in range(n_ships):
+                    if not live[i]:
+                        continue
+                    own_state = {
+                        **ship_state(i),
+                        "bullets_remaining": int(bullets_remaining[i]),
+                        "mines_remaining": 0,
+                        "can_fire": bool(fire_limiter[i] == 0.0 and bullets_remaining[i] != 0),
+                        "fire_rate": 1 / FIRE_TIME,
+                        "can_deploy_mine": False,
+                        "mine_deploy_rate": 1.0,
+                        "thrust_range": THRUST_RANGE,
+                        "turn_rate_range": TURN_RATE_RANGE,
+                        "max_speed": SHIP_MAX_SPEED,
+                        "drag": SHIP_DRAG,
+                    }
+                    t_start = time.perf_counter()
+                    thrust[i], turn_rate[i], fire[i], _ = controllers[i].actions(own_state, game_state)
+                    controller_times[i] = time.perf_counter() - t_start
+            if self.perf_tracker:
+                perf_list.append({"controller_times": controller_times})
+
+            # --- Motion ---
+            b_pos = b_pos + b_vel * dt
+            b_tail = b_tail + b_vel * dt
+            ast_pos = ast_pos + ast_vel * dt
+
+            # Firing uses the pose from before this frame's ship update
+            firing = live & fire & (fire_limiter == 0.0) & (bullets_remaining != 0)
+            if firing.any():
+                rad = np.radians(heading[firing])
+                direction = np.column_stack((np.cos(rad), np.sin(rad)))
+                head = pos[firing] + SHIP_RADIUS * direction
+                b_pos = np.vstack((b_pos, head))
+                b_tail = np.vstack((b_tail, head - BULLET_LENGTH * direction))
+                b_vel = np.vstack((b_vel, BULLET_SPEED * direction))
+                b_heading = np.concatenate((b_heading, heading[firing]))
+                b_owner = np.concatenate((b_owner, np.flatnonzero(firing)))
+                respawn[firing] = 0.0
+                fire_limiter[firing] = FIRE_TIME
+                bullets_remaining[firing & (bullets_remaining > 0)] -= 1
+                shots[firing] += 1
+
+            respawn = np.where(live & (respawn > 0.0), respawn - dt, np.where(live, 0.0, respawn))
+            fire_limiter = np.where(live & (fire_limiter != 0.0), fire_limiter - dt, fire_limiter)
+            fire_limiter[live & (fire_limiter <= 0.00000000001)] = 0.0
+
+            drag = SHIP_DRAG * dt
+            new_speed = np.where(drag > np.abs(speed), 0.0, speed - drag * np.sign(speed))
+            new_speed += np.clip(thrust, *THRUST_RANGE) * dt
+            new_speed = np.clip(new_speed, -SHIP_MAX_SPEED, SHIP_MAX_SPEED)
+            new_heading = (heading + np.clip(turn_rate, *TURN_RATE_RANGE) * dt) % 360.0
+            rad = np.radians(new_heading)
+            new_vel = np.column_stack((np.cos(rad) * new_speed, np.sin(rad) * new_speed))
+            speed = np.where(live, new_speed, speed)
+            heading = np.where(live, new_heading, heading)
+            vel = np.where(live[:, None], new_vel, vel)
+            pos = np.where(live[:, None], pos + new_vel * dt, pos)
+
+            # Cull bullets past the map edge, then wrap ships and asteroids
+            inside = ((b_pos[:, 0] >= 0.0) & (b_pos[:, 0] <= width)
+                      & (b_pos[:, 1] >= 0.0) & (b_pos[:, 1] <= height))
+            if not inside.all():
+                b_pos, b_tail, b_vel = b_pos[inside], b_tail[inside], b_vel[inside]
+                b_heading, b_owner = b_heading[inside], b_owner[inside]
+            pos[live] %= (width, height)
+            ast_pos %= (width, height)
+
+            # --- Bullet-asteroid collisions ---
+            removed = np.zeros(len(ast_size), dtype=bool)
+            if len(b_pos) and len(ast_size):
+                hits = segment_hits(b_pos, b_tail, ast_pos, ast_size * 8.0)
+                spent = np.zeros(len(b_pos), dtype=bool)
+                n_checked = len(ast_size)
+                for k in range(len(b_pos)):
+                    if n_checked == len(ast_size) and not hits[k].any():
+                        continue
+                    # Children spawned earlier this frame are checked too
+                    if n_checked < len(ast_size):
+                        extra = segment_hits(b_pos[k:k + 1], b_tail[k:k + 1],
+                                             ast_pos[n_checked:], ast_size[n_checked:] * 8.0)[0]
+                        row = np.concatenate((hits[k], extra))
+                    else:
+                        row = hits[k]
+                    candidates = np.flatnonzero(row & ~removed)
+                    if not len(candidates):
+                        continue
+                    j = candidates[0]
+                    owner = b_owner[k]
+                    asteroids_hit[owner] += 1
+                    bullets_hit[owner] += 1
+                    spent[k] = True
+                    removed[j] = True
+                    c_pos, c_vel, c_size = split_asteroid(
+                        ast_pos[j], ast_vel[j], ast_size[j], b_vel[k], BULLET_MASS)
+                    if c_size:
+                        ast_pos = np.vstack((ast_pos, c_pos))
+                        ast_vel = np.vstack((ast_vel, c_vel))
+                        ast_size = np.concatenate((ast_size, c_size))
+                        removed = np.concatenate((removed, np.zeros(len(c_size), dtype=bool)))
+                if spent.any():
+                    keep = ~spent
+                    b_pos, b_tail, b_vel = b_pos[keep], b_tail[keep], b_vel[keep]
+                    b_heading, b_owner = b_heading[keep], b_owner[keep]
+
+            # --- Ship-asteroid collisions ---
+            for i in range(n_ships):
+                if not live[i] or respawn[i] != 0.0 or not len(ast_size):
+                    continue
+                d = pos[i] - ast_pos
+                reach = SHIP_RADIUS + ast_size * 8.0
+                touching = ((np.abs(d) <= reach[:, None]).all(axis=1)
+                            & ((d * d).sum(axis=1) <= reach * reach) & ~removed)
+                candidates = np.flatnonzero(touching)
+                if not len(candidates):
+                    continue
+                j = candidates[0]
+                removed[j] = True
+                c_pos, c_vel, c_size = split_asteroid(
+                    ast_pos[j], ast_vel[j], ast_size[j], vel[i], SHIP_MASS)
+                if c_size:
+                    ast_pos = np.vstack((ast_pos, c_pos))
+                    ast_vel = np.vstack((ast_vel, c_vel))
+                    ast_size = np.concatenate((ast_size, c_size))
+                    removed = np.concatenate((removed, np.zeros(len(c_size), dtype=bool)))
+                asteroids_hit[i] += 1
+                self._destruct(i, lives, deaths, respawn, speed, vel)
+            if removed.any():
+                keep = ~removed
+                ast_pos, ast_vel, ast_size = ast_pos[keep], ast_vel[keep], ast_size[keep]
+
+            # --- Ship-ship collisions ---
+            live = live & (lives > 0)
+            alive_ids = np.flatnonzero(live)
+            for a_idx, i in enumerate(alive_ids):
+                for j in alive_ids[a_idx + 1:]:
+                    if respawn[i] != 0.0 or respawn[j] != 0.0:
+                        continue
+                    d = pos[i] - pos[j]
+                    reach = 2 * SHIP_RADIUS
+                    if abs(d[0]) <= reach and abs(d[1]) <= reach and d @ d <= reach * reach:
+                        self._destruct(i, lives, deaths, respawn, speed, vel)
+                        self._destruct(j, lives, deaths, respawn, speed, vel)
+            live = live & (lives > 0)
+
+            # --- Stop conditions ---
+            sim_time += dt
+            step += 1
+            if not len(ast_size):
+                stop_reason = StopReason.no_asteroids
+            elif not live.any() and not len(b_pos):
+                stop_reason = StopReason.no_ships
+            elif (not bullets_remaining[live].sum() > 0 and not len(b_pos)
+                  and scenario.stop_if_no_ammo):
+                stop_reason = StopReason.out_of_bullets
+            elif sim_time > time_limit:
+                stop_reason = StopReason.time_expired
+
+        score = Score(scenario)
+        for team in score.teams:
+            mine = [i for i in range(n_ships) if ship_teams[i] == team.team_id]
+            team.asteroids_hit = int(asteroids_hit[mine].sum())
+            team.bullets_hit = int(bullets_hit[mine].sum())
+            team.shots_fired = int(shots[mine].sum())
+            team.bullets_remaining = int(bullets_remaining[mine].sum())
+            team.deaths = int(deaths[mine].sum())
+            team.lives_remaining = int(lives[mine].sum())
+        score.sim_time = sim_time
+        score.stop_reason = stop_reason
+        score.final_controllers = list(controllers)
+        return score, perf_list
+
+    @staticmethod
+    def _destruct(i, lives, deaths, respawn, speed, vel) -> None:
+        # Lose a life and respawn in place, invulnerable
+        lives[i] -= 1
+        deaths[i] += 1
+        respawn[i] = RESPAWN_TIME
+        speed[i] = 0.0
+        vel[i] = 0.0
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# The controller whose fitness is cached; its sources are part of every key.
+CONTROLLER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "TeamTempNameSubmission")
+
+
+def source_fingerprint(directory: str = CONTROLLER_DIR) -> str:
+    """
+    SHA-1 over the names and contents of every .py file under `directory`.
+
+    Args:
+        directory (str): Package whose behaviour the fitness depends on.
+
+    Returns:
+        str: Hex digest that changes with any edit to those sources.
+    """
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(f for f in files if f.endswith(".py")):
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, directory).encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class FitnessCache:
+    """
+    On-disk fitness memo shared by GA runs and pool workers.
+
+    Entries are keyed by a SHA-1 over the chromosome's float64 bytes, the
+    scenario names, the simulator settings and a fingerprint of the
+    controller sources, so a cached value is only reused when the exact
+    same individual was scored by the exact same controller under the exact
+    same evaluation. The store is a single SQLite file in WAL mode: it survives
+    restarts, and any process may read or write it concurrently. Each
+    process opens its own connection on first use, so instances can be
+    pickled into `multiprocessing` workers.
+
+    Args:
+        path (str): SQLite file to use (created if missing).
+        scenario_names (Sequence[str]): Scenarios the fitness is summed over.
+        settings (Dict[str, Any]): Simulator settings that affect the score.
+        controller_version (Optional[str]): Identifies the controller code;
+            defaults to `source_fingerprint()` of TeamTempNameSubmission.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        scenario_names: Sequence[str],
+        settings: Dict[str, Any],
+        controller_version: Optional[str] = None,
+    ):
+        self.path = path
+        if controller_version is None:
+            controller_version = source_fingerprint()
+        self.controller_version = controller_version
+        context = json.dumps(
+            {"scenarios": list(scenario_names), "settings": settings,
+             "controller": controller_version},
+            sort_keys=True,
+            default=str,
+        )
+        self._context = context.encode()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        return state
+
+    def key(self, chromosome: np.ndarray) -> str:
+        """
+        Cache key of one chromosome under this cache's evaluation context.
+
+        Args:
+            chromosome (np.ndarray): The genes.
+
+        Returns:
+            str: Hex digest identifying (chromosome, scenarios, settings).
+        """
+        digest = hashlib.sha1(self._context)
+        digest.update(np.ascontiguousarray(chromosome, dtype="<f8").tobytes())
+        return digest.hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, float]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys (Iterable[str]): Keys from `key()`.
+
+        Returns:
+            Dict[str, float]: Fitness of every key that is cached.
+        """
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, float] = {}
+        conn = self._connection()
+        # Stay under SQLite's bound-parameter limit.
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, fitness FROM fitness WHERE key IN ({marks})", chunk
+            ).fetchall()
+            found.update(rows)
+        self.hits += len(found)
+        self.misses += len(unique) - len(found)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, float]]) -> None:
+        """
+        Store several (key, fitness) pairs in one transaction.
+
+        Args:
+            items (Iterable[Tuple[str, float]]): Keys from `key()` and their fitness.
+        """
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO fitness (key, fitness) VALUES (?, ?)",
+                [(k, float(f)) for k, f in items],
+            )
+
+    def get(self, chromosome: np.ndarray) -> Optional[float]:
+        """Cached fitness of one chromosome, or None."""
+        key = self.key(chromosome)
+        return self.get_many([key]).get(key)
+
+    def put(self, chromosome: np.ndarray, fitness: float) -> None:
+        """Store the fitness of one chromosome."""
+        self.put_many([(self.key(chromosome), fitness)])
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM fitness").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not cross a fork, so reopen in each new process.
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=30.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fitness (key TEXT PRIMARY KEY, fitness REAL NOT NULL)"
+            )
+            self._conn.commit()
+            self._pid = os.getpid()
+        return self._conn
+
+
+def dedupe(keys: List[str]) -> Dict[str, int]:
+    """
+    First index of every distinct key, in order of appearance.
+
+    Args:
+        keys (List[str]): One key per individual.
+
+    Returns:
+        Dict[str, int]: Distinct key -> index of its first individual.
+    """
+    first: Dict[str, int] = {}
+    for i, k in enumerate(keys):
+        first.setdefault(k, i)
+    return first
@@ -0,0 +1,93 @@
+import numpy as np
+
+
+def tournament_indices(fitnesses: np.ndarray, n: int, k: int) -> np.ndarray:
+    """
+    Run `n` tournaments of size `k` (entrants drawn with replacement) at once.
+
+    Ties go to the first entrant drawn, as in the per-individual
+    `tournament_selection`.
+
+    Args:
+        fitnesses (np.ndarray): (P,) fitness of each individual.
+        n (int): Number of parents to select.
+        k (int): Tournament size.
+
+    Returns:
+        np.ndarray: (n,) indices of the winners.
+    """
+    entrants = np.random.randint(0, len(fitnesses), size=(n, k))
+    return entrants[np.arange(n), np.argmax(fitnesses[entrants], axis=1)]
+
+
+def one_point_crossover(parents1: np.ndarray, parents2: np.ndarray, rate: float):
+    """
+    Pairwise one-point crossover of two (n, G) parent arrays.
+
+    Each pair is crossed with probability `rate` at a cut point in
+    [1, G - 1]; uncrossed pairs are copied unchanged.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The two (n, G) child arrays.
+    """
+    n, genes = parents1.shape
+    crossed = np.random.rand(n) < rate
+    cut = np.random.randint(1, genes, size=n)
+    head = (np.arange(genes)[None, :] < cut[:, None]) | ~crossed[:, None]
+    return np.where(head, parents1, parents2), np.where(head, parents2, parents1)
+
+
+def mutate_population(population: np.ndarray, rate: float, distance: float) -> np.ndarray:
+    """
+    Per-gene mutation of a whole (n, G) array, as `mutate` does per row.
+
+    Each gene mutates with probability `rate` by a uniform shift of at most
+    `distance` that keeps it within [0, 1].
+    """
+    mask = np.random.rand(*population.shape) < rate
+    low = np.maximum(-distance, -population)
+    high = np.minimum(distance, 1.0 - population)
+    noise = low + np.random.rand(*population.shape) * (high - low)
+    return np.where(mask, population + noise, population)
+
+
+def breed_population(
+    population: np.ndarray,
+    fitnesses: np.ndarray,
+    mutation_rate: float,
+    crossover_rate: float,
+    distance: float,
+    k: int,
+    elites: int = 1,
+) -> np.ndarray:
+    """
+    Next generation of a (P, G) population in a handful of array operations.
+
+    The `elites` fittest rows are carried over unchanged (ties to the lower
+    index, so the single elite is the one `fitnesses.index(max(...))`
+    picks); the rest are children of tournament-selected parent pairs,
+    crossed over and then mutated.
+
+    Args:
+        population (np.ndarray): (P, G) genes.
+        fitnesses (np.ndarray): (P,) fitness of each row.
+        mutation_rate (float): Per-gene mutation probability.
+        crossover_rate (float): Per-pair crossover probability.
+        distance (float): Maximum mutation shift.
+        k (int): Tournament size.
+        elites (int): Rows carried over unchanged.
+
+    Returns:
+        np.ndarray: (P, G) next generation, elites first.
+    """
+    size = len(population)
+    elite_rows = population[np.argsort(-fitnesses, kind="stable")[:elites]]
+    n_children = size - len(elite_rows)
+    n_pairs = (n_children + 1) // 2
+
+    parents = tournament_indices(fitnesses, 2 * n_pairs, k)
+    child1, child2 = one_point_crossover(
+        population[parents[0::2]], population[parents[1::2]], crossover_rate)
+    # Interleave siblings, as the per-individual loop appends them
+    children = np.stack((child1, child2), axis=1).reshape(-1, population.shape[1])[:n_children]
+    return np.concatenate((elite_rows, mutate_population(children, mutation_rate, distance)))
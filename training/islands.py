@@ -0,0 +1,140 @@
+import os
+import tempfile
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _save_atomic(path: str, **arrays: np.ndarray) -> None:
+    # Write next to the target and rename, so readers never see a partial file.
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".npz", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load(path: str) -> Optional[dict]:
+    try:
+        with np.load(path) as data:
+            return {k: data[k] for k in data.files}
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+
+
+def emigrant_path(directory: str, run_id: str, island: int) -> str:
+    """File through which `island` of run `run_id` publishes its latest emigrants."""
+    return os.path.join(directory, f"emigrants_{run_id}_{island}.npz")
+
+
+def best_path(directory: str, run_id: str, island: int) -> str:
+    """File holding `island`'s best-ever individual and fitness history in run `run_id`."""
+    return os.path.join(directory, f"best_{run_id}_{island}.npz")
+
+
+def new_run_id() -> str:
+    """A fresh run ID (start time plus a random suffix) for naming migration files."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.urandom(3).hex()}"
+
+
+def clear_island(directory: str, run_id: str, island: int) -> None:
+    """Delete files an earlier attempt of `island` left under the same run ID."""
+    for path in (emigrant_path(directory, run_id, island), best_path(directory, run_id, island)):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def ring_source(island: int, n_islands: int) -> int:
+    """Island whose emigrants `island` receives on a unidirectional ring."""
+    return (island - 1) % n_islands
+
+
+def write_emigrants(
+    directory: str,
+    run_id: str,
+    island: int,
+    generation: int,
+    chromosomes: Sequence[np.ndarray],
+    fitnesses: Sequence[float],
+) -> None:
+    """
+    Publish an island's emigrants, replacing its previous batch.
+
+    Args:
+        directory (str): Migration directory shared by all islands (may be on
+            a network filesystem for multi-machine runs).
+        run_id (str): ID of the run, shared by all its islands; files of
+            other runs in the same directory are never read.
+        island (int): Sending island.
+        generation (int): Generation the emigrants come from.
+        chromosomes (Sequence[np.ndarray]): The emigrants.
+        fitnesses (Sequence[float]): Their fitness on the sending island.
+    """
+    _save_atomic(
+        emigrant_path(directory, run_id, island),
+        generation=np.array(generation),
+        chromosomes=np.asarray(chromosomes, dtype=float),
+        fitnesses=np.asarray(fitnesses, dtype=float),
+    )
+
+
+def read_immigrants(
+    directory: str, run_id: str, source: int, after_generation: int
+) -> Optional[Tuple[int, List[np.ndarray], List[float]]]:
+    """
+    Fetch `source`'s latest emigrants if they are newer than `after_generation`.
+
+    Never blocks: islands run at their own pace, and a batch that has not
+    been published yet is simply picked up at a later migration.
+
+    Args:
+        directory (str): Migration directory.
+        run_id (str): ID of the run.
+        source (int): Island to receive from.
+        after_generation (int): Generation of the last batch already taken.
+
+    Returns:
+        Optional[Tuple[int, List[np.ndarray], List[float]]]: The batch's
+            generation, chromosomes and fitnesses, or None if there is
+            nothing new.
+    """
+    data = _load(emigrant_path(directory, run_id, source))
+    if data is None or int(data["generation"]) <= after_generation:
+        return None
+    return (
+        int(data["generation"]),
+        [c.copy() for c in data["chromosomes"]],
+        [float(f) for f in data["fitnesses"]],
+    )
+
+
+def write_best(
+    directory: str,
+    run_id: str,
+    island: int,
+    chromosome: np.ndarray,
+    fitness: float,
+    tracker: Sequence[float],
+) -> None:
+    """Record an island's best-ever individual and its best-fitness history."""
+    _save_atomic(
+        best_path(directory, run_id, island),
+        chromosome=np.asarray(chromosome, dtype=float),
+        fitness=np.array(fitness),
+        tracker=np.asarray(tracker, dtype=float),
+    )
+
+
+def read_best(
+    directory: str, run_id: str, island: int
+) -> Optional[Tuple[np.ndarray, float, List[float]]]:
+    """An island's best-ever individual, its fitness and history in run `run_id`, or None."""
+    data = _load(best_path(directory, run_id, island))
+    if data is None:
+        return None
+    return data["chromosome"], float(data["fitness"]), data["tracker"].tolist()
@@ -9,7 +9,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from TeamTempNameSubmission.fuzzy_controller import FuzzyController
 from scenarios import scenarios
-from utils import LoggerUtility, LoggingLevel
+from utils import LoggerUtility, LoggingLevel, report_latency
 
 # Set up the logger
 logger = LoggerUtility(LoggingLevel.DEBUG).get_logger()
@@ -54,6 +54,20 @@ if __name__ == "__main__":
         help="The type of game to run. KesslerGame for visualization, TrainerEnvironment for max-speed, no-graphics simulation.",
     )
 
+    parser.add_argument(
+        "--budget_ms",
+        type=float,
+        default=1000.0 / game_settings["frequency"],
+        help="Per-frame controller budget in milliseconds for the latency report.",
+    )
+
+    parser.add_argument(
+        "--perf_json",
+        type=str,
+        default=None,
+        help="Write the controller latency percentiles as JSON to this path.",
+    )
+
     args = parser.parse_args()
 
     selected_scenario: Scenario = scenarios[args.scenario]
@@ -82,3 +96,8 @@ if __name__ == "__main__":
     print("Accuracy: ", str([team.accuracy for team in score.teams]))
     print("Mean eval time: ", str([team.mean_eval_time for team in score.teams]))
 
+    report_latency(
+        {selected_scenario.name: perf_data},
+        budget=args.budget_ms / 1000.0,
+        json_path=args.perf_json,
+    )
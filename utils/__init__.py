@@ -1,4 +1,8 @@
 from .logger import LoggerUtility, LoggingLevel
+from .stage_timer import StageTimer
 
 from .kessler_helpers import get_bullet_speed
-from .types import ActionsReturn, GameState, ShipOwnState
\ No newline at end of file
+from .frame_log import FrameLog, FrameRecorder, RecordingController, replay
+from .types import ActionsReturn, GameState, ShipOwnState
+from .synthetic_states import advance_state, make_stress_state
+from .perf_report import report_latency
\ No newline at end of file
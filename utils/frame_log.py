@@ -0,0 +1,373 @@
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from kesslergame import KesslerController
+
+# File layout: MAGIC, little-endian uint64 header length, JSON header, then
+# each section's raw records starting on a SECTION_ALIGN boundary. Section
+# offsets in the header are relative to the first aligned byte after it.
+MAGIC = b"KSLFRM01"
+SECTION_ALIGN = 64
+
+# One fixed-width record per frame: game scalars, the ship's own state and
+# the actions the controller returned.
+FRAME_DTYPE = np.dtype(
+    [
+        ("time", "<f8"),
+        ("delta_time", "<f8"),
+        ("sim_frame", "<i8"),
+        ("time_limit", "<f8"),
+        ("is_respawning", "?"),
+        ("position", "<f8", (2,)),
+        ("velocity", "<f8", (2,)),
+        ("speed", "<f8"),
+        ("heading", "<f8"),
+        ("mass", "<f8"),
+        ("radius", "<f8"),
+        ("id", "<i4"),
+        ("lives_remaining", "<i4"),
+        ("bullets_remaining", "<i4"),
+        ("mines_remaining", "<i4"),
+        ("can_fire", "?"),
+        ("fire_rate", "<f8"),
+        ("can_deploy_mine", "?"),
+        ("mine_deploy_rate", "<f8"),
+        ("thrust_range", "<f8", (2,)),
+        ("turn_rate_range", "<f8", (2,)),
+        ("max_speed", "<f8"),
+        ("drag", "<f8"),
+        ("thrust", "<f8"),
+        ("turn_rate", "<f8"),
+        ("fire", "?"),
+        ("drop_mine", "?"),
+    ]
+)
+
+# Ragged per-object records; frame i owns rows offsets[i]:offsets[i + 1].
+OBJECT_DTYPES = {
+    "asteroids": np.dtype(
+        [
+            ("position", "<f8", (2,)),
+            ("velocity", "<f8", (2,)),
+            ("size", "<i4"),
+            ("mass", "<f8"),
+            ("radius", "<f8"),
+        ]
+    ),
+    "bullets": np.dtype(
+        [
+            ("position", "<f8", (2,)),
+            ("velocity", "<f8", (2,)),
+            ("heading", "<f8"),
+            ("mass", "<f8"),
+        ]
+    ),
+    "mines": np.dtype(
+        [
+            ("position", "<f8", (2,)),
+            ("mass", "<f8"),
+            ("fuse_time", "<f8"),
+            ("remaining_time", "<f8"),
+        ]
+    ),
+    "ships": np.dtype(
+        [
+            ("is_respawning", "?"),
+            ("position", "<f8", (2,)),
+            ("velocity", "<f8", (2,)),
+            ("speed", "<f8"),
+            ("heading", "<f8"),
+            ("mass", "<f8"),
+            ("radius", "<f8"),
+            ("id", "<i4"),
+            ("lives_remaining", "<i4"),
+        ]
+    ),
+}
+
+# Fields whose on-disk scalars are handed back as tuples, like the game does.
+_TUPLE_FIELDS = ("position", "velocity", "thrust_range", "turn_rate_range")
+_ACTION_FIELDS = ("thrust", "turn_rate", "fire", "drop_mine")
+_SHIP_FIELDS = tuple(
+    name for name in FRAME_DTYPE.names[4:] if name not in _ACTION_FIELDS
+)
+
+
+def _align(n: int) -> int:
+    return -(-n // SECTION_ALIGN) * SECTION_ALIGN
+
+
+def _untuple(descr: Any) -> Any:
+    # JSON turns the (name, format[, shape]) tuples of a dtype descr into lists.
+    if not isinstance(descr, list):
+        return descr
+    return [
+        (field[0], field[1]) if len(field) == 2 else (field[0], field[1], tuple(field[2]))
+        for field in descr
+    ]
+
+
+def _record(dtype: np.dtype, state: Dict[str, Any]) -> tuple:
+    return tuple(state[name] for name in dtype.names)
+
+
+class FrameRecorder:
+    """
+    Accumulate `actions()` inputs and outputs and write them as one frame log.
+
+    Frames are buffered in memory as plain tuples and converted to structured
+    arrays once on `save()`, so recording adds almost nothing to the frame.
+    Values are stored as float64 so a replay sees bit-identical inputs.
+
+    Args:
+        map_size (`Optional[Tuple[float, float]]`): Map size; taken from the
+            first recorded frame when omitted.
+    """
+
+    def __init__(self, map_size: Optional[Tuple[float, float]] = None):
+        self.map_size = map_size
+        self.teams: Dict[int, str] = {}
+        self._frames: List[tuple] = []
+        self._objects: Dict[str, List[tuple]] = {k: [] for k in OBJECT_DTYPES}
+        self._counts: Dict[str, List[int]] = {k: [] for k in OBJECT_DTYPES}
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def add(
+        self,
+        ship_state: Dict[str, Any],
+        game_state: Dict[str, Any],
+        actions: Tuple[float, float, bool, bool],
+    ) -> None:
+        """
+        Record one controller call.
+
+        Args:
+            ship_state (`Dict[str, Any]`): The ship's own state passed to `actions()`.
+            game_state (`Dict[str, Any]`): The game state passed to `actions()`.
+            actions (`Tuple[float, float, bool, bool]`): What `actions()` returned.
+        """
+        if self.map_size is None:
+            self.map_size = tuple(game_state["map_size"])
+        self.teams[int(ship_state["id"])] = str(ship_state["team"])
+
+        row = dict(ship_state)
+        row.update(
+            time=game_state["time"],
+            delta_time=game_state["delta_time"],
+            sim_frame=game_state["sim_frame"],
+            time_limit=game_state["time_limit"],
+        )
+        row.update(zip(_ACTION_FIELDS, actions))
+        self._frames.append(_record(FRAME_DTYPE, row))
+
+        for kind, dtype in OBJECT_DTYPES.items():
+            states = game_state[kind]
+            self._objects[kind].extend(_record(dtype, s) for s in states)
+            self._counts[kind].append(len(states))
+        for ship in game_state["ships"]:
+            self.teams[int(ship["id"])] = str(ship["team"])
+
+    def save(self, path: str, **extra) -> None:
+        """
+        Write the recorded frames to `path`.
+
+        Args:
+            path (`str`): Output file.
+            **extra: Additional header fields (e.g. the scenario name).
+        """
+        sections: Dict[str, np.ndarray] = {
+            "frames": np.array(self._frames, dtype=FRAME_DTYPE)
+        }
+        for kind, dtype in OBJECT_DTYPES.items():
+            sections[kind] = np.array(self._objects[kind], dtype=dtype)
+            offsets = np.zeros(len(self._frames) + 1, dtype="<i8")
+            np.cumsum(self._counts[kind], out=offsets[1:])
+            sections[kind + "_offsets"] = offsets
+
+        layout: Dict[str, Any] = {}
+        cursor = 0
+        for name, arr in sections.items():
+            cursor = _align(cursor)
+            layout[name] = {"dtype": np.lib.format.dtype_to_descr(arr.dtype), "offset": cursor, "count": len(arr)}
+            cursor += arr.nbytes
+        blob = json.dumps(
+            {
+                **extra,
+                "map_size": list(self.map_size or (0.0, 0.0)),
+                "teams": {str(k): v for k, v in self.teams.items()},
+                "sections": layout,
+            }
+        ).encode()
+        data_start = _align(len(MAGIC) + 8 + len(blob))
+
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(np.array(len(blob), dtype="<u8").tobytes())
+            f.write(blob)
+            for name, arr in sections.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(arr.tobytes())
+
+
+class RecordingController(KesslerController):
+    """
+    Wrap a controller and record every frame it sees into a `FrameRecorder`.
+
+    Args:
+        controller (`KesslerController`): The controller that actually plays.
+        recorder (`Optional[FrameRecorder]`): Where frames go; a new one by default.
+    """
+
+    def __init__(self, controller: KesslerController, recorder: Optional[FrameRecorder] = None):
+        super().__init__()
+        self.controller = controller
+        self.recorder = recorder if recorder is not None else FrameRecorder()
+
+    def actions(self, ship_state: Dict[str, Any], game_state: Dict[str, Any]) -> Tuple[float, float, bool, bool]:
+        result = self.controller.actions(ship_state, game_state)
+        self.recorder.add(ship_state, game_state, result)
+        return result
+
+    @property
+    def ship_id(self) -> int:
+        return self.controller.ship_id
+
+    @ship_id.setter
+    def ship_id(self, value: int) -> None:
+        self.controller.ship_id = value
+
+    @property
+    def name(self) -> str:
+        return self.controller.name
+
+
+class FrameLog:
+    """
+    Read-only view of a recorded frame log backed by `np.memmap`.
+
+    Every section is a memory-mapped structured array, so opening a log is
+    O(1) and column scans (e.g. all asteroid radii) touch only the pages
+    they need. `frame(i)` rebuilds the `(ship_state, game_state)` dicts that
+    `actions()` received for frame i.
+
+    Args:
+        path (`str`): File written by `FrameRecorder.save()`.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a frame log")
+            size = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+            self.header: Dict[str, Any] = json.loads(f.read(size))
+        data_start = _align(len(MAGIC) + 8 + size)
+
+        self.map_size = tuple(self.header["map_size"])
+        self.teams = {int(k): v for k, v in self.header["teams"].items()}
+        self.sections: Dict[str, np.ndarray] = {}
+        for name, info in self.header["sections"].items():
+            dtype = np.lib.format.descr_to_dtype(_untuple(info["dtype"]))
+            if info["count"] == 0:
+                self.sections[name] = np.empty(0, dtype=dtype)
+            else:
+                self.sections[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=data_start + info["offset"], shape=(info["count"],)
+                )
+        self.frames = self.sections["frames"]
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def objects(self, kind: str, i: int) -> np.ndarray:
+        """
+        Structured records of one object kind in frame `i`.
+
+        Args:
+            kind (`str`): "asteroids", "bullets", "mines" or "ships".
+            i (`int`): Frame index.
+
+        Returns:
+            `np.ndarray`: The frame's slice of that section.
+        """
+        offsets = self.sections[kind + "_offsets"]
+        return self.sections[kind][offsets[i]:offsets[i + 1]]
+
+    def actions(self, i: int) -> Tuple[float, float, bool, bool]:
+        """The `(thrust, turn_rate, fire, drop_mine)` recorded for frame `i`."""
+        row = self.frames[i]
+        return float(row["thrust"]), float(row["turn_rate"]), bool(row["fire"]), bool(row["drop_mine"])
+
+    def frame(self, i: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Rebuild the `actions()` arguments of frame `i`.
+
+        Args:
+            i (`int`): Frame index.
+
+        Returns:
+            `Tuple[Dict[str, Any], Dict[str, Any]]`: `(ship_state, game_state)`.
+        """
+        row = self.frames[i]
+        ship_state = self._to_dict(row, _SHIP_FIELDS)
+        ship_state["team"] = self.teams.get(ship_state["id"], "")
+
+        game_state: Dict[str, Any] = {
+            kind: [self._to_dict(r, dtype.names) for r in self.objects(kind, i)]
+            for kind, dtype in OBJECT_DTYPES.items()
+        }
+        for ship in game_state["ships"]:
+            ship["team"] = self.teams.get(ship["id"], "")
+        game_state.update(
+            map_size=self.map_size,
+            time=float(row["time"]),
+            delta_time=float(row["delta_time"]),
+            sim_frame=int(row["sim_frame"]),
+            time_limit=float(row["time_limit"]),
+        )
+        return ship_state, game_state
+
+    @staticmethod
+    def _to_dict(record: np.void, names: Tuple[str, ...]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for name in names:
+            value = record[name]
+            out[name] = tuple(value.tolist()) if name in _TUPLE_FIELDS else value.item()
+        return out
+
+
+def replay(controller: KesslerController, log: FrameLog) -> Dict[str, Any]:
+    """
+    Feed a recorded game back through `controller.actions()`, frame by frame.
+
+    Only the `actions()` call is timed; rebuilding each frame's dicts from the
+    log happens outside the measured span. Because the inputs are identical
+    on every run, differences between replays are down to the controller
+    alone.
+
+    Args:
+        controller (`KesslerController`): A fresh controller to drive.
+        log (`FrameLog`): The recorded game.
+
+    Returns:
+        `Dict[str, Any]`: `latency_ns` (`np.ndarray`, one entry per frame),
+                          `actions` (list of returned tuples) and `mismatches`
+                          (frames whose actions differ from the recording).
+    """
+    clock = time.perf_counter_ns
+    latency = np.empty(len(log), dtype=np.int64)
+    actions = []
+    mismatches = 0
+    for i in range(len(log)):
+        ship_state, game_state = log.frame(i)
+        start = clock()
+        result = controller.actions(ship_state, game_state)
+        latency[i] = clock() - start
+        result = (float(result[0]), float(result[1]), bool(result[2]), bool(result[3]))
+        actions.append(result)
+        if result != log.actions(i):
+            mismatches += 1
+    return {"latency_ns": latency, "actions": actions, "mismatches": mismatches}
@@ -0,0 +1,117 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+PERCENTILES = (50, 90, 99)
+
+
+def controller_times(perf_data: List[Dict[str, Any]], ship_index: int = 0) -> np.ndarray:
+    """
+    Extract one controller's per-frame evaluation times from kesslergame's `perf_data`.
+
+    Frames in which the ship was dead are recorded by the game as exactly
+    0.0 and are dropped.
+
+    Args:
+        perf_data (`List[Dict[str, Any]]`): The second value returned by `game.run`
+            with `perf_tracker` enabled.
+        ship_index (`int`): Which controller's times to extract.
+
+    Returns:
+        `np.ndarray`: Evaluation time per frame in seconds.
+    """
+    times = np.fromiter(
+        (frame["controller_times"][ship_index] for frame in perf_data),
+        dtype=float,
+        count=len(perf_data),
+    )
+    return times[times > 0.0]
+
+
+def latency_summary(times: np.ndarray, budget: float) -> Dict[str, float]:
+    """
+    Tail-latency statistics of per-frame controller times.
+
+    Args:
+        times (`np.ndarray`): Evaluation time per frame in seconds.
+        budget (`float`): Per-frame budget in seconds.
+
+    Returns:
+        `Dict[str, float]`: Frame count, mean, p50/p90/p99 and max in
+                            milliseconds, and the number and fraction of
+                            frames over `budget`.
+    """
+    if len(times) == 0:
+        return {"frames": 0}
+    ms = times * 1e3
+    over = int(np.count_nonzero(times > budget))
+    summary: Dict[str, float] = {"frames": int(len(times)), "mean_ms": float(ms.mean())}
+    for p, value in zip(PERCENTILES, np.percentile(ms, PERCENTILES)):
+        summary[f"p{p}_ms"] = float(value)
+    summary.update(
+        max_ms=float(ms.max()),
+        budget_ms=budget * 1e3,
+        over_budget=over,
+        over_budget_frac=over / len(times),
+    )
+    return summary
+
+
+def format_table(summaries: Dict[str, Dict[str, float]], budget: float) -> str:
+    """
+    Render per-scenario summaries as a fixed-width text table.
+
+    Args:
+        summaries (`Dict[str, Dict[str, float]]`): `latency_summary` output keyed by scenario.
+        budget (`float`): The per-frame budget the summaries used, in seconds.
+
+    Returns:
+        `str`: The table, one row per scenario.
+    """
+    columns = ["mean_ms"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+    lines = [
+        f"{'scenario':<20} {'frames':>7} "
+        + " ".join(f"{c[:-3]:>8}" for c in columns)
+        + f" {'over budget':>14}"
+    ]
+    for name, s in summaries.items():
+        if s.get("frames", 0) == 0:
+            lines.append(f"{name:<20} {0:>7}")
+            continue
+        lines.append(
+            f"{name:<20} {s['frames']:>7} "
+            + " ".join(f"{s[c]:>8.3f}" for c in columns)
+            + f" {s['over_budget']:>6} ({s['over_budget_frac']:>5.1%})"
+        )
+    lines.append(f"(milliseconds; budget {budget * 1e3:.1f} ms)")
+    return "\n".join(lines)
+
+
+def report_latency(
+    perf_by_scenario: Dict[str, List[Dict[str, Any]]],
+    budget: float,
+    json_path: Optional[str] = None,
+    ship_index: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize, print and optionally save controller latency for several scenarios.
+
+    Args:
+        perf_by_scenario (`Dict[str, List[Dict[str, Any]]]`): `perf_data` keyed by scenario name.
+        budget (`float`): Per-frame budget in seconds.
+        json_path (`Optional[str]`): Where to write the summaries as JSON, if given.
+        ship_index (`int`): Which controller to report on.
+
+    Returns:
+        `Dict[str, Dict[str, float]]`: `latency_summary` output keyed by scenario.
+    """
+    summaries = {
+        name: latency_summary(controller_times(perf, ship_index), budget)
+        for name, perf in perf_by_scenario.items()
+    }
+    print(format_table(summaries, budget))
+    if json_path is not None:
+        with open(json_path, "w") as f:
+            json.dump(summaries, f, indent=2)
+    return summaries
@@ -0,0 +1,115 @@
+import json
+import time
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional
+
+
+class StageTimer:
+    """
+    Lightweight per-stage frame timer with fixed-bucket histograms.
+
+    Call `start()` at the top of a frame, `lap(stage)` at the end of each
+    stage (time since the previous lap is charged to that stage, and a stage
+    may be lapped several times per frame) and `end_frame()` before
+    returning. Each stage's per-frame total then lands in one of a fixed set
+    of latency buckets, so memory stays constant however long the game runs.
+
+    Args:
+        stages (`Iterable[str]`): Stage names, in pipeline order.
+    """
+
+    # Upper bucket edges in nanoseconds (1 us ... 100 ms); the last bucket is open.
+    BUCKET_EDGES_NS = (
+        1_000, 2_000, 5_000,
+        10_000, 20_000, 50_000,
+        100_000, 200_000, 500_000,
+        1_000_000, 2_000_000, 5_000_000,
+        10_000_000, 20_000_000, 50_000_000,
+        100_000_000,
+    )
+
+    def __init__(self, stages: Iterable[str]):
+        self.stages: List[str] = list(stages) + ["frame"]
+        n_buckets = len(self.BUCKET_EDGES_NS) + 1
+        self.buckets: Dict[str, List[int]] = {s: [0] * n_buckets for s in self.stages}
+        self.total_ns: Dict[str, int] = dict.fromkeys(self.stages, 0)
+        self.max_ns: Dict[str, int] = dict.fromkeys(self.stages, 0)
+        self.frames = 0
+
+        self._frame: Dict[str, int] = dict.fromkeys(self.stages, 0)
+        self._clock = time.perf_counter_ns
+        self._start = 0
+        self._last = 0
+
+    def start(self) -> None:
+        """Mark the start of a frame."""
+        frame = self._frame
+        for s in frame:
+            frame[s] = 0
+        self._start = self._last = self._clock()
+
+    def lap(self, stage: str) -> None:
+        """
+        Charge the time since the previous lap (or `start`) to `stage`.
+
+        Args:
+            stage (`str`): One of the stage names given at construction.
+        """
+        now = self._clock()
+        self._frame[stage] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """Fold this frame's stage times into the histograms."""
+        frame = self._frame
+        frame["frame"] = self._last - self._start
+        edges = self.BUCKET_EDGES_NS
+        for s, ns in frame.items():
+            if ns == 0 and s != "frame":
+                continue
+            self.buckets[s][bisect_right(edges, ns)] += 1
+            self.total_ns[s] += ns
+            if ns > self.max_ns[s]:
+                self.max_ns[s] = ns
+        self.frames += 1
+
+    def summary(self) -> dict:
+        """
+        Aggregate statistics per stage.
+
+        Returns:
+            `dict`: Bucket edges (microseconds) and, per stage, the number of
+                    frames it ran in, total/mean/max time and bucket counts.
+        """
+        stages = {}
+        for s in self.stages:
+            count = sum(self.buckets[s])
+            stages[s] = {
+                "frames": count,
+                "total_ms": self.total_ns[s] / 1e6,
+                "mean_us": self.total_ns[s] / count / 1e3 if count else 0.0,
+                "max_us": self.max_ns[s] / 1e3,
+                "buckets": list(self.buckets[s]),
+            }
+        return {
+            "frames": self.frames,
+            "bucket_edges_us": [e / 1e3 for e in self.BUCKET_EDGES_NS],
+            "stages": stages,
+        }
+
+    def to_json(self, path: Optional[str] = None, **extra) -> str:
+        """
+        Export the summary as JSON, optionally writing it to `path`.
+
+        Args:
+            path (`Optional[str]`): File to write; nothing is written if None.
+            **extra: Additional top-level fields (e.g. the scenario name).
+
+        Returns:
+            `str`: The JSON document.
+        """
+        doc = json.dumps({**extra, **self.summary()}, indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(doc)
+        return doc
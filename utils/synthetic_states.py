@@ -0,0 +1,140 @@
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .types import GameState, ShipOwnState
+
+
+def make_stress_state(
+    n_asteroids: int,
+    map_size: Optional[Tuple[float, float]] = None,
+    density: float = 20.0,
+    speed_range: Tuple[float, float] = (0.0, 180.0),
+    ship_clearance: float = 60.0,
+    seed: Optional[int] = None,
+) -> Tuple[ShipOwnState, GameState]:
+    """
+    Build a synthetic `(ship_state, game_state)` pair with many asteroids.
+
+    Asteroids get uniform positions (kept `ship_clearance` away from the
+    ship), sizes 1-4 with the game's radius and mass formulas, and random
+    headings with speeds drawn from `speed_range`. The ship sits at the map
+    center, idle and able to fire, like a freshly spawned ship.
+
+    Args:
+        n_asteroids (`int`): Number of asteroids, e.g. 10 to 5,000.
+        map_size (`Optional[Tuple[float, float]]`): Map (width, height). When
+            omitted, a 4:3 map is sized so the asteroid count per million
+            square units equals `density`.
+        density (`float`): Asteroids per 1e6 square units, used only when
+            `map_size` is omitted (training1 is about 20).
+        speed_range (`Tuple[float, float]`): Min and max asteroid speed.
+        ship_clearance (`float`): Minimum distance between the ship and any asteroid.
+        seed (`Optional[int]`): Seed for reproducible states.
+
+    Returns:
+        `Tuple[ShipOwnState, GameState]`: Arguments for `actions()` at time 0.
+    """
+    rng = np.random.default_rng(seed)
+    if map_size is None:
+        area = max(n_asteroids, 1) / density * 1e6
+        width = math.sqrt(area * 4.0 / 3.0)
+        map_size = (width, width * 3.0 / 4.0)
+    width, height = float(map_size[0]), float(map_size[1])
+    center = (width / 2.0, height / 2.0)
+
+    pos = rng.uniform((0.0, 0.0), (width, height), size=(n_asteroids, 2))
+    # Push asteroids spawned on top of the ship out to the clearance ring.
+    offset = pos - center
+    dist = np.hypot(offset[:, 0], offset[:, 1])
+    close = dist < ship_clearance
+    if close.any():
+        angle = rng.uniform(0.0, 2.0 * math.pi, size=int(close.sum()))
+        pos[close, 0] = center[0] + ship_clearance * np.cos(angle)
+        pos[close, 1] = center[1] + ship_clearance * np.sin(angle)
+
+    speed = rng.uniform(speed_range[0], speed_range[1], size=n_asteroids)
+    heading = rng.uniform(0.0, 2.0 * math.pi, size=n_asteroids)
+    vel = np.column_stack((speed * np.cos(heading), speed * np.sin(heading)))
+    size = rng.integers(1, 5, size=n_asteroids)
+    radius = size * 8.0
+
+    asteroids = [
+        {
+            "position": (float(p[0]), float(p[1])),
+            "velocity": (float(v[0]), float(v[1])),
+            "size": int(s),
+            "mass": 0.25 * math.pi * float(r) * float(r),
+            "radius": float(r),
+        }
+        for p, v, s, r in zip(pos, vel, size, radius)
+    ]
+
+    ship_state: ShipOwnState = {
+        "is_respawning": False,
+        "position": center,
+        "velocity": (0.0, 0.0),
+        "speed": 0.0,
+        "heading": 90.0,
+        "mass": 300.0,
+        "radius": 20.0,
+        "id": 1,
+        "team": "1",
+        "lives_remaining": 3,
+        "bullets_remaining": -1,
+        "mines_remaining": 0,
+        "can_fire": True,
+        "fire_rate": 10.0,
+        "can_deploy_mine": False,
+        "mine_deploy_rate": 1.0,
+        "thrust_range": (-480.0, 480.0),
+        "turn_rate_range": (-180.0, 180.0),
+        "max_speed": 240.0,
+        "drag": 80.0,
+    }
+    game_state: GameState = {
+        "asteroids": asteroids,
+        "ships": [{k: ship_state[k] for k in (
+            "is_respawning", "position", "velocity", "speed", "heading",
+            "mass", "radius", "id", "team", "lives_remaining",
+        )}],
+        "bullets": [],
+        "mines": [],
+        "map_size": (width, height),
+        "time": 0.0,
+        "delta_time": 1.0 / 30.0,
+        "sim_frame": 0,
+        "time_limit": float("inf"),
+    }
+    return ship_state, game_state
+
+
+def advance_state(game_state: GameState) -> GameState:
+    """
+    Step every asteroid one `delta_time` along its velocity, wrapping at the edges.
+
+    Args:
+        game_state (`GameState`): The current synthetic state.
+
+    Returns:
+        `GameState`: A new state one frame later; the ship is left unchanged.
+    """
+    dt = game_state["delta_time"]
+    width, height = game_state["map_size"]
+    asteroids = [
+        {
+            **a,
+            "position": (
+                (a["position"][0] + a["velocity"][0] * dt) % width,
+                (a["position"][1] + a["velocity"][1] * dt) % height,
+            ),
+        }
+        for a in game_state["asteroids"]
+    ]
+    return {
+        **game_state,
+        "asteroids": asteroids,
+        "time": game_state["time"] + dt,
+        "sim_frame": game_state["sim_frame"] + 1,
+    }